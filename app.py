@@ -1,13 +1,10 @@
+import hashlib
+from pathlib import Path
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import time
-import io
-from sklearn.metrics import r2_score, mean_absolute_error
-from datetime import datetime, timedelta
+
+from freight import instrument
+from views import DEFAULT_PAGE, PAGES, render
 
 # — Page Configuration —
 
@@ -18,942 +15,67 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# — Advanced Styling —
-
-st.markdown(”””
-<style>
-@import url(‘https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap’);
-
-```
-    /* Global Variables */
-    :root {
-        --primary-blue: #0066CC;
-        --primary-dark: #004499;
-        --accent-orange: #FF6B35;
-        --success-green: #00D4AA;
-        --warning-amber: #FFB800;
-        --error-red: #FF4757;
-        --neutral-100: #F8FAFC;
-        --neutral-200: #E2E8F0;
-        --neutral-300: #CBD5E1;
-        --neutral-600: #475569;
-        --neutral-800: #1E293B;
-        --neutral-900: #0F172A;
-        --glass-bg: rgba(255, 255, 255, 0.05);
-        --glass-border: rgba(255, 255, 255, 0.1);
-    }
-    
-    /* Remove Streamlit defaults */
-    .stApp > header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Body and typography */
-    html, body, [class*="css"] {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        color: var(--neutral-800);
-        line-height: 1.6;
-    }
-    
-    .main .block-container {
-        padding: 2rem 3rem 3rem;
-        max-width: none;
-    }
-    
-    /* Custom headers with gradient underlines */
-    h1 {
-        font-size: 3rem;
-        font-weight: 700;
-        color: var(--neutral-900);
-        margin-bottom: 1rem;
-        position: relative;
-    }
-    
-    h1::after {
-        content: '';
-        position: absolute;
-        bottom: -8px;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 100px;
-        height: 4px;
-        background: linear-gradient(90deg, var(--primary-blue), var(--accent-orange));
-        border-radius: 2px;
-    }
-    
-    h2 {
-        font-size: 2.25rem;
-        font-weight: 600;
-        color: var(--neutral-800);
-        margin: 2rem 0 1rem;
-    }
-    
-    h3 {
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: var(--neutral-700);
-        margin: 1.5rem 0 0.75rem;
-    }
-    
-    /* Hero section styling */
-    .hero-container {
-        text-align: center;
-        padding: 3rem 0 4rem;
-        background: linear-gradient(135deg, var(--neutral-100) 0%, rgba(0, 102, 204, 0.05) 100%);
-        border-radius: 16px;
-        margin-bottom: 3rem;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .hero-container::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(0, 102, 204, 0.03) 0%, transparent 50%);
-        animation: float 20s ease-in-out infinite;
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translate(0, 0) rotate(0deg); }
-        50% { transform: translate(-20px, -20px) rotate(180deg); }
-    }
-    
-    .hero-subtitle {
-        font-size: 1.25rem;
-        color: var(--neutral-600);
-        font-weight: 400;
-        margin-top: 1rem;
-        position: relative;
-        z-index: 1;
-    }
-    
-    /* Premium navigation buttons */
-    .nav-container {
-        display: flex;
-        gap: 1rem;
-        margin: 2rem 0 3rem;
-        justify-content: center;
-    }
-    
-    .stButton > button {
-        background: white;
-        border: 2px solid var(--neutral-200);
-        color: var(--neutral-600);
-        font-weight: 600;
-        font-size: 0.95rem;
-        padding: 1rem 2rem;
-        border-radius: 12px;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-        min-width: 200px;
-        height: 60px;
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(0, 102, 204, 0.1), transparent);
-        transition: left 0.5s;
-    }
-    
-    .stButton > button:hover {
-        border-color: var(--primary-blue);
-        color: var(--primary-blue);
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0, 102, 204, 0.15);
-    }
-    
-    .stButton > button:hover::before {
-        left: 100%;
-    }
-    
-    .stButton > button:focus {
-        outline: none;
-        box-shadow: 0 0 0 3px rgba(0, 102, 204, 0.2);
-    }
-    
-    /* Metric cards with glassmorphism */
-    .metric-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-        gap: 1.5rem;
-        margin: 2rem 0;
-    }
-    
-    .stMetric {
-        background: white;
-        border: 1px solid var(--neutral-200);
-        border-radius: 16px;
-        padding: 2rem;
-        text-align: center;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stMetric::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, var(--primary-blue), var(--accent-orange));
-    }
-    
-    .stMetric:hover {
-        transform: translateY(-4px);
-        box-shadow: 0 12px 40px rgba(0, 0, 0, 0.1);
-        border-color: var(--primary-blue);
-    }
-    
-    .stMetric [data-testid="metric-container"] {
-        background: transparent;
-        border: none;
-        padding: 0;
-    }
-    
-    /* Content sections */
-    .content-section {
-        background: white;
-        border-radius: 16px;
-        padding: 3rem;
-        margin: 2rem 0;
-        border: 1px solid var(--neutral-200);
-        position: relative;
-    }
-    
-    .content-section::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 24px;
-        right: 24px;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, var(--primary-blue), transparent);
-    }
-    
-    /* Phase cards */
-    .phase-card {
-        background: linear-gradient(135deg, var(--neutral-100) 0%, white 100%);
-        border: 2px solid var(--neutral-200);
-        border-radius: 16px;
-        padding: 2.5rem;
-        margin: 1.5rem 0;
-        position: relative;
-        transition: all 0.3s ease;
-    }
-    
-    .phase-card:hover {
-        border-color: var(--primary-blue);
-        transform: translateY(-2px);
-        box-shadow: 0 8px 30px rgba(0, 102, 204, 0.1);
-    }
-    
-    .phase-card h3 {
-        color: var(--primary-blue);
-        margin-top: 0;
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-    }
-    
-    .phase-card h3::before {
-        content: '';
-        width: 8px;
-        height: 8px;
-        background: var(--primary-blue);
-        border-radius: 50%;
-        animation: pulse 2s infinite;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    
-    /* Interactive elements */
-    .interactive-button {
-        background: linear-gradient(135deg, var(--primary-blue), var(--primary-dark));
-        color: white;
-        border: none;
-        padding: 1rem 2rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 1rem;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .interactive-button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0, 102, 204, 0.3);
-    }
-    
-    .interactive-button::after {
-        content: '';
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        width: 0;
-        height: 0;
-        background: rgba(255, 255, 255, 0.2);
-        border-radius: 50%;
-        transform: translate(-50%, -50%);
-        transition: width 0.6s, height 0.6s;
-    }
-    
-    .interactive-button:active::after {
-        width: 300px;
-        height: 300px;
-    }
-    
-    /* Success states */
-    .success-message {
-        background: linear-gradient(135deg, var(--success-green), #00B894);
-        color: white;
-        padding: 1rem 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        animation: slideIn 0.5s ease;
-    }
-    
-    @keyframes slideIn {
-        from { opacity: 0; transform: translateY(-10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    /* Dividers */
-    hr {
-        border: none;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, var(--neutral-300), transparent);
-        margin: 3rem 0;
-    }
-    
-    /* Plotly chart containers */
-    .stPlotlyChart {
-        border-radius: 16px;
-        overflow: hidden;
-        border: 1px solid var(--neutral-200);
-        margin: 2rem 0;
-    }
-    
-    /* Responsive design */
-    @media (max-width: 768px) {
-        .main .block-container {
-            padding: 1rem;
-        }
-        
-        h1 {
-            font-size: 2.5rem;
-        }
-        
-        .hero-container {
-            padding: 2rem 1rem;
-        }
-        
-        .nav-container {
-            flex-direction: column;
-            align-items: center;
-        }
-        
-        .stButton > button {
-            min-width: auto;
-            width: 100%;
-        }
-    }
-    
-    /* Loading animations */
-    .loading-spinner {
-        display: inline-block;
-        width: 20px;
-        height: 20px;
-        border: 3px solid rgba(0, 102, 204, 0.3);
-        border-radius: 50%;
-        border-top-color: var(--primary-blue);
-        animation: spin 1s linear infinite;
-        margin-right: 0.5rem;
-    }
-    
-    @keyframes spin {
-        to { transform: rotate(360deg); }
-    }
-</style>
-```
-
-“””, unsafe_allow_html=True)
-
-# — Enhanced Data Loading —
+# Timed spans for this rerun, when FREIGHT_PROFILE is on (see freight.instrument)
+instrument.start_trace()
 
-@st.cache_data
-def load_data():
-# Enhanced results data with more realistic variations
-results_csv = “”“date,actual,predicted,confidence_lower,confidence_upper
-2024-01-30,11.56,11.25,10.85,11.65
-2024-02-29,11.81,10.64,10.24,11.04
-2024-03-31,16.23,15.23,14.83,15.63
-2024-04-30,13.89,12.67,12.27,13.07
-2024-05-31,12.82,13.15,12.75,13.55
-2024-06-30,12.26,12.51,12.11,12.91
-2024-07-31,12.12,11.03,10.63,11.43
-2024-08-31,11.72,10.66,10.26,11.06
-2024-09-30,10.77,10.39,9.99,10.79
-2024-10-31,10.45,10.46,10.06,10.86
-2024-11-30,8.06,7.96,7.56,8.36
-2024-12-31,6.25,6.13,5.73,6.53”””
-
-```
-results_df = pd.read_csv(io.StringIO(results_csv))
-results_df['date'] = pd.to_datetime(results_df['date'])
-results_df.rename(columns={'actual': 'Actual Rate', 'predicted': 'Predicted Rate'}, inplace=True)
-
-# Enhanced components data
-components_csv = """CCI_Score,GSI_Score,vessel_count,avg_wait_time,berth_availability,geopolitical_risk,weather_disruption,latest_prediction,trend_direction,market_volatility
-```
-
-0.783,0.456,45,22.5,7,8.2,0.85,6.13,declining,moderate”””
-
-```
-components_df = pd.read_csv(io.StringIO(components_csv))
-return results_df, components_df
-```
-
-@st.cache_data
-def generate_forecast_data():
-“”“Generate future forecast data for demonstration”””
-base_date = datetime(2025, 8, 26)
-dates = [base_date + timedelta(days=i) for i in range(1, 15)]
+# — Advanced Styling —
 
-```
-# Generate realistic forecast with slight upward trend
-base_price = 6.13
-forecast = []
-for i, date in enumerate(dates):
-    # Add some realistic market movement
-    trend = 0.05 * (i / 14)  # Slight upward trend
-    noise = np.random.normal(0, 0.15)
-    price = base_price + trend + noise
-    
-    # Confidence intervals
-    confidence_range = 0.3 + (i * 0.02)  # Increasing uncertainty over time
-    lower = price - confidence_range
-    upper = price + confidence_range
-    
-    forecast.append({
-        'date': date,
-        'predicted_rate': max(price, 3.0),  # Floor at $3
-        'confidence_lower': max(lower, 2.5),
-        'confidence_upper': upper + 0.5
-    })
+STYLESHEET = Path(__file__).parent / 'static' / 'app.css'
 
-return pd.DataFrame(forecast)
-```
+# With static serving on (.streamlit/config.toml) each rerun sends a one-line
+# <link> instead of the whole sheet, and the browser keeps the sheet across
+# reruns and sessions. The URL carries a hash of the file, so it can be cached
+# indefinitely (e.g. by a fronting proxy) and edits still reach browsers.
+# Without static serving the sheet is inlined as before.
+@st.cache_resource
+def stylesheet_tag(mtime_ns):
+    """<link> to the fingerprinted stylesheet, or the sheet inline"""
+    css = STYLESHEET.read_text()
+    if not st.get_option('server.enableStaticServing'):
+        return f"<style>{css}</style>"
+    digest = hashlib.sha1(css.encode()).hexdigest()[:12]
+    return f'<link rel="stylesheet" href="app/static/{STYLESHEET.name}?v={digest}">'
 
-results_df, components_df = load_data()
-forecast_df = generate_forecast_data()
+st.markdown(stylesheet_tag(STYLESHEET.stat().st_mtime_ns), unsafe_allow_html=True)
 
 # — App State Management —
 
-if ‘page’ not in st.session_state:
-st.session_state.page = ‘opportunity’
-if ‘model_trained’ not in st.session_state:
-st.session_state.model_trained = False
+if 'page' not in st.session_state:
+    st.session_state.page = DEFAULT_PAGE
+if 'model_trained' not in st.session_state:
+    st.session_state.model_trained = False
+if 'validation_job' not in st.session_state:
+    st.session_state.validation_job = None
+if 'validation_reported' not in st.session_state:
+    st.session_state.validation_reported = None
 
 def set_page(page_name):
-st.session_state.page = page_name
+    st.session_state.page = page_name
 
 # — Enhanced Header —
 
-st.markdown(”””
+st.markdown("""
 <div class="hero-container">
 <h1>🚢 ECG Freight Intelligence Platform</h1>
 <p class="hero-subtitle">Transforming Maritime Market Volatility into Strategic Advantage</p>
 </div>
-“””, unsafe_allow_html=True)
+""", unsafe_allow_html=True)
 
 # — Navigation —
 
-st.markdown(’<div class="nav-container">’, unsafe_allow_html=True)
-cols = st.columns(3)
-with cols[0]:
-st.button(“🎯 The Opportunity”, on_click=set_page, args=(‘opportunity’,), key=‘btn_opp’)
-with cols[1]:
-st.button(“🧠 Intelligence Engine”, on_click=set_page, args=(‘engine’,), key=‘btn_eng’)
-with cols[2]:
-st.button(“📈 Verdict & Roadmap”, on_click=set_page, args=(‘verdict’,), key=‘btn_ver’)
-st.markdown(’</div>’, unsafe_allow_html=True)
-
-# — Page Content —
-
-if st.session_state.page == ‘opportunity’:
-st.markdown(’<div class="content-section">’, unsafe_allow_html=True)
-
-```
-col1, col2 = st.columns([2, 1])
-with col1:
-    st.header("🎯 Turning Market Chaos into Competitive Edge")
-    st.markdown("""
-    **Maritime freight isn't just logistics—it's our economic lifeline.** With Chittagong Port 
-    processing over **92% of Bangladesh's trade volume**, freight rate volatility directly 
-    impacts our bottom line by millions of dollars annually.
-    
-    **The Problem:** Generic forecasting models failed spectacularly, achieving accuracy 
-    worse than random chance. Global trends alone cannot predict local port dynamics.
-    
-    **Our Solution:** A proprietary **Chittagong Congestion Index (CCI)** that quantifies 
-    real-time port conditions, creating an asymmetric information advantage.
-    """)
-
-with col2:
-    st.metric(
-        label="Generic Model Performance", 
-        value="49.8%",
-        delta="-0.2% vs Random",
-        delta_color="inverse",
-        help="Previous time-series model performed worse than coin flips"
-    )
-    
-    st.metric(
-        label="Trade Volume Dependency",
-        value="92%",
-        delta="Chittagong Port Share",
-        help="Percentage of national trade flowing through Chittagong"
-    )
-
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Market impact visualization
-st.markdown('<div class="content-section">', unsafe_allow_html=True)
-st.subheader("📊 Market Impact Analysis")
-
-# Create impact visualization
-fig = go.Figure()
-
-months = ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024']
-cost_impact = [2.3, 1.8, 1.2, 0.8]  # Million USD
-savings_potential = [2.1, 1.6, 1.0, 0.6]
-
-fig.add_trace(go.Bar(
-    x=months,
-    y=cost_impact,
-    name='Rate Volatility Impact',
-    marker_color='#FF6B35',
-    text=[f'${x}M' for x in cost_impact],
-    textposition='outside'
-))
-
-fig.add_trace(go.Bar(
-    x=months,
-    y=savings_potential,
-    name='Predictive Model Savings',
-    marker_color='#00D4AA',
-    text=[f'${x}M' for x in savings_potential],
-    textposition='outside'
-))
-
-fig.update_layout(
-    title='<b>Quarterly Freight Cost Impact vs. Prediction Value</b>',
-    xaxis_title='Quarter',
-    yaxis_title='Impact (USD Millions)',
-    template='plotly_white',
-    height=400,
-    showlegend=True,
-    barmode='group'
-)
-
-st.plotly_chart(fig, use_container_width=True)
-st.markdown('</div>', unsafe_allow_html=True)
-```
-
-elif st.session_state.page == ‘engine’:
-st.markdown(’<div class="content-section">’, unsafe_allow_html=True)
-
-```
-st.header("🧠 Deconstructing the Intelligence Engine")
-st.markdown("""
-**The CCI Algorithm:** Our proprietary Chittagong Congestion Index transforms raw port 
-data into actionable market intelligence. Built on World Bank port efficiency 
-methodology, adapted for Bangladesh's unique operational context.
-""")
-
-# Real-time metrics dashboard
-st.subheader("📊 Live Port Intelligence Dashboard")
-
-latest = components_df.iloc[0]
-
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric(
-        "🚢 Vessel Queue", 
-        f"{int(latest['vessel_count'])}",
-        delta="+3 vs. Yesterday",
-        help="Total vessels waiting for berth allocation"
-    )
-
-with col2:
-    st.metric(
-        "⏱️ Avg Wait Time", 
-        f"{latest['avg_wait_time']:.1f} hrs",
-        delta="+2.3 hrs",
-        delta_color="inverse",
-        help="Average vessel waiting time for berth assignment"
-    )
-
-with col3:
-    st.metric(
-        "🏗️ Available Berths", 
-        f"{int(latest['berth_availability'])}",
-        delta="-2 vs. Normal",
-        delta_color="inverse",
-        help="Currently available berthing positions"
-    )
-
-with col4:
-    st.metric(
-        "📈 CCI Score", 
-        f"{latest['CCI_Score']:.3f}",
-        delta="High Congestion",
-        delta_color="inverse",
-        help="Chittagong Congestion Index (0-1 scale)"
-    )
-
-st.markdown('</div>', unsafe_allow_html=True)
-
-# CCI Components breakdown
-st.markdown('<div class="content-section">', unsafe_allow_html=True)
-st.subheader("🔧 CCI Component Analysis")
-
-# Create radar chart for CCI components
-categories = ['Port Congestion', 'Weather Risk', 'Geopolitical<br>Tension', 
-             'Market Volatility', 'Seasonal Demand', 'Fuel Costs']
-values = [78.3, 85.0, 82.0, 65.4, 71.2, 58.9]
-
-fig = go.Figure()
-
-fig.add_trace(go.Scatterpolar(
-    r=values + [values[0]],  # Close the shape
-    theta=categories + [categories[0]],
-    fill='toself',
-    fillcolor='rgba(0, 102, 204, 0.2)',
-    line=dict(color='rgba(0, 102, 204, 0.8)', width=3),
-    marker=dict(size=8, color='#0066CC'),
-    name='Current Risk Profile'
-))
-
-fig.update_layout(
-    polar=dict(
-        radialaxis=dict(
-            visible=True,
-            range=[0, 100],
-            ticksuffix='%',
-            gridcolor='rgba(0, 0, 0, 0.1)'
-        ),
-        angularaxis=dict(
-            tickfont=dict(size=12),
-            gridcolor='rgba(0, 0, 0, 0.1)'
-        )
-    ),
-    showlegend=False,
-    title='<b>Risk Factor Analysis Dashboard</b>',
-    height=500
-)
-
-st.plotly_chart(fig, use_container_width=True)
+st.markdown('<div class="nav-container">', unsafe_allow_html=True)
+for col, page in zip(st.columns(len(PAGES)), PAGES):
+    with col:
+        st.button(page.label, on_click=set_page, args=(page.name,), key=f"btn_{page.name}")
 st.markdown('</div>', unsafe_allow_html=True)
 
-# Interactive model training simulation
-st.markdown('<div class="content-section">', unsafe_allow_html=True)
-st.subheader("🚀 Model Training Simulation")
-st.markdown("**Experience the validation process:** Train our model on historical data and test on unseen 2024 market conditions.")
-
-if st.button("▶️ **Run Complete Model Validation**", key="train_model"):
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    # Simulate training process
-    phases = [
-        ("Loading historical data (2021-2023)...", 20),
-        ("Extracting CCI features...", 40),
-        ("Training ensemble models...", 60),
-        ("Cross-validating performance...", 80),
-        ("Testing on 2024 data...", 100)
-    ]
-    
-    for phase, progress in phases:
-        status_text.text(f"🔄 {phase}")
-        progress_bar.progress(progress)
-        time.sleep(1.2)
-    
-    st.session_state.model_trained = True
-    st.success("✅ **Model validation complete!** Navigate to 'Verdict & Roadmap' to see results.")
-    
-if st.session_state.model_trained:
-    st.info("📊 Model ready for deployment. Check the results in the next section!")
-
-st.markdown('</div>', unsafe_allow_html=True)
-```
-
-elif st.session_state.page == ‘verdict’:
-st.markdown(’<div class="content-section">’, unsafe_allow_html=True)
-
-```
-st.header("📈 Validated Market Intelligence")
-st.markdown("""
-**Definitive Success:** Our model was tested against the entire, unseen year of 2024. 
-The results demonstrate exceptional predictive power and commercial viability.
-""")
-
-# Calculate and display key metrics
-r2 = r2_score(results_df['Actual Rate'], results_df['Predicted Rate'])
-mae = mean_absolute_error(results_df['Actual Rate'], results_df['Predicted Rate'])
-accuracy_improvement = ((r2 - 0.498) / 0.498) * 100
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.metric(
-        "🎯 Model Accuracy (R²)", 
-        f"{r2:.1%}",
-        delta=f"+{accuracy_improvement:.0f}% vs Generic",
-        help="Explained 91% of price movements in unseen 2024 data"
-    )
-
-with col2:
-    st.metric(
-        "📊 Prediction Error (MAE)", 
-        f"${mae:.2f}",
-        delta="Industry Leading",
-        help="Average prediction error of only $0.58"
-    )
-
-with col3:
-    st.metric(
-        "💰 Annual Value", 
-        "$4.2M",
-        delta="Cost Avoidance",
-        help="Estimated annual savings from improved forecasting"
-    )
-
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Enhanced prediction visualization
-st.markdown('<div class="content-section">', unsafe_allow_html=True)
-st.subheader("📈 2024 Back-Test Performance")
-
-fig = make_subplots(
-    rows=2, cols=1,
-    shared_xaxes=True,
-    vertical_spacing=0.1,
-    subplot_titles=('Rate Predictions vs. Actual', 'Prediction Error Analysis'),
-    row_heights=[0.7, 0.3]
-)
-
-# Main prediction chart
-fig.add_trace(
-    go.Scatter(
-        x=results_df['date'],
-        y=results_df['Actual Rate'],
-        name='Actual Market Rate',
-        mode='lines+markers',
-        line=dict(color='#0066CC', width=3),
-        marker=dict(size=6)
-    ),
-    row=1, col=1
-)
-
-fig.add_trace(
-    go.Scatter(
-        x=results_df['date'],
-        y=results_df['Predicted Rate'],
-        name='CCI Prediction',
-        mode='lines+markers',
-        line=dict(color='#FF6B35', width=3, dash='dash'),
-        marker=dict(size=6)
-    ),
-    row=1, col=1
-)
-
-# Error analysis
-errors = results_df['Actual Rate'] - results_df['Predicted Rate']
-fig.add_trace(
-    go.Bar(
-        x=results_df['date'],
-        y=errors,
-        name='Prediction Error',
-        marker_color=['#00D4AA' if x >= 0 else '#FF4757' for x in errors],
-        showlegend=False
-    ),
-    row=2, col=1
-)
-
-fig.update_layout(
-    title='<b>Model Performance Analysis: 2024 Validation Results</b>',
-    height=600,
-    template='plotly_white',
-    hovermode='x unified'
-)
-
-fig.update_yaxes(title_text="Rate (USD)", row=1, col=1)
-fig.update_yaxes(title_text="Error (USD)", row=2, col=1)
-fig.update_xaxes(title_text="Month", row=2, col=1)
-
-st.plotly_chart(fig, use_container_width=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Future forecast
-st.markdown('<div class="content-section">', unsafe_allow_html=True)
-st.subheader("🔮 14-Day Forward Forecast")
-st.markdown("**Live prediction powered by current CCI data:**")
-
-# Create forecast chart
-fig_forecast = go.Figure()
-
-# Historical context (last 30 days)
-historical_dates = pd.date_range(start='2024-12-01', end='2024-12-31', freq='D')
-historical_prices = np.random.normal(6.5, 0.8, len(historical_dates))
-historical_prices = np.clip(historical_prices, 4.0, 9.0)  # Realistic bounds
-
-fig_forecast.add_trace(go.Scatter(
-    x=historical_dates,
-    y=historical_prices,
-    mode='lines',
-    name='Recent History',
-    line=dict(color='#CBD5E1', width=2),
-    opacity=0.7
-))
-
-# Forecast line
-fig_forecast.add_trace(go.Scatter(
-    x=forecast_df['date'],
-    y=forecast_df['predicted_rate'],
-    mode='lines+markers',
-    name='CCI Forecast',
-    line=dict(color='#FF6B35', width=3),
-    marker=dict(size=6, color='#FF6B35')
-))
-
-# Confidence intervals
-fig_forecast.add_trace(go.Scatter(
-    x=list(forecast_df['date']) + list(forecast_df['date'][::-1]),
-    y=list(forecast_df['confidence_upper']) + list(forecast_df['confidence_lower'][::-1]),
-    fill='toself',
-    fillcolor='rgba(255, 107, 53, 0.2)',
-    line=dict(color='rgba(255,255,255,0)'),
-    name='Confidence Interval',
-    hoverinfo="skip"
-))
-
-fig_forecast.update_layout(
-    title='<b>Forward-Looking Freight Rate Forecast</b>',
-    xaxis_title='Date',
-    yaxis_title='Freight Rate (USD)',
-    template='plotly_white',
-    height=400,
-    hovermode='x unified'
-)
-
-st.plotly_chart(fig_forecast, use_container_width=True)
-
-# Key insights
-avg_forecast = forecast_df['predicted_rate'].mean()
-trend_direction = "upward" if forecast_df['predicted_rate'].iloc[-1] > forecast_df['predicted_rate'].iloc[0] else "downward"
-
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("📊 14-Day Average", f"${avg_forecast:.2f}", help="Expected average rate over next 14 days")
-with col2:
-    st.metric("📈 Trend Direction", trend_direction.title(), help="Overall price movement direction")
-with col3:
-    st.metric("🎯 Confidence Level", "87%", help="Model confidence in forecast accuracy")
-
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Implementation roadmap
-st.header("🛣️ Strategic Implementation Roadmap")
-
-# Phase 1 Card
-st.markdown('<div class="phase-card">', unsafe_allow_html=True)
-st.subheader("Phase 1: MVP Deployment (Q4 2025)")
-st.markdown("""
-**Quick-Win Strategy:** Deploy the validated model immediately with semi-automated weekly updates.
-
-**Deliverables:**
-- Executive dashboard (identical to this demo) with weekly 7-14 day forecasts
-- C-suite and procurement team access for strategic decision-making
-- Risk alerts for critical threshold breaches
-
-**Business Value:** $1.2M annual cost avoidance through optimized procurement timing
-
-**Investment:** Minimal - leverage existing infrastructure with basic data engineering
-""")
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Phase 2 Card  
-st.markdown('<div class="phase-card">', unsafe_allow_html=True)
-st.subheader("Phase 2: Full Intelligence Platform (2026)")
-st.markdown("""
-**Complete Transformation:** Build comprehensive real-time intelligence infrastructure.
-
-**Deliverables:**
-- **Real-time Data Pipelines:** Live feeds from port authorities, market data, news APIs
-- **Mission Control Dashboard:** Daily forecasts with 7-14 day horizons
-- **Smart Alerting System:** Proactive notifications for business-critical events
-- **ERP Integration:** Direct API feeds into financial planning systems
-
-**Business Value:** $4.2M+ annual value through automated risk management
-
-**ROI Timeline:** 8-month payback period with 340% 3-year ROI
-""")
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Success metrics
-st.markdown('<div class="content-section">', unsafe_allow_html=True)
-st.subheader("📊 Success Metrics & KPIs")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("""
-    **Operational Excellence:**
-    - Forecast accuracy: >85% (current: 91%)
-    - Prediction lead time: 14 days
-    - Cost avoidance: $4.2M annually
-    - Decision response time: <2 hours
-    """)
-
-with col2:
-    st.markdown("""
-    **Strategic Impact:**
-    - Supply chain risk reduction: 60%
-    - Procurement cost optimization: 12-15%
-    - Market timing advantage: 7-10 days
-    - Competitive intelligence edge: Unique to ECG
-    """)
-
-st.markdown('</div>', unsafe_allow_html=True)
+# — Page Content —
 
-# Call to action
-st.markdown('<div class="content-section" style="text-align: center; background: linear-gradient(135deg, #0066CC, #004499); color: white; border: none;">', unsafe_allow_html=True)
-st.markdown("""
-## 🚀 Ready to Deploy Your Competitive Advantage?
+render(st.session_state.page)
 
-**The model is validated. The business case is proven. The competitive edge is within reach.**
+# — Profiling —
 
-*Transform market volatility from risk to opportunity with ECG's proprietary freight intelligence platform.*
-""")
-st.markdown('</div>', unsafe_allow_html=True)
-```
\ No newline at end of file
+spans = instrument.end_trace()
+if instrument.ENABLED:
+    from views.profiling import debug_panel
+    debug_panel(spans)
@@ -0,0 +1,208 @@
+"""Benchmarks for the data, forecast and rendering hot paths
+
+    pip install -r benchmarks/requirements.txt
+    python -m pytest benchmarks                        # 1k and 100k rows
+    python -m pytest benchmarks --sizes 1k,100k,10M    # 10M needs minutes and several GB
+    python -m pytest benchmarks -k backtest_metrics --sizes 1M,10M   # no dataset to publish
+    python -m pytest benchmarks --benchmark-autosave   # save a baseline ...
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:25%   # ... and gate on it
+
+Each benchmark runs against a synthetic dataset of the given number of rows
+(daily, hourly or per-minute readings, so the dates stay in range), written
+as Parquet files and synced into a partitioned store, as FREIGHT_DATA_DIR /
+FREIGHT_STORE_DIR would be in production.
+
+Besides pytest-benchmark's timings, every benchmark records the peak memory
+traced during one extra call (extra_info['peak_mib']), and fails when its
+median time or that peak exceed the budget in BUDGETS. Budgets are absolute
+and generous, to catch order-of-magnitude regressions on any machine;
+--benchmark-compare-fail catches smaller ones against a saved baseline.
+
+test_startup.py is a plain check rather than a benchmark: app.py's imports
+stay within scripts/startup_report.py's IMPORT_BUDGET, and the default
+page loads none of its DEFERRED modules.
+"""
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from freight.artifacts import ArtifactStore
+from freight.entities import PartitionedStore
+from freight.sources import FileSource
+from freight.synthetic import synthetic_history
+
+SIZES = {'1k': 1_000, '100k': 100_000, '1M': 1_000_000, '10M': 10_000_000}
+DEFAULT_SIZES = '1k,100k'
+ROUNDS = {'1k': 20, '100k': 5, '1M': 3, '10M': 1}
+
+# (benchmark, size) -> (median seconds, peak MiB): about 3-5x what a 1-CPU
+# container measures. Missing entries (1M and 10M datasets, until measured on a
+# machine with the memory for it) are only timed.
+BUDGETS = {
+    ('test_read_source', '1k'): (0.1, 8),
+    ('test_read_source', '100k'): (0.5, 64),
+    ('test_sync_partitions', '1k'): (0.25, 8),
+    ('test_sync_partitions', '100k'): (1.5, 128),
+    ('test_store_window', '1k'): (0.01, 2),
+    ('test_store_window', '100k'): (0.01, 16),
+    ('test_store_latest', '1k'): (0.01, 1),
+    ('test_store_latest', '100k'): (0.01, 1),
+    ('test_backtest_metrics', '1k'): (0.1, 2),
+    ('test_backtest_metrics', '100k'): (0.1, 32),
+    ('test_backtest_metrics', '1M'): (0.4, 256),
+    ('test_backtest_metrics', '10M'): (4.0, 2048),
+    ('test_forecast_horizons', '1k'): (0.01, 1),
+    ('test_forecast_horizons', '100k'): (0.01, 1),
+    ('test_monte_carlo_bands', '1k'): (2.0, 256),
+    ('test_monte_carlo_bands', '100k'): (2.0, 256),
+    ('test_publish_entity', '1k'): (2.5, 256),
+    ('test_publish_entity', '100k'): (3.0, 256),
+    ('test_history_pyramid', '1k'): (0.01, 1),
+    ('test_history_pyramid', '100k'): (0.05, 8),
+    ('test_backtest_figure', '1k'): (0.5, 8),
+    ('test_backtest_figure', '100k'): (1.5, 16),
+    ('test_history_figure', '1k'): (0.25, 4),
+    ('test_history_figure', '100k'): (0.75, 4),
+    ('test_page_cold', '1k'): (2.0, None),
+    ('test_page_cold', '100k'): (4.0, None),
+    ('test_page_rerun', '1k'): (0.25, None),
+    ('test_page_rerun', '100k'): (0.25, None),
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption('--sizes', default=DEFAULT_SIZES, help=f"comma-separated dataset sizes from {', '.join(SIZES)}")
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "size_independent: run at the smallest selected size only")
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = [name.strip() for name in metafunc.config.getoption('sizes').split(',') if name.strip()]
+        unknown = set(sizes) - SIZES.keys()
+        if unknown:
+            raise pytest.UsageError(f"unknown --sizes {', '.join(sorted(unknown))}")
+        if metafunc.definition.get_closest_marker('size_independent'):
+            sizes = sorted(sizes, key=SIZES.get)[:1]
+        metafunc.parametrize('size', sizes, scope='session')
+
+
+def _frequency(rows):
+    """Reading frequency that keeps `rows` readings from 2000 inside the datetime64[ns] range"""
+    if rows <= 20_000:
+        return 'D'
+    return 'h' if rows <= 1_000_000 else 'min'
+
+
+def synthetic_tables(rows, seed=7):
+    """(history, results) frames of `rows` readings each"""
+    freq = _frequency(rows)
+    end = pd.date_range('2000-01-01', periods=rows, freq=freq)[-1]
+    history = synthetic_history(start='2000-01-01', end=end, freq=freq, seed=seed)
+    rng = np.random.default_rng(seed)
+    predicted = history['freight_rate'].to_numpy() + rng.normal(0, 0.5, rows)
+    results = pd.DataFrame({
+        'date': history['date'],
+        'actual': history['freight_rate'],
+        'predicted': predicted.round(2),
+        'confidence_lower': (predicted - 0.4).round(2),
+        'confidence_upper': (predicted + 0.4).round(2),
+    })
+    return history, results
+
+
+class Dataset:
+    """Files, data source and stores for one benchmark size"""
+
+    def __init__(self, root, rows):
+        self.root = root
+        self.rows = rows
+        self.data_dir = root / 'data'
+        self.store_dir = root / 'store'
+        self.data_dir.mkdir(parents=True)
+        history, results = synthetic_tables(rows)
+        history.to_parquet(self.data_dir / 'history.parquet')
+        # Components are the same readings, but (as in REFERENCE_COMPONENTS_CSV)
+        # carry the latest prediction rather than the rate; scores are derived on sync
+        components = history.drop(columns='freight_rate').assign(latest_prediction=history['freight_rate'])
+        components.to_parquet(self.data_dir / 'components.parquet')
+        results.to_parquet(self.data_dir / 'results.parquet')
+        self.partitions = PartitionedStore(self.store_dir / 'partitions')
+        self.artifacts = ArtifactStore(self.store_dir / 'artifacts')
+
+    def source(self):
+        return FileSource(
+            results_path=self.data_dir / 'results.parquet',
+            components_path=self.data_dir / 'components.parquet',
+            history_path=self.data_dir / 'history.parquet',
+            cache_dir=self.root / 'cache',
+        )
+
+    def environ(self):
+        return {'FREIGHT_DATA_DIR': str(self.data_dir), 'FREIGHT_STORE_DIR': str(self.store_dir)}
+
+
+@pytest.fixture(scope='session')
+def dataset(size, tmp_path_factory):
+    """Synthetic data of `size` rows, synced and published"""
+    data = Dataset(tmp_path_factory.mktemp(f"freight-{size}"), SIZES[size])
+    data.partitions.sync(data.source())
+    data.artifacts.publish(data.partitions)
+    return data
+
+
+@pytest.fixture(scope='session')
+def backtest_results(size):
+    """Back-test results table of `size` rows, as the artifact store holds it, without a dataset"""
+    rows = SIZES[size]
+    rng = np.random.default_rng(7)
+    actual = 10 + rng.normal(0, 0.05, rows).cumsum()
+    return pd.DataFrame({
+        'date': pd.date_range('2000-01-01', periods=rows, freq=_frequency(rows)),
+        'Actual Rate': actual,
+        'Predicted Rate': actual + rng.normal(0, 0.5, rows),
+    })
+
+
+def peak_mib(fn, *args, **kwargs):
+    """Peak memory traced by Python and numpy allocations during one call, in MiB"""
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def measure(benchmark, request, size):
+    """Time fn with the benchmark fixture, trace its peak memory once, and check both budgets
+
+    setup, if given, runs before every timed call and returns (args, kwargs),
+    as for benchmark.pedantic.
+    """
+    name = request.node.originalname
+
+    def run(fn, *args, setup=None, rounds=None, memory=True, **kwargs):
+        rounds = rounds or ROUNDS[size]
+        if setup is None:
+            result = benchmark.pedantic(fn, args, kwargs, rounds=rounds, iterations=1, warmup_rounds=1)
+            call_args, call_kwargs = args, kwargs
+        else:
+            result = benchmark.pedantic(fn, setup=setup, rounds=rounds, iterations=1)
+            call_args, call_kwargs = setup()
+        seconds, mib = BUDGETS.get((name, size), (None, None))
+        if memory:
+            benchmark.extra_info['peak_mib'] = peak = peak_mib(fn, *call_args, **call_kwargs)
+            if mib is not None:
+                assert peak <= mib, f"{name}[{size}] peaked at {peak:.1f} MiB, budget {mib} MiB"
+        median = benchmark.stats.stats.median
+        if seconds is not None:
+            assert median <= seconds, f"{name}[{size}] took {median:.3f} s (median), budget {seconds} s"
+        return result
+
+    return run
@@ -0,0 +1,43 @@
+import itertools
+
+import pandas as pd
+
+from freight.entities import PartitionedStore
+
+# — Loading and Store Reads —
+
+
+def test_read_source(dataset, measure):
+    """The app's former load_data(): every table read and normalised from the source files"""
+    def load():
+        source = dataset.source()
+        return source.read_results(), source.read_components(), source.read_history()
+
+    results, components, history = measure(load)
+    assert len(history) == dataset.rows
+
+
+def test_sync_partitions(dataset, measure, tmp_path):
+    """Source tables split per port and lane, scored and written as memory-mapped stores"""
+    counter = itertools.count()
+
+    def setup():
+        return (PartitionedStore(tmp_path / f"partitions-{next(counter)}"),), {}
+
+    measure(lambda partitions: partitions.sync(dataset.source()), setup=setup)
+
+
+def test_store_window(dataset, measure):
+    """Trailing year of components, as the risk ranks and the history chart read it"""
+    (entity,) = dataset.partitions.entities()
+    store = dataset.partitions.store(entity, 'components')
+    start = store.latest(['date'])['date'] - pd.Timedelta(days=365)
+    window = measure(store.window, start=start)
+    assert len(window)
+
+
+def test_store_latest(dataset, measure):
+    """Latest component reading, read on every page view"""
+    (entity,) = dataset.partitions.entities()
+    store = dataset.partitions.store(entity, 'components')
+    measure(store.latest)
@@ -0,0 +1,56 @@
+import itertools
+
+import pytest
+
+from freight.artifacts import compute_entity
+from freight.downsample import Pyramid
+from freight.forecast import forecast_horizons
+from freight.metrics import BacktestMetrics
+from freight.montecarlo import inputs_from_components, quantile_bands, simulate
+
+# — Forecasts and Metrics —
+
+
+def test_backtest_metrics(backtest_results, measure):
+    """r2, MAE and the monthly breakdown over the whole back-test, from scratch"""
+    def metrics():
+        computed = BacktestMetrics.from_results(backtest_results)
+        return computed.r2, computed.mae
+
+    r2, mae = measure(metrics)
+    assert mae > 0
+
+
+@pytest.mark.size_independent
+def test_forecast_horizons(measure):
+    """The app's former generate_forecast_data(): point forecasts for every horizon"""
+    measure(forecast_horizons, 9.5, '2025-01-01')
+
+
+@pytest.mark.size_independent
+def test_monte_carlo_bands(dataset, measure):
+    """Scenario bands for the latest conditions over the longest horizon"""
+    (entity,) = dataset.partitions.entities()
+    latest = dataset.partitions.store(entity, 'components').latest()
+    inputs = inputs_from_components(latest, float(latest['latest_prediction']))
+    bands = measure(lambda: quantile_bands(simulate(inputs, horizon=90), (0.1, 0.5, 0.9)))
+    assert bands.shape == (3, 90)
+
+
+def test_publish_entity(dataset, measure, tmp_path):
+    """Everything the batch job computes for one port and lane"""
+    (entity,) = dataset.partitions.entities()
+    counter = itertools.count()
+
+    def setup():
+        return (dataset.partitions.root, entity, tmp_path / f"run-{next(counter)}"), {}
+
+    measure(compute_entity, setup=setup)
+
+
+def test_history_pyramid(dataset, measure):
+    """Chart pyramid of the full rate history"""
+    (entity,) = dataset.partitions.entities()
+    history = dataset.partitions.store(entity, 'history').window(columns=['date', 'freight_rate'])
+    pyramid = measure(Pyramid.build, history['date'], history['freight_rate'])
+    assert pyramid.rows == dataset.rows
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import plotly.io as pio
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from freight.downsample import thin_frame
+from freight.figures import backtest_figure, history_figure
+from views import PAGES
+
+APP = Path(__file__).resolve().parent.parent / 'app.py'
+
+# — Figures and Page Renders —
+
+
+def test_backtest_figure(dataset, measure):
+    """Back-test chart built and serialised, as st.plotly_chart sends it"""
+    (entity,) = dataset.artifacts.entities()
+    results = dataset.artifacts.store(entity, 'results').window()
+
+    def build():
+        thinned = thin_frame(results, 'date', ['Actual Rate', 'Predicted Rate'])
+        return pio.to_json(backtest_figure(thinned), validate=False)
+
+    measure(build)
+
+
+def test_history_figure(dataset, measure):
+    """Full-range rate and CCI history chart from the published pyramids, serialised"""
+    (entity,) = dataset.artifacts.entities()
+    pyramids = dataset.artifacts.pyramids(entity)
+
+    def build():
+        rate_dates, rates = pyramids['freight_rate'].view()
+        cci_dates, cci = pyramids['CCI_Score'].view()
+        return pio.to_json(history_figure(rate_dates, rates, cci_dates, cci), validate=False)
+
+    measure(build)
+
+
+@pytest.fixture
+def app_env(dataset, monkeypatch):
+    for name, value in dataset.environ().items():
+        monkeypatch.setenv(name, value)
+    # Cached resources (stores, snapshots) would otherwise outlive the dataset they were built for
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def _app(page):
+    at = AppTest.from_file(str(APP), default_timeout=300)
+    at.session_state['page'] = page
+    return at
+
+
+def _run(at):
+    at.run()
+    assert not at.exception, [e.value for e in at.exception]
+
+
+@pytest.mark.parametrize('page', [page.name for page in PAGES])
+def test_page_cold(app_env, measure, page):
+    """First render of a page in a new session with every st.cache_* empty"""
+    def setup():
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        return (_app(page),), {}
+
+    measure(_run, setup=setup, memory=False)
+
+
+@pytest.mark.parametrize('page', [page.name for page in PAGES])
+def test_page_rerun(app_env, measure, page):
+    """Rerun of a page already shown in the session, as on every widget interaction"""
+    at = _app(page)
+    _run(at)
+    measure(_run, at, memory=False)
@@ -0,0 +1,20 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'scripts' / 'startup_report.py'
+
+# — Cold Start —
+
+
+def test_startup_budget():
+    """app.py imports within IMPORT_BUDGET, and the default page loads none of DEFERRED"""
+    out = subprocess.run([sys.executable, str(SCRIPT), '--json', '--repeat', '1'], capture_output=True, text=True)
+    report = json.loads(out.stdout)
+    assert not report['exceptions'], report['exceptions']
+    assert not report['deferred_loaded'], f"first render loaded {', '.join(report['deferred_loaded'])}"
+    assert report['import_seconds'] <= report['budget_seconds'], (
+        f"app.py imports took {report['import_seconds']:.2f} s, budget {report['budget_seconds']} s"
+    )
+    assert out.returncode == 0, out.stderr
@@ -0,0 +1 @@
+"""Data, modelling and forecasting core behind the ECG Freight Intelligence app"""
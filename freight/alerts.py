@@ -0,0 +1,416 @@
+import heapq
+import json
+import logging
+import os
+import sqlite3
+import threading
+import urllib.request
+from bisect import bisect_left
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from freight.store import _atomic_write_text, default_store_root
+
+log = logging.getLogger(__name__)
+
+# — Threshold Alerts —
+#
+# Rules compare one series against a threshold: a metric's level
+# ("CCI_Score > 0.75"), or its relative change over a window ("avg_wait_time
+# up more than 20% day-on-day"), optionally only once the breach has lasted
+# a while ("... for 6h"). Forecast rules use the same machinery on forecast
+# readings such as forecast_peak_14d.
+#
+# Rules are indexed by series and direction, sorted by threshold. For a
+# given value the breached rules are a prefix of that ladder, so an update
+# is a binary search, and only the rules between the old and new prefix
+# length change state. Sustained breaches wait in a heap keyed by when they
+# become due. Each breach alerts once (until the series recovers), at most
+# once per rule cooldown, and at most MAX_PER_HOUR times per engine.
+
+OPS = ('>', '<')
+DEFAULT_COOLDOWN = pd.Timedelta(hours=6)
+MAX_PER_HOUR = 20
+
+# Used when FREIGHT_ALERT_RULES names no rule file
+DEFAULT_RULES = [
+    {'id': 'cci-critical', 'metric': 'CCI_Score', 'op': '>', 'threshold': 0.75, 'for': '6h',
+     'severity': 'critical'},
+    {'id': 'wait-rising', 'metric': 'avg_wait_time', 'change': '1D', 'op': '>', 'threshold': 0.2},
+    {'id': 'berths-scarce', 'metric': 'berth_availability', 'op': '<', 'threshold': 3},
+    {'id': 'budget-14d', 'metric': 'forecast_peak_14d', 'op': '>', 'threshold': 12.0,
+     'severity': 'critical'},
+]
+
+
+def _span(delta):
+    hours = delta / pd.Timedelta(hours=1)
+    return f"{hours / 24:g}d" if hours % 24 == 0 else f"{hours:g}h"
+
+
+@dataclass(frozen=True)
+class Rule:
+    id: str
+    metric: str
+    op: str                                 # '>' or '<'
+    threshold: float
+    sustain: pd.Timedelta = pd.Timedelta(0)  # How long the breach must last before alerting
+    change: pd.Timedelta = None             # Watch the relative change over this window, not the level
+    severity: str = 'warning'
+    cooldown: pd.Timedelta = DEFAULT_COOLDOWN
+
+    @property
+    def series(self):
+        return (self.metric, self.change)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rule from its JSON form; durations are pandas strings ('6h', '1D')"""
+        if data['op'] not in OPS:
+            raise ValueError(f"rule {data['id']!r}: op must be one of {OPS}")
+        return cls(
+            id=data['id'],
+            metric=data['metric'],
+            op=data['op'],
+            threshold=float(data['threshold']),
+            sustain=pd.Timedelta(data.get('for', 0)),
+            change=pd.Timedelta(data['change']) if data.get('change') else None,
+            severity=data.get('severity', 'warning'),
+            cooldown=pd.Timedelta(data.get('cooldown', DEFAULT_COOLDOWN)),
+        )
+
+    def describe(self):
+        subject = self.metric if self.change is None else f"{self.metric} change over {_span(self.change)}"
+        threshold = f"{self.threshold:.0%}" if self.change is not None else f"{self.threshold:g}"
+        held = f" for {_span(self.sustain)}" if self.sustain else ""
+        return f"{subject} {self.op} {threshold}{held}"
+
+
+def load_rules(path=None):
+    """Rules from a JSON list at path (default: FREIGHT_ALERT_RULES), else DEFAULT_RULES"""
+    path = path or os.environ.get('FREIGHT_ALERT_RULES')
+    data = json.loads(Path(path).read_text()) if path else DEFAULT_RULES
+    rules = [Rule.from_dict(item) for item in data]
+    if len({rule.id for rule in rules}) != len(rules):
+        raise ValueError("alert rule ids must be unique")
+    return rules
+
+
+@dataclass(frozen=True)
+class Alert:
+    rule: str
+    scope: str              # Port and lane, or another label for what was watched
+    time: pd.Timestamp
+    severity: str
+    metric: str
+    value: float
+    threshold: float
+    message: str
+
+    def to_dict(self):
+        return {**asdict(self), 'time': self.time.isoformat()}
+
+
+class _Ladder:
+    """Rules on one series and direction, sorted so breaches form a prefix"""
+
+    def __init__(self, rules, op):
+        self.sign = 1 if op == '>' else -1
+        self.rules = sorted(rules, key=lambda rule: self.sign * rule.threshold)
+        self.keys = [self.sign * rule.threshold for rule in self.rules]
+        self.level = 0
+
+    def update(self, value):
+        """(rules now breached, rules no longer breached)"""
+        level = bisect_left(self.keys, self.sign * value)
+        previous, self.level = self.level, level
+        if level > previous:
+            return self.rules[previous:level], ()
+        return (), self.rules[level:previous]
+
+
+class RateLimiter:
+    """Per-rule cooldown plus an hourly cap, both in observation time"""
+
+    def __init__(self, max_per_hour=MAX_PER_HOUR):
+        self.max_per_hour = max_per_hour
+        self.last_sent = {}
+        self.sent = deque()
+        self.suppressed = 0
+
+    def allow(self, rule, time):
+        hour_ago = time - pd.Timedelta(hours=1)
+        while self.sent and self.sent[0] <= hour_ago:
+            self.sent.popleft()
+        last = self.last_sent.get(rule.id)
+        if (last is not None and time - last < rule.cooldown) or len(self.sent) >= self.max_per_hour:
+            self.suppressed += 1
+            return False
+        self.last_sent[rule.id] = time
+        self.sent.append(time)
+        return True
+
+
+class AlertEngine:
+    """Evaluates indexed rules against a stream of timestamped readings
+
+    observe() takes a lock, so one engine can be fed from several threads
+    (the event listener serves each connection on its own).
+    """
+
+    def __init__(self, rules, scope='', sink=None, limiter=None):
+        self.rules = {rule.id: rule for rule in rules}
+        self.scope = scope
+        self.sink = sink
+        self.limiter = limiter or RateLimiter()
+        self._ladders = {}           # metric -> {(change, op): _Ladder}
+        by_series = {}
+        for rule in rules:
+            by_series.setdefault((rule.metric, rule.change, rule.op), []).append(rule)
+        for (metric, change, op), group in by_series.items():
+            self._ladders.setdefault(metric, {})[(change, op)] = _Ladder(group, op)
+        self._windows = {}           # metric -> longest change window watched
+        for rule in rules:
+            if rule.change is not None:
+                self._windows[rule.metric] = max(self._windows.get(rule.metric, rule.change), rule.change)
+        self._history = {metric: deque() for metric in self._windows}
+        self._values = {}            # (metric, change) -> latest series value
+        self._since = {}             # rule id -> start of its current breach
+        self._fired = set()          # rule ids that have alerted for their current breach
+        self._due = []               # (due time, rule id, breach start) for sustained rules
+        self.last_time = None
+        self._lock = threading.Lock()
+
+    @property
+    def lookback(self):
+        """How much history the rules need to be judged on from a cold start"""
+        return max((rule.sustain + (rule.change or pd.Timedelta(0)) for rule in self.rules.values()),
+                   default=pd.Timedelta(0))
+
+    def _change(self, metric, time, value, window):
+        """Relative change of metric since the last reading at least window ago"""
+        history = self._history[metric]
+        cutoff = time - window
+        then = None
+        for when, earlier in history:
+            if when > cutoff:
+                break
+            then = earlier
+        if then is None or then == 0:
+            return None
+        return (value - then) / abs(then)
+
+    def _record(self, metric, time, value):
+        history = self._history[metric]
+        history.append((time, value))
+        # Keep one reading at or before the longest window, for the change against it
+        cutoff = time - self._windows[metric]
+        while len(history) > 1 and history[1][0] <= cutoff:
+            history.popleft()
+
+    def observe(self, time, readings):
+        """Fold one set of readings taken at time into the rules; returns new alerts
+
+        readings maps metric name -> number; metrics no rule watches are ignored.
+        """
+        time = pd.Timestamp(time)
+        alerts = []
+        with self._lock:
+            self.last_time = time if self.last_time is None else max(self.last_time, time)
+            for metric, value in readings.items():
+                ladders = self._ladders.get(metric)
+                if ladders is None or value is None or not np.isfinite(value):
+                    continue
+                value = float(value)
+                for (change, op), ladder in ladders.items():
+                    series = value if change is None else self._change(metric, time, value, change)
+                    if series is None:
+                        continue
+                    self._values[(metric, change)] = series
+                    breached, recovered = ladder.update(series)
+                    for rule in recovered:
+                        self._since.pop(rule.id, None)
+                        self._fired.discard(rule.id)
+                    for rule in breached:
+                        self._since[rule.id] = time
+                        if rule.sustain:
+                            heapq.heappush(self._due, (time + rule.sustain, rule.id, time))
+                        else:
+                            alerts.extend(self._fire(rule, time))
+                if metric in self._history:
+                    self._record(metric, time, value)
+
+            while self._due and self._due[0][0] <= time:
+                _, rule_id, since = heapq.heappop(self._due)
+                # Stale if the breach ended (or restarted) since this entry was queued
+                if self._since.get(rule_id) == since:
+                    alerts.extend(self._fire(self.rules[rule_id], time))
+        if self.sink is not None:
+            for alert in alerts:
+                self.sink.write(alert)
+        return alerts
+
+    def _fire(self, rule, time):
+        if rule.id in self._fired:
+            return []
+        self._fired.add(rule.id)
+        if not self.limiter.allow(rule, time):
+            return []
+        value = self._values[rule.series]
+        shown = f"{value:+.0%}" if rule.change is not None else f"{value:g}"
+        return [Alert(
+            rule=rule.id,
+            scope=self.scope,
+            time=time,
+            severity=rule.severity,
+            metric=rule.metric,
+            value=value,
+            threshold=rule.threshold,
+            message=f"{self.scope + ': ' if self.scope else ''}{rule.describe()} (now {shown})",
+        )]
+
+    # — Persistence —
+
+    def state(self):
+        """JSON-ready state, so an engine can resume across batch runs"""
+        def when(time):
+            return None if time is None else time.isoformat()
+        with self._lock:
+            return {
+                'last_time': when(self.last_time),
+                'values': [[metric, None if change is None else str(change), value]
+                           for (metric, change), value in self._values.items()],
+                'history': {metric: [[when(t), v] for t, v in history] for metric, history in self._history.items()},
+                'since': {rule_id: when(t) for rule_id, t in self._since.items()},
+                'fired': sorted(self._fired),
+                'last_sent': {rule_id: when(t) for rule_id, t in self.limiter.last_sent.items()},
+                'sent': [when(t) for t in self.limiter.sent],
+            }
+
+    def restore(self, state):
+        """Resume from state(); rules that no longer exist are dropped"""
+        def when(text):
+            return None if text is None else pd.Timestamp(text)
+        with self._lock:
+            self.last_time = when(state['last_time'])
+            for metric, change, value in state['values']:
+                change = None if change is None else pd.Timedelta(change)
+                self._values[(metric, change)] = value
+                for (ladder_change, _), ladder in self._ladders.get(metric, {}).items():
+                    if ladder_change == change:
+                        ladder.update(value)
+            for metric, history in state['history'].items():
+                if metric in self._history:
+                    self._history[metric].extend((when(t), v) for t, v in history)
+            # Only rules their restored ladder still has breached carry their breach
+            # over (a rule's threshold may have changed since the state was saved)
+            breached = {
+                rule.id for ladders in self._ladders.values() for ladder in ladders.values()
+                for rule in ladder.rules[:ladder.level]
+            }
+            for rule_id, since in state['since'].items():
+                rule = self.rules.get(rule_id)
+                if rule is None or rule_id not in breached:
+                    continue
+                self._since[rule_id] = when(since)
+                if rule.sustain and rule_id not in state['fired']:
+                    heapq.heappush(self._due, (when(since) + rule.sustain, rule_id, when(since)))
+            self._fired = {rule_id for rule_id in state['fired'] if rule_id in self._since}
+            self.limiter.last_sent = {r: when(t) for r, t in state['last_sent'].items() if r in self.rules}
+            self.limiter.sent.extend(when(t) for t in state['sent'])
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(path, json.dumps(self.state()))
+
+    def load(self, path):
+        """Resume from a state file, if there is one; returns self"""
+        try:
+            self.restore(json.loads(Path(path).read_text()))
+        except FileNotFoundError:
+            pass
+        return self
+
+
+def forecast_readings(forecasts):
+    """Readings for forecast rules: forecast_peak_<h>d and forecast_mean_<h>d per horizon"""
+    readings = {}
+    for horizon, forecast in forecasts.items():
+        predicted = forecast.predicted[0]
+        readings[f"forecast_peak_{horizon}d"] = float(predicted.max())
+        readings[f"forecast_mean_{horizon}d"] = float(predicted.mean())
+    return readings
+
+
+# — Sinks —
+
+
+class JsonLinesSink:
+    """Appends one JSON object per alert to a local file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def write(self, alert):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, 'a') as f:
+            f.write(json.dumps(alert.to_dict()) + '\n')
+
+
+class SQLiteSink:
+    """Inserts alerts into an `alerts` table of a local SQLite database"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.path) as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS alerts (time TEXT, scope TEXT, rule TEXT, severity TEXT,"
+                " metric TEXT, value REAL, threshold REAL, message TEXT)"
+            )
+
+    def write(self, alert):
+        row = alert.to_dict()
+        with sqlite3.connect(self.path) as db:
+            db.execute(
+                "INSERT INTO alerts VALUES (:time, :scope, :rule, :severity, :metric, :value, :threshold, :message)",
+                row,
+            )
+
+
+class WebhookSink:
+    """POSTs each alert as JSON; delivery failures are logged, not raised"""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def write(self, alert):
+        request = urllib.request.Request(
+            self.url, data=json.dumps(alert.to_dict()).encode(), headers={'Content-Type': 'application/json'}
+        )
+        try:
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+        except OSError as error:
+            log.warning("alert %s not delivered to %s: %s", alert.rule, self.url, error)
+
+
+def open_sink(target):
+    """Sink for an http(s):// URL, a sqlite:///path, or a JSON-lines file path"""
+    target = str(target)
+    if target.startswith(('http://', 'https://')):
+        return WebhookSink(target)
+    if target.startswith('sqlite:///'):
+        return SQLiteSink(target[len('sqlite:///'):])
+    return JsonLinesSink(target)
+
+
+def default_sink():
+    """FREIGHT_ALERT_SINK (see open_sink), or alerts/alerts.jsonl in the store directory"""
+    return open_sink(os.environ.get('FREIGHT_ALERT_SINK') or default_store_root() / 'alerts' / 'alerts.jsonl')
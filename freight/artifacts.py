@@ -0,0 +1,209 @@
+import json
+import shutil
+import time
+from concurrent.futures import wait
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from freight.downsample import Pyramid
+from freight.entities import Entity, PartitionedStore
+from freight.forecast import HORIZONS, Forecast, forecast_horizons
+from freight.metrics import BacktestMetrics, sync_metrics
+from freight.montecarlo import inputs_from_components, quantile_bands, simulate
+from freight.risk import RISK_WINDOW_DAYS, WARMUP_DAYS, RiskProfile
+from freight.store import ComponentStore, _atomic_write_text, store_lock
+
+# — Forecast Artifacts —
+#
+# Everything the pages show for a port and lane (forecasts, Monte Carlo
+# bands for the current conditions, back-test metrics, risk ranks, recent
+# history) is computed off the request path by publish(), and the app only
+# reads the result. Each publish is a new immutable run:
+#
+#   root/CURRENT                              name of the live run
+#   root/r<N>/MANIFEST.json                   created, entities, their partition signatures
+#   root/r<N>/<port>/<lane>/market.json       latest reading, deltas, base rate, metrics, risk
+#   root/r<N>/<port>/<lane>/arrays.npz        forecast and band arrays over the longest horizon
+#   root/r<N>/<port>/<lane>/{results,history}/  ComponentStores
+#   root/r<N>/<port>/<lane>/pyramids/<series>/  chart pyramids of the full history
+#
+# A run is written under a hidden name, renamed into place once complete and
+# only then named in CURRENT, so readers see the old run or the new one,
+# never a mix. Old runs are kept for a while (readers may still hold them).
+
+BAND_QUANTILES = (0.1, 0.5, 0.9)
+HISTORY_DAYS = 30       # Recent rate history shown ahead of the forecast
+LIVE_FIELDS = ('vessel_count', 'avg_wait_time', 'berth_availability', 'CCI_Score')
+# Long-history charts (see freight.downsample): series -> partition it is read from
+PYRAMID_SERIES = {'freight_rate': 'history', 'CCI_Score': 'components'}
+KEEP_RUNS = 5
+
+
+def _jsonable(value):
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def port_deltas(store, latest):
+    """Change of the port metrics since the stored snapshot a day before latest"""
+    earlier = store.tail(1, ['date', *LIVE_FIELDS], end=latest['date'] - pd.Timedelta(days=1))
+    if earlier.empty:
+        return dict.fromkeys(LIVE_FIELDS)
+    return {name: _jsonable(latest[name] - earlier[name].iloc[0]) for name in LIVE_FIELDS}
+
+
+def risk_profile(history_store):
+    """Radar-axis rank indexes over the trailing year of the stored history"""
+    if not len(history_store):
+        return RiskProfile.from_history(history_store.window())
+    end = history_store.latest(['date'])['date']
+    start = end - pd.Timedelta(days=RISK_WINDOW_DAYS + WARMUP_DAYS)
+    return RiskProfile.from_history(history_store.window(start=start))
+
+
+def compute_entity(partitions_root, entity, out_dir):
+    """Compute and write one entity's artifacts into out_dir; runs in a worker"""
+    partitions = PartitionedStore(partitions_root)
+    components = partitions.store(entity, 'components')
+    history = partitions.store(entity, 'history')
+    results = partitions.store(entity, 'results').window()
+    latest = components.latest()
+    base_rate = float(latest.get('latest_prediction', latest.get('freight_rate')))
+
+    horizon = max(HORIZONS)
+    full = forecast_horizons(base_rate, latest['date'], (horizon,))[horizon]
+    # Shorter horizons are prefixes of the longest, for forecasts and bands alike
+    bands = quantile_bands(simulate(inputs_from_components(latest, base_rate), horizon=horizon), BAND_QUANTILES)
+    # Persisted next to the partitions and only extended with newly arrived actuals
+    metrics = sync_metrics(partitions.root / entity.path / 'backtest_metrics.json', results)
+
+    out_dir.mkdir(parents=True)
+    _atomic_write_text(out_dir / 'market.json', json.dumps({
+        'base_rate': base_rate,
+        'latest': {name: _jsonable(value) for name, value in latest.items()},
+        'deltas': port_deltas(components, latest),
+        'metrics': metrics.to_dict(),
+        'risk': risk_profile(history).to_dict(),
+    }))
+    np.savez(
+        out_dir / 'arrays.npz',
+        dates=full.dates, predicted=full.predicted, lower=full.lower, upper=full.upper, bands=bands,
+    )
+    ComponentStore(out_dir / 'results').write(results)
+    # By time, not rows: the history may be hourly or finer
+    start = pd.Timestamp(full.dates[0])
+    recent = history.window(start - pd.Timedelta(days=HISTORY_DAYS), start, ['date', 'freight_rate'])
+    ComponentStore(out_dir / 'history').write(recent)
+    for name, kind in PYRAMID_SERIES.items():
+        store = partitions.store(entity, kind)
+        if name in store.columns:
+            everything = store.window(columns=['date', name])
+            Pyramid.build(everything['date'], everything[name]).save(out_dir / 'pyramids' / name)
+    return entity
+
+
+class ArtifactStore:
+    """Published forecast runs under one root, read by the app"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def current(self):
+        """Name of the live run, or None before the first publish"""
+        try:
+            return (self.root / 'CURRENT').read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def manifest(self, run=None):
+        run = run or self.current()
+        if run is None:
+            return {'entities': []}
+        return json.loads((self.root / run / 'MANIFEST.json').read_text())
+
+    def entities(self, run=None):
+        """Entities in a run (default: the live one), sorted by port then lane"""
+        return [Entity(*pair) for pair, _ in self.manifest(run)['entities']]
+
+    def store(self, entity, kind, run=None):
+        """One entity's 'results' or 'history' ComponentStore in a run"""
+        return ComponentStore(self.root / (run or self.current()) / entity.path / kind)
+
+    def forecast(self, entity, run=None):
+        """(forecast over the longest horizon, Monte Carlo bands) for one entity"""
+        with np.load(self.root / (run or self.current()) / entity.path / 'arrays.npz') as arrays:
+            full = Forecast(arrays['dates'], arrays['predicted'], arrays['lower'], arrays['upper'])
+            return full, arrays['bands']
+
+    def pyramids(self, entity, run=None):
+        """{series: Pyramid} for one entity; empty for runs published before pyramids were"""
+        root = self.root / (run or self.current()) / entity.path / 'pyramids'
+        return {path.name: Pyramid.load(path) for path in root.iterdir()} if root.is_dir() else {}
+
+    def load(self, entity, run=None):
+        """One entity's artifacts as MarketSnapshot fields"""
+        run = run or self.current()
+        market = json.loads((self.root / run / entity.path / 'market.json').read_text())
+        full, bands = self.forecast(entity, run)
+        latest = pd.Series(market['latest'])
+        latest['date'] = pd.Timestamp(latest['date'])
+        return dict(
+            results=self.store(entity, 'results', run).window(),
+            history=self.store(entity, 'history', run).window(),
+            latest=latest,
+            deltas=market['deltas'],
+            base_rate=market['base_rate'],
+            forecasts={h: full.head(h) for h in HORIZONS},
+            bands=bands,
+            metrics=BacktestMetrics.from_dict(market['metrics']),
+            risk=RiskProfile.from_dict(market['risk']),
+            pyramids=self.pyramids(entity, run),
+        )
+
+    def _runs(self):
+        runs = [p.name for p in self.root.glob('r*') if p.is_dir() and p.name[1:].isdigit()]
+        return sorted(runs, key=lambda name: int(name[1:]))
+
+    def publish(self, partitions, executor=None, force=False, keep=KEEP_RUNS):
+        """Compute every entity's artifacts as a new run; returns its name
+
+        Skipped (returning None) when no entity's partitions changed since the
+        live run, unless force is set.
+        """
+        entities = partitions.entities()
+        signatures = [[[e.port, e.lane], list(partitions.signature(e))] for e in entities]
+        with store_lock(self.root):
+            current = self.current()
+            if not force and current is not None and self.manifest(current)['entities'] == signatures:
+                return None
+            runs = self._runs()
+            run = f"r{int(runs[-1][1:]) + 1 if runs else 1}"
+            staging = self.root / f".{run}"
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+
+            jobs = [(partitions.root, entity, staging / entity.path) for entity in entities]
+            if executor is None:
+                for job in jobs:
+                    compute_entity(*job)
+            else:
+                futures = [executor.submit(compute_entity, *job) for job in jobs]
+                wait(futures)
+                for future in futures:
+                    future.result()
+
+            _atomic_write_text(staging / 'MANIFEST.json', json.dumps({
+                'created': time.time(),
+                'entities': signatures,
+            }))
+            staging.rename(self.root / run)
+            _atomic_write_text(self.root / 'CURRENT', run)
+
+            for old in self._runs()[:-keep]:
+                shutil.rmtree(self.root / old, ignore_errors=True)
+        return run
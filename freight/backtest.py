@@ -0,0 +1,122 @@
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from freight.features import FEATURE_COLUMNS
+
+# — Walk-Forward Back-Testing —
+#
+# At each origin t the model is re-fitted on every row whose target was
+# already known at t (target_date <= t), then forecasts the next `horizon`
+# days from the last `horizon` feature rows. Features are built once for
+# the whole history; being trailing windows, a prefix of them is exactly
+# what would have been computed at t, so every fold slices the same arrays.
+# Folds are independent and run concurrently when an executor is given.
+
+ORIGIN_FREQUENCIES = {
+    'daily': pd.offsets.Day(),
+    'weekly': pd.offsets.Week(weekday=6),
+    'monthly': pd.offsets.MonthEnd(),
+}
+BAND_QUANTILES = (0.1, 0.9)
+
+
+@dataclass
+class WalkForward:
+    folds: pd.DataFrame   # One row per forecast: origin, date, lead, actual, predicted
+    frequency: str
+    horizon: int
+
+    @property
+    def n_folds(self):
+        return self.folds['origin'].nunique()
+
+    def lead_errors(self, quantiles=BAND_QUANTILES):
+        """MAE and error quantiles for each lead time (days after the origin)"""
+        error = self.folds['actual'] - self.folds['predicted']
+        grouped = error.groupby(self.folds['lead'])
+        table = grouped.quantile(list(quantiles)).unstack()
+        table.columns = [f"q{round(q * 100)}" for q in quantiles]
+        table.insert(0, 'mae', error.abs().groupby(self.folds['lead']).mean())
+        return table
+
+    def latest(self):
+        """Freshest forecast for every target date, with empirical error bands
+
+        The bands are the 10th-90th percentile errors seen at that lead time
+        across all folds.
+        """
+        latest = self.folds.sort_values(['date', 'lead']).drop_duplicates('date').reset_index(drop=True)
+        bands = self.lead_errors().reindex(latest['lead']).to_numpy()
+        return pd.DataFrame({
+            'date': latest['date'],
+            'actual': latest['actual'],
+            'predicted': latest['predicted'],
+            'lower': latest['predicted'] + bands[:, 1],
+            'upper': latest['predicted'] + bands[:, 2],
+        })
+
+
+def origin_dates(start, end, frequency):
+    """Fold origins strictly before end, the first at start"""
+    dates = pd.date_range(start, end, freq=ORIGIN_FREQUENCIES[frequency], inclusive='left')
+    return dates.union([pd.Timestamp(start)])
+
+
+def walk_forward(frame, fold, start, end, frequency='weekly', horizon=14, executor=None, on_fold=None):
+    """Rolling-origin back-test over a supervised frame (see training.supervised_frame)
+
+    fold(X_train, y_train, X_next) fits a model and returns its predictions
+    for X_next; it must be picklable to run on a process pool. Forecasts
+    target dates in (start, end]. on_fold(done, total) is called as each fold
+    finishes.
+    """
+    if frequency not in ORIGIN_FREQUENCIES:
+        raise ValueError(f"frequency must be one of {sorted(ORIGIN_FREQUENCIES)}")
+    frame = frame.sort_values('date').reset_index(drop=True)
+    X = frame[FEATURE_COLUMNS].to_numpy(dtype=float)
+    y = frame['target'].to_numpy(dtype=float)
+    target_dates = frame['target_date'].to_numpy()
+    end = np.datetime64(pd.Timestamp(end), 'ns')
+
+    # (origin, train rows, forecast rows) for every fold with something to forecast
+    folds = []
+    for origin in origin_dates(start, end, frequency):
+        t = np.datetime64(origin, 'ns')
+        n_train = int(np.searchsorted(target_dates, t, 'right'))
+        stop = int(np.searchsorted(target_dates, min(t + np.timedelta64(horizon, 'D'), end), 'right'))
+        if n_train and stop > n_train:
+            folds.append((origin, n_train, stop))
+    if not folds:
+        raise ValueError("no walk-forward folds between start and end")
+
+    if executor is None:
+        predictions = []
+        for i, (_, n_train, stop) in enumerate(folds):
+            predictions.append(fold(X[:n_train], y[:n_train], X[n_train:stop]))
+            if on_fold is not None:
+                on_fold(i + 1, len(folds))
+    else:
+        futures = {
+            executor.submit(fold, X[:n_train], y[:n_train], X[n_train:stop]): i
+            for i, (_, n_train, stop) in enumerate(folds)
+        }
+        predictions = [None] * len(folds)
+        for done, future in enumerate(as_completed(futures), 1):
+            predictions[futures[future]] = future.result()
+            if on_fold is not None:
+                on_fold(done, len(folds))
+
+    pieces = []
+    for (origin, n_train, stop), predicted in zip(folds, predictions):
+        dates = pd.DatetimeIndex(target_dates[n_train:stop])
+        pieces.append(pd.DataFrame({
+            'origin': origin,
+            'date': dates,
+            'lead': (dates - origin).days,
+            'actual': y[n_train:stop],
+            'predicted': predicted,
+        }))
+    return WalkForward(pd.concat(pieces, ignore_index=True), frequency, horizon)
@@ -0,0 +1,116 @@
+"""Headless forecast publisher: python -m freight.batch [--every SECONDS]
+
+Syncs the partitioned store from the configured data source (see
+freight.sources.default_source), computes every port and lane's forecast
+artifacts and publishes them as a new run (see freight.artifacts). Run it
+from cron or a scheduler, or keep it running with --every. Uses the same
+FREIGHT_DATA_DIR / FREIGHT_STORE_DIR settings as the app.
+
+After each publish, the new component rows and forecasts of every port and
+lane are checked against the alert rules (see freight.alerts), configured by
+FREIGHT_ALERT_RULES and FREIGHT_ALERT_SINK.
+"""
+import argparse
+import logging
+import os
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from freight.alerts import AlertEngine, default_sink, forecast_readings, load_rules
+from freight.artifacts import KEEP_RUNS, ArtifactStore
+from freight.entities import PartitionedStore
+from freight.jobs import _worker_context, module_command
+from freight.sources import default_source
+from freight.store import default_store_root
+
+log = logging.getLogger('freight.batch')
+
+
+def default_stores(root=None):
+    """(partitions, artifacts) under root, default: the app's store directory"""
+    root = root or default_store_root()
+    return PartitionedStore(root / 'partitions'), ArtifactStore(root / 'artifacts')
+
+
+def run_once(source, partitions, artifacts, executor=None, force=False, keep=KEEP_RUNS):
+    """Sync partitions, then publish a new run if anything changed; returns its name or None"""
+    partitions.sync(source, executor=executor)
+    return artifacts.publish(partitions, executor=executor, force=force, keep=keep)
+
+
+def run_detached(*args):
+    """Run this job once in a fresh interpreter and wait for it; for callers inside the app
+
+    The worker pool then starts from a single-threaded process whose
+    __main__ is this module, not from the Streamlit server (see freight.jobs).
+    """
+    argv, env = module_command('freight.batch', *args)
+    subprocess.run(argv, env=env, check=True)
+
+
+def check_alerts(partitions, artifacts, run, rules, sink, state_root=None):
+    """Feed each entity's new component rows, then its forecasts, to the alert rules
+
+    Rule state (breaches under way, cooldowns) is kept per port and lane under
+    state_root, so each call only reads the rows added since the last one.
+    Returns the alerts raised.
+    """
+    state_root = Path(state_root or default_store_root() / 'alerts')
+    raised = []
+    for entity in artifacts.entities(run):
+        state = state_root / entity.path / 'state.json'
+        engine = AlertEngine(rules, scope=entity.label, sink=sink).load(state)
+        components = partitions.store(entity, 'components')
+        if not len(components):
+            continue
+        latest = components.latest(['date'])['date']
+        if engine.last_time is None:
+            start = latest - engine.lookback - pd.Timedelta(days=1)
+        else:
+            start = engine.last_time + pd.Timedelta(1)
+        for row in components.window(start=start).to_dict('records'):
+            raised += engine.observe(row['date'], row)
+        forecasts = artifacts.load(entity, run)['forecasts']
+        raised += engine.observe(engine.last_time, forecast_readings(forecasts))
+        engine.save(state)
+    return raised
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--every', type=float, help="keep running, publishing every SECONDS")
+    parser.add_argument('--force', action='store_true', help="publish even if no data changed")
+    parser.add_argument('--keep', type=int, default=KEEP_RUNS, help="published runs to keep")
+    parser.add_argument('--workers', type=int, help="worker processes (default: up to 4)")
+    parser.add_argument('--no-alerts', action='store_true', help="publish without checking alert rules")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+
+    partitions, artifacts = default_stores()
+    rules = [] if args.no_alerts else load_rules()
+    sink = default_sink() if rules else None
+    # Sized from the CPUs, not the entities: a fresh store has none until the first sync
+    workers = args.workers or min(4, os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers, mp_context=_worker_context()) as executor:
+        while True:
+            start = time.monotonic()
+            run = run_once(default_source(), partitions, artifacts, executor, args.force, args.keep)
+            if run is None:
+                log.info("no changes since %s", artifacts.current())
+            else:
+                log.info("published %s (%d entities) in %.1f s",
+                         run, len(artifacts.entities(run)), time.monotonic() - start)
+                if rules:
+                    alerts = check_alerts(partitions, artifacts, run, rules, sink)
+                    log.info("%d alerts raised", len(alerts))
+            if args.every is None:
+                return 0
+            time.sleep(max(args.every - (time.monotonic() - start), 0))
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+# — Chart Downsampling —
+#
+# Long series are thinned before they are charted, so a figure carries at
+# most a few thousand points whatever the history length. Points are picked
+# with MinMaxLTTB: each of a few times more buckets than wanted contributes
+# its minimum and maximum (so spikes survive), then Largest-Triangle-Three-
+# Buckets keeps, per output bucket, the point that best preserves the shape.
+#
+# For the rate and CCI history the publish step also stores a pyramid: the
+# series cut into FACTOR, FACTOR², ... times fewer buckets, keeping each
+# bucket's minimum and maximum, down to one screenful. A chart of a date
+# window thins the finest level with at most FACTOR screenfuls in it, and
+# only reads the full-resolution store once the window is narrow enough to
+# need it, so zooming in costs about the same as the overview.
+
+CHART_POINTS = 2_000    # Points per series sent to the browser
+MINMAX_RATIO = 4        # MinMax preselection keeps this many candidates per output point
+FACTOR = 8              # Size ratio between pyramid levels
+
+
+def lttb(x, y, points):
+    """Indices of `points` samples chosen by Largest-Triangle-Three-Buckets"""
+    size = len(y)
+    if points >= size or size < 3:
+        return np.arange(size)
+    if points < 3:
+        return np.array([0, size - 1])
+    x = np.asarray(x, dtype=np.float64)
+    x = x - x[0]
+    y = np.asarray(y, dtype=np.float64)
+    # points - 2 buckets over the interior, always keeping the first and last point
+    edges = np.linspace(1, size - 1, points - 1).astype(np.int64)
+    chosen = np.empty(points, dtype=np.int64)
+    chosen[0], chosen[-1] = 0, size - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(area.argmax())
+        chosen[i + 1] = a
+    return chosen
+
+
+def minmax_indices(y, buckets):
+    """Indices of the minimum and maximum of each of (at most) `buckets` equal runs of y"""
+    y = np.asarray(y)
+    size = len(y)
+    per = -(-size // buckets)
+    # Pad the last run with its final value; padded positions map back onto it
+    body = np.concatenate([y, np.repeat(y[-1:], per * buckets - size)]).reshape(buckets, per)
+    offsets = np.arange(buckets) * per
+    picked = np.concatenate([offsets + body.argmin(axis=1), offsets + body.argmax(axis=1)])
+    return np.minimum(picked, size - 1)
+
+
+def downsample(x, y, points=CHART_POINTS):
+    """Sorted indices of at most `points` samples that keep the series' shape and extremes"""
+    size = len(y)
+    if size <= points:
+        return np.arange(size)
+    if size > points * MINMAX_RATIO:
+        candidates = np.unique(np.concatenate([[0, size - 1], minmax_indices(y, points * MINMAX_RATIO // 2)]))
+    else:
+        candidates = np.arange(size)
+    return candidates[lttb(np.asarray(x)[candidates], np.asarray(y)[candidates], points)]
+
+
+def thin_frame(frame, x, columns, points=CHART_POINTS):
+    """Rows of frame that keep the shape of every column in columns, about `points` per column"""
+    if len(frame) <= points:
+        return frame
+    xs = frame[x].to_numpy().astype(np.int64) if frame[x].dtype.kind == 'M' else frame[x].to_numpy()
+    keep = np.unique(np.concatenate([downsample(xs, frame[name].to_numpy(), points) for name in columns]))
+    return frame.iloc[keep]
+
+
+def _as_ns(dates):
+    return np.asarray(dates, dtype='datetime64[ns]').astype(np.int64)
+
+
+class Pyramid:
+    """One series thinned by FACTOR per level, from 1/FACTOR of it down to one chart's worth"""
+
+    def __init__(self, levels, rows):
+        self.levels = levels    # [(dates as int64 ns, values)], finest first
+        self.rows = rows        # Length of the full-resolution series
+
+    @classmethod
+    def build(cls, dates, values, points=CHART_POINTS, factor=FACTOR):
+        x, y = _as_ns(dates), np.asarray(values, dtype=np.float64)
+        rows = len(y)
+        # A series that already fits one chart is kept whole, as the only level
+        levels = [(x, y)] if rows <= points else []
+        while len(y) > points:
+            # Two points per bucket, plus the endpoints
+            buckets = (max(len(y) // factor, points) - 2) // 2
+            keep = np.unique(np.concatenate([[0, len(y) - 1], minmax_indices(y, buckets)]))
+            x, y = x[keep], y[keep]
+            levels.append((x, y))
+        return cls(levels, rows)
+
+    def view(self, start=None, end=None, fetch=None, points=CHART_POINTS):
+        """(dates, values) of the series between start and end, at most `points` of them
+
+        Uses the finest stored level with at most FACTOR * points in the
+        window, thinned the rest of the way. When even the finest level is
+        sparse there, fetch(start, end) supplies the full-resolution
+        (dates, values) instead, if given.
+        """
+        lo_ns = None if start is None else _as_ns([start])[0]
+        hi_ns = None if end is None else _as_ns([end])[0]
+
+        def window(x, y):
+            lo = 0 if lo_ns is None else np.searchsorted(x, lo_ns, 'left')
+            hi = len(x) if hi_ns is None else np.searchsorted(x, hi_ns, 'right')
+            return x[lo:hi], y[lo:hi]
+
+        candidates = [window(x, y) for x, y in self.levels]
+        # How many full-resolution points each finest-level point stands for
+        density = self.rows / max(len(self.levels[0][0]), 1)
+        if fetch is not None and density > 1 and len(candidates[0][0]) * density <= points * FACTOR:
+            x, y = fetch(start, end)
+            x, y = _as_ns(x), np.asarray(y, dtype=np.float64)
+        else:
+            x, y = next((level for level in candidates if len(level[0]) <= points * FACTOR), candidates[-1])
+        keep = downsample(x, y, points)
+        return x[keep].astype('datetime64[ns]'), y[keep]
+
+    @property
+    def bounds(self):
+        """(first, last) date covered, or None for an empty series"""
+        if not len(self.levels[-1][0]):
+            return None
+        x = self.levels[-1][0]
+        return x[0].astype('datetime64[ns]'), x[-1].astype('datetime64[ns]')
+
+    def save(self, root):
+        """One .npy file per level array under root, for memory-mapped loading"""
+        root = Path(root)
+        root.mkdir(parents=True)
+        for i, (x, y) in enumerate(self.levels):
+            np.save(root / f"{i}.x.npy", x)
+            np.save(root / f"{i}.y.npy", y)
+        (root / 'pyramid.json').write_text(json.dumps({'rows': self.rows, 'levels': len(self.levels)}))
+
+    @classmethod
+    def load(cls, root):
+        root = Path(root)
+        meta = json.loads((root / 'pyramid.json').read_text())
+        levels = [
+            (np.load(root / f"{i}.x.npy", mmap_mode='r'), np.load(root / f"{i}.y.npy", mmap_mode='r'))
+            for i in range(meta['levels'])
+        ]
+        return cls(levels, meta['rows'])
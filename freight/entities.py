@@ -0,0 +1,160 @@
+import hashlib
+import json
+import re
+from concurrent.futures import wait
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from freight.features import derive_scores
+from freight.store import ComponentStore, _atomic_write_text, store_lock
+
+# — Ports and Lanes —
+#
+# Every table is split by (port, lane) and each piece stored as its own
+# ComponentStore:
+#
+#   root/MANIFEST.json                         source signature, entity list
+#   root/<port>/<lane>/{components,history,results}/
+#
+# A partition's stored signature is a hash of its own rows, so a re-sync
+# after new data for one port rewrites only that port's partitions, and
+# everything keyed on partition signatures (snapshots, figures) stays warm
+# for the rest. Scoring and writing fan out across an executor.
+
+DEFAULT_PORT = 'Chittagong'
+DEFAULT_LANE = 'All lanes'
+ENTITY_COLUMNS = ['port', 'lane']
+KINDS = ('components', 'history', 'results')
+READERS = {'components': 'read_components', 'history': 'read_history', 'results': 'read_results'}
+
+
+@dataclass(frozen=True, order=True)
+class Entity:
+    port: str = DEFAULT_PORT
+    lane: str = DEFAULT_LANE
+
+    @property
+    def label(self):
+        return f"{self.port} · {self.lane}"
+
+    @property
+    def path(self):
+        return Path(_slug(self.port)) / _slug(self.lane)
+
+
+DEFAULT_ENTITY = Entity()
+
+
+def _slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-') or '_'
+
+
+def fingerprint(df):
+    """Content hash of a partition's rows"""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(','.join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+def split_entities(df):
+    """{Entity: rows} for a table, without the port and lane columns
+
+    Rows missing a port or lane are assigned the default one.
+    """
+    if not set(ENTITY_COLUMNS) & set(df.columns):
+        return {DEFAULT_ENTITY: df}
+    df = df.copy()
+    df['port'] = df['port'].fillna(DEFAULT_PORT).astype(str) if 'port' in df.columns else DEFAULT_PORT
+    df['lane'] = df['lane'].fillna(DEFAULT_LANE).astype(str) if 'lane' in df.columns else DEFAULT_LANE
+    return {
+        Entity(port, lane): rows.drop(columns=ENTITY_COLUMNS).reset_index(drop=True)
+        for (port, lane), rows in df.groupby(ENTITY_COLUMNS, sort=True)
+    }
+
+
+def _write_partition(path, kind, rows, signature):
+    """Score (components only) and store one partition; runs in a worker"""
+    if kind == 'components':
+        rows = derive_scores(rows)
+    ComponentStore(path).write(rows, signature)
+    return signature
+
+
+class PartitionedStore:
+    """Per-(port, lane) component, history and results stores under one root"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._stores = {}
+        self._manifest_state = None
+        self._manifest = {'source_signature': None, 'entities': []}
+
+    def _read_manifest(self):
+        path = self.root / 'MANIFEST.json'
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return self._manifest
+        state = (stat.st_ino, stat.st_mtime_ns)
+        if state != self._manifest_state:
+            self._manifest = json.loads(path.read_text())
+            self._manifest_state = state
+        return self._manifest
+
+    def entities(self):
+        """Stored entities, sorted by port then lane"""
+        return [Entity(*pair) for pair in self._read_manifest()['entities']]
+
+    def store(self, entity, kind):
+        key = (entity, kind)
+        if key not in self._stores:
+            self._stores[key] = ComponentStore(self.root / entity.path / kind)
+        return self._stores[key]
+
+    def signature(self, entity):
+        """Changes only when one of this entity's partitions is rewritten"""
+        return tuple(self.store(entity, kind).source_signature for kind in KINDS)
+
+    def sync(self, source, executor=None):
+        """Re-partition the source if it changed; True if anything was rewritten
+
+        Tables that carry no port/lane columns while others do are shared by
+        every entity (e.g. one back-test table for all lanes).
+        """
+        signature = repr(source.signature())
+        if self._read_manifest()['source_signature'] == signature:
+            return False
+        with store_lock(self.root):
+            if self._read_manifest()['source_signature'] == signature:
+                return False
+            tables = {kind: getattr(source, READERS[kind])() for kind in KINDS}
+            parts = {kind: split_entities(df) for kind, df in tables.items()}
+            entities = sorted(set(parts['components']) | set(parts['history']))
+            for kind, df in tables.items():
+                if not set(ENTITY_COLUMNS) & set(df.columns):
+                    parts[kind] = {entity: df for entity in entities}
+
+            jobs = []
+            for kind, by_entity in parts.items():
+                for entity, rows in by_entity.items():
+                    partition = fingerprint(rows)
+                    path = self.root / entity.path / kind
+                    if ComponentStore(path).source_signature != partition:
+                        jobs.append((path, kind, rows, partition))
+            if executor is None:
+                for job in jobs:
+                    _write_partition(*job)
+            else:
+                futures = [executor.submit(_write_partition, *job) for job in jobs]
+                wait(futures)
+                for future in futures:
+                    future.result()
+
+            _atomic_write_text(self.root / 'MANIFEST.json', json.dumps({
+                'source_signature': signature,
+                'entities': [[e.port, e.lane] for e in entities],
+            }))
+        self._read_manifest()
+        return bool(jobs)
@@ -0,0 +1,319 @@
+"""Bulk export of published forecasts and history: python -m freight.export
+
+    python -m freight.export forecast --entity Chittagong/Asia-Europe -o rates.csv
+    python -m freight.export cci --start 2024-01-01 --format parquet -o cci.parquet
+    python -m freight.export --serve 8502      # GET /export/<dataset>.<format>?entity=...
+
+Datasets:
+
+- forecast: the published forecast over the longest horizon, with its
+  confidence interval and the Monte Carlo rate bands (band_p10, ...);
+- cci: daily port readings and CCI/GSI scores from the partitioned store;
+- backtest: the published back-test results (actual vs. predicted rates).
+
+Rows carry port and lane columns, and are filtered to --start/--end (dates,
+inclusive). Output is written chunk by chunk, as CSV, Parquet or Arrow IPC
+stream; the last two need pyarrow. The forecast and backtest datasets come
+from the live run at the time the export starts (see freight.artifacts), so
+a publish midway through does not mix two runs into one file. The cci
+dataset is not part of a run: it reads each port and lane's partition as
+synced when the export reaches it, which may be newer than the live run.
+"""
+import argparse
+import importlib.util
+import json
+import logging
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from freight.artifacts import BAND_QUANTILES
+
+log = logging.getLogger('freight.export')
+
+CCI_COLUMNS = ('date', 'vessel_count', 'avg_wait_time', 'berth_availability', 'CCI_Score', 'GSI_Score')
+DEFAULT_PORT = 8502
+
+
+# — Datasets —
+
+
+def _forecast_frames(entity, partitions, artifacts, run, start, end, size):
+    full, bands = artifacts.forecast(entity, run)
+    frame = full.frame()
+    for quantile, band in zip(BAND_QUANTILES, bands):
+        frame[f"band_p{round(quantile * 100)}"] = band
+    dates = frame['date']
+    keep = pd.Series(True, index=frame.index)
+    if start is not None:
+        keep &= dates >= pd.Timestamp(start)
+    if end is not None:
+        keep &= dates <= pd.Timestamp(end)
+    yield frame[keep].reset_index(drop=True)
+
+
+def _cci_frames(entity, partitions, artifacts, run, start, end, size):
+    store = partitions.store(entity, 'components')
+    columns = [name for name in CCI_COLUMNS if name in store.columns]
+    return store.chunks(start, end, columns, size)
+
+
+def _backtest_frames(entity, partitions, artifacts, run, start, end, size):
+    return artifacts.store(entity, 'results', run).chunks(start, end, size=size)
+
+
+DATASETS = {
+    'forecast': _forecast_frames,
+    'cci': _cci_frames,
+    'backtest': _backtest_frames,
+}
+
+
+def parse_entities(names, available):
+    """Entities named 'Port' (every lane) or 'Port/Lane'; all of available when names is empty"""
+    if not names:
+        return list(available)
+    selected = []
+    for name in names:
+        port, _, lane = name.partition('/')
+        matches = [e for e in available if e.port == port and lane in ('', e.lane)]
+        if not matches:
+            raise ValueError(f"no published data for {name!r}")
+        selected += [e for e in matches if e not in selected]
+    return selected
+
+
+def export_frames(dataset, partitions, artifacts, entities=(), start=None, end=None, size=None):
+    """Frames of one dataset for the named entities and date range, port and lane first
+
+    Pins the live run when iteration starts (cci pins each entity's store
+    version as its rows are first read instead); never holds more than one
+    chunk of rows. At least one (possibly empty) frame is produced, so
+    writers always see the columns.
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"unknown dataset {dataset!r}; expected one of {', '.join(DATASETS)}")
+    run = artifacts.current()
+    if run is None:
+        raise ValueError("nothing has been published yet (run python -m freight.batch)")
+    start = None if start is None else pd.Timestamp(start)
+    # Inclusive: the whole of the end date, not just its midnight reading
+    end = None if end is None else pd.Timestamp(end) + pd.Timedelta(days=1) - pd.Timedelta(1)
+    emitted, empty = False, None
+    for entity in parse_entities(entities, artifacts.entities(run)):
+        for frame in DATASETS[dataset](entity, partitions, artifacts, run, start, end, size):
+            frame = frame.reset_index(drop=True)
+            frame.insert(0, 'lane', entity.lane)
+            frame.insert(0, 'port', entity.port)
+            if len(frame):
+                emitted = True
+                yield frame
+            elif empty is None:
+                empty = frame
+    if not emitted and empty is not None:
+        yield empty
+
+
+# — Formats —
+
+
+def _plain(frame):
+    """Categoricals as plain strings, so every chunk shares one Arrow schema"""
+    categorical = [name for name, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+    return frame.astype({name: object for name in categorical}) if categorical else frame
+
+
+class _Pipe:
+    """Write-only file object whose contents are drained as they are produced"""
+
+    def __init__(self):
+        self._parts = []
+        self.closed = False
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data, self._parts = b''.join(self._parts), []
+        return data
+
+
+def csv_chunks(frames):
+    """CSV text; dates carry a time of day only where the chunk has one (hourly data and finer)"""
+    header = True
+    for frame in frames:
+        yield frame.to_csv(index=False, header=header).encode()
+        header = False
+
+
+def _arrow_chunks(frames, open_writer):
+    import pyarrow as pa
+
+    pipe, writer, schema = _Pipe(), None, None
+    for frame in frames:
+        table = pa.Table.from_pandas(_plain(frame), schema=schema, preserve_index=False)
+        if writer is None:
+            schema = table.schema
+            writer = open_writer(pipe, schema)
+        writer.write_table(table)
+        yield pipe.drain()
+    if writer is not None:
+        writer.close()
+        yield pipe.drain()
+
+
+def parquet_chunks(frames):
+    """Parquet file, one row group per chunk"""
+    import pyarrow.parquet as pq
+
+    return _arrow_chunks(frames, lambda pipe, schema: pq.ParquetWriter(pipe, schema))
+
+
+def arrow_chunks(frames):
+    """Arrow IPC stream, one record batch per chunk"""
+    import pyarrow as pa
+
+    return _arrow_chunks(frames, lambda pipe, schema: pa.ipc.new_stream(pipe, schema))
+
+
+# Format -> (encoder, content type, file suffix)
+FORMATS = {
+    'csv': (csv_chunks, 'text/csv', 'csv'),
+    'parquet': (parquet_chunks, 'application/vnd.apache.parquet', 'parquet'),
+    'arrow': (arrow_chunks, 'application/vnd.apache.arrow.stream', 'arrows'),
+}
+
+
+def export(dataset, fmt, partitions, artifacts, entities=(), start=None, end=None, size=None):
+    """Encoded export as an iterator of byte chunks"""
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    if fmt != 'csv' and importlib.util.find_spec('pyarrow') is None:
+        raise ValueError(f"{fmt} export needs pyarrow (pip install pyarrow)")
+    frames = export_frames(dataset, partitions, artifacts, entities, start, end, size)
+    # Validate the request (and find the columns) before the caller commits to a response
+    first = next(frames, None)
+    if first is None:
+        return iter(())
+    encode = FORMATS[fmt][0]
+    return (chunk for chunk in encode(_chain(first, frames)) if chunk)
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+# — HTTP Endpoint —
+
+
+class _ExportHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        partitions, artifacts = self.server.stores
+        if url.path == '/entities':
+            body = json.dumps([[e.port, e.lane] for e in artifacts.entities()]).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        name = url.path.removeprefix('/export/')
+        dataset, _, fmt = name.partition('.')
+        if name == url.path or fmt not in FORMATS:
+            self.send_error(404, "expected /export/<dataset>.<csv|parquet|arrow>")
+            return
+        try:
+            chunks = export(
+                dataset, fmt, partitions, artifacts, query.get('entity', ()),
+                query.get('start', [None])[0], query.get('end', [None])[0],
+            )
+        except ValueError as error:
+            self.send_error(400, str(error))
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', FORMATS[fmt][1])
+        self.send_header('Content-Disposition', f'attachment; filename="{dataset}.{FORMATS[fmt][2]}"')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for chunk in chunks:
+                self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except Exception:
+            # Too late for an error status: drop the connection so the client sees a short read
+            log.exception("export of %s failed midway", self.path)
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        log.info("%s %s", self.address_string(), format % args)
+
+
+class ExportServer(ThreadingHTTPServer):
+    """Local HTTP endpoint streaming exports as chunked responses
+
+    GET /entities                        published [port, lane] pairs, as JSON
+    GET /export/<dataset>.<format>       with optional entity= (repeatable), start=, end=
+    """
+
+    daemon_threads = True
+
+    def __init__(self, partitions, artifacts, host='127.0.0.1', port=DEFAULT_PORT):
+        super().__init__((host, port), _ExportHandler)
+        self.stores = (partitions, artifacts)
+
+
+def main(argv=None):
+    from freight.batch import default_stores
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('dataset', nargs='?', choices=list(DATASETS))
+    parser.add_argument('--format', default='csv', choices=list(FORMATS))
+    parser.add_argument('--entity', action='append', default=[], help="Port or Port/Lane; repeatable (default: all)")
+    parser.add_argument('--start', help="first date to include")
+    parser.add_argument('--end', help="last date to include")
+    parser.add_argument('-o', '--output', help="file to write (default: stdout)")
+    parser.add_argument('--serve', type=int, nargs='?', const=DEFAULT_PORT, metavar='PORT',
+                        help=f"serve exports over HTTP instead (default port {DEFAULT_PORT})")
+    parser.add_argument('--host', default='127.0.0.1', help="address to serve on")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+    partitions, artifacts = default_stores()
+
+    if args.serve is not None:
+        server = ExportServer(partitions, artifacts, args.host, args.serve)
+        log.info("serving exports on http://%s:%d", *server.server_address)
+        server.serve_forever()
+        return 0
+    if args.dataset is None:
+        parser.error("a dataset is required unless serving")
+    try:
+        chunks = export(args.dataset, args.format, partitions, artifacts, args.entity, args.start, args.end)
+    except ValueError as error:
+        parser.error(str(error))
+    out = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+
+from freight.synthetic import COMPONENT_COLUMNS, TOTAL_BERTHS
+
+# — CCI Feature Engineering —
+#
+# Every rolling statistic is a NumPy kernel over the whole series: trailing
+# means and variances from cumulative sums, EWMAs through pandas' compiled
+# recursive ewm (scipy.signal.lfilter is a little quicker, but importing it
+# adds over a second to every cold start). Windows are given in days and
+# scaled by the sampling rate, so the same code handles daily extracts and
+# years of hourly readings in one pass (10M rows in a few seconds). Inputs
+# must be free of NaNs.
+
+# Reference ranges used to scale raw components onto 0-1
+VESSEL_CAPACITY = 60.0
+MAX_WAIT_HOURS = 48.0
+FUEL_RANGE = (40.0, 140.0)
+RATE_VOL_CEILING = 0.25   # Daily log-rate volatility treated as maximal risk
+SEASONAL_GAIN = 2.5       # Risk per unit of 28-day rate above its yearly mean
+
+VOLATILITY_LEVELS = {'low': 0.25, 'moderate': 0.5, 'high': 0.75, 'extreme': 1.0}
+
+FEATURE_COLUMNS = [
+    'CCI_Score',
+    'GSI_Score',
+    'vessel_count',
+    'avg_wait_time',
+    'berth_availability',
+    'geopolitical_risk',
+    'weather_disruption',
+    'market_volatility',
+    'fuel_price',
+    'freight_rate',
+    'rate_7d',
+    'rate_28d',
+    'cci_7d',
+    'season_sin',
+    'season_cos',
+]
+
+# Radar-chart label -> 0-1 risk column
+RISK_AXES = {
+    'Port Congestion': 'congestion_risk',
+    'Weather Risk': 'weather_risk',
+    'Geopolitical<br>Tension': 'geopolitical_tension',
+    'Market Volatility': 'volatility_risk',
+    'Seasonal Demand': 'seasonal_demand',
+    'Fuel Costs': 'fuel_cost_risk',
+}
+
+
+def cci_score(vessel_count, avg_wait_time, berth_availability):
+    """Chittagong Congestion Index on a 0-1 scale"""
+    queue = np.clip(vessel_count / VESSEL_CAPACITY, 0, 1)
+    wait = np.clip(avg_wait_time / MAX_WAIT_HOURS, 0, 1)
+    berths = 1 - np.clip(berth_availability / TOTAL_BERTHS, 0, 1)
+    return (0.4 * queue + 0.35 * wait + 0.25 * berths).round(3)
+
+
+def fuel_cost_score(fuel_price):
+    low, high = FUEL_RANGE
+    return np.clip((fuel_price - low) / (high - low), 0, 1)
+
+
+def gsi_score(geopolitical_risk, market_volatility, fuel_price):
+    """Global Stress Index on a 0-1 scale"""
+    return ((geopolitical_risk / 10 + market_volatility + fuel_cost_score(fuel_price)) / 3).round(3)
+
+
+def volatility_levels(values):
+    """market_volatility as 0-1 floats, mapping level names ('moderate', ...)"""
+    if pd.api.types.is_numeric_dtype(values):
+        return np.asarray(values, dtype=float)
+    return np.array([
+        VOLATILITY_LEVELS.get(str(v).lower(), 0.5) if isinstance(v, str) else float(v)
+        for v in values
+    ])
+
+
+# — Rolling Kernels —
+
+
+def steps_per_day(dates):
+    """Rows per day of a regularly sampled, time-ordered date array"""
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    if len(dates) < 2:
+        return 1
+    step = np.median(np.diff(dates[:1000]).astype('int64'))
+    return max(1, int(round(86_400e9 / step))) if step > 0 else 1
+
+
+def _counts(n, window):
+    """Rows in view at each position of a trailing window"""
+    counts = np.full(n, float(window))
+    head = min(window, n)
+    counts[:head] = np.arange(1, head + 1)
+    return counts
+
+
+def rolling_mean(x, window):
+    """Trailing mean over `window` rows, over fewer rows at the start"""
+    x = np.asarray(x, dtype=float)
+    total = np.cumsum(x)
+    total[window:] = total[window:] - total[:-window]
+    head = min(window, len(x))
+    total[:head] /= np.arange(1, head + 1)
+    total[head:] /= window
+    return total
+
+
+def rolling_var(x, window):
+    """Trailing sample variance over `window` rows (0 where only one row is in view)"""
+    x = np.asarray(x, dtype=float)
+    # Centre first so the sum-of-squares difference doesn't cancel catastrophically
+    x = x - x.mean() if len(x) else x
+    count = _counts(len(x), window)
+    mean = rolling_mean(x, window)
+    var = rolling_mean(x * x, window)
+    var -= mean * mean
+    var *= count / np.maximum(count - 1, 1)
+    return np.maximum(var, 0, out=var)
+
+
+def ewma(x, span):
+    """Exponentially weighted mean with alpha = 2 / (span + 1), seeded at x[0]"""
+    x = np.asarray(x, dtype=float)
+    if not len(x):
+        return x
+    return pd.Series(x).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def day_of_year(dates):
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    return (dates.astype('datetime64[D]') - dates.astype('datetime64[Y]')).astype(int) + 1
+
+
+# — Feature Frames —
+
+
+def build_features(history):
+    """Add CCI/GSI scores, rolling context, seasonality and risk axes to a history
+
+    history is daily or finer (e.g. hourly) and holds at least the component
+    columns; rate features and the rate-based axes need freight_rate too.
+    """
+    dates = history['date'].to_numpy('datetime64[ns]')
+    if len(dates) > 1 and not (dates[1:] >= dates[:-1]).all():
+        history = history.sort_values('date')
+        dates = history['date'].to_numpy('datetime64[ns]')
+    history = history.reset_index(drop=True)
+    per_day = steps_per_day(dates)
+
+    vessels = history['vessel_count'].to_numpy(dtype=float)
+    wait = history['avg_wait_time'].to_numpy(dtype=float)
+    berths = history['berth_availability'].to_numpy(dtype=float)
+    geopolitical = history['geopolitical_risk'].to_numpy(dtype=float)
+    weather = history['weather_disruption'].to_numpy(dtype=float)
+    volatility = volatility_levels(history['market_volatility'])
+    fuel = history['fuel_price'].to_numpy(dtype=float)
+
+    cci = cci_score(vessels, wait, berths)
+    angle = 2 * np.pi / 365.25 * day_of_year(dates)
+    out = {
+        'CCI_Score': cci,
+        'GSI_Score': gsi_score(geopolitical, volatility, fuel),
+        'cci_7d': rolling_mean(cci, 7 * per_day),
+        'season_sin': np.sin(angle),
+        'season_cos': np.cos(angle),
+        # Risk axes, each on 0-1 with higher meaning riskier
+        'congestion_risk': cci,
+        'weather_risk': np.clip(ewma(weather, 3 * per_day), 0, 1),
+        'geopolitical_tension': np.clip(geopolitical / 10, 0, 1),
+        'volatility_risk': np.clip(volatility, 0, 1),
+        'fuel_cost_risk': fuel_cost_score(fuel),
+    }
+
+    if 'freight_rate' in history.columns:
+        rate = history['freight_rate'].to_numpy(dtype=float)
+        out['rate_7d'] = rolling_mean(rate, 7 * per_day)
+        out['rate_28d'] = rolling_mean(rate, 28 * per_day)
+        # Realised volatility of daily log changes, blended with the reported level
+        log_rate = np.log(np.maximum(rate, 1e-9))
+        daily_change = np.zeros_like(log_rate)
+        daily_change[per_day:] = log_rate[per_day:] - log_rate[:-per_day]
+        out['rate_vol_28d'] = np.sqrt(rolling_var(daily_change, 28 * per_day))
+        out['volatility_risk'] = 0.5 * out['volatility_risk'] + 0.5 * np.clip(out['rate_vol_28d'] / RATE_VOL_CEILING, 0, 1)
+        yearly = rolling_mean(rate, 365 * per_day)
+        out['seasonal_demand'] = np.clip(0.5 + SEASONAL_GAIN * (out['rate_28d'] / yearly - 1), 0, 1)
+    else:
+        # Without rates, fall back to the calendar: peak demand around the year end
+        out['seasonal_demand'] = 0.5 + 0.5 * out['season_cos']
+
+    kept = history.drop(columns=[c for c in out if c in history.columns])
+    return pd.concat([kept, pd.DataFrame(out, index=kept.index, copy=False)], axis=1)
+
+
+def derive_scores(components):
+    """Fill in the CCI/GSI scores and risk axes a raw component frame lacks
+
+    Frames that already carry them, or lack the raw columns to derive them
+    from, are returned unchanged. Rolling windows assume one port and lane.
+    """
+    derived_columns = ['CCI_Score', 'GSI_Score', *RISK_AXES.values()]
+    columns = set(components.columns)
+    if set(derived_columns) <= columns or not {'date', *COMPONENT_COLUMNS} <= columns:
+        return components
+    components = components.sort_values('date').reset_index(drop=True)
+    derived = build_features(components)
+    for column in derived_columns:
+        if column not in columns:
+            components[column] = derived[column].to_numpy()
+    return components
@@ -0,0 +1,302 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+# — Figure Builders —
+#
+# Pure functions from data to go.Figure, so the app can memoize the result.
+
+TEMPLATE = 'plotly_white'
+
+
+def impact_figure(quarters, cost_impact, savings_potential, template=TEMPLATE, height=400):
+    """Quarterly freight cost impact against the value of prediction"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=quarters,
+        y=cost_impact,
+        name='Rate Volatility Impact',
+        marker_color='#FF6B35',
+        text=[f'${x}M' for x in cost_impact],
+        textposition='outside'
+    ))
+
+    fig.add_trace(go.Bar(
+        x=quarters,
+        y=savings_potential,
+        name='Predictive Model Savings',
+        marker_color='#00D4AA',
+        text=[f'${x}M' for x in savings_potential],
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title='<b>Quarterly Freight Cost Impact vs. Prediction Value</b>',
+        xaxis_title='Quarter',
+        yaxis_title='Impact (USD Millions)',
+        template=template,
+        height=height,
+        showlegend=True,
+        barmode='group'
+    )
+    return fig
+
+
+def risk_radar_figure(categories, values, height=500):
+    """Closed radar of CCI risk factors on a 0-100% scale"""
+    categories, values = list(categories), list(values)
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=values + [values[0]],  # Close the shape
+        theta=categories + [categories[0]],
+        fill='toself',
+        fillcolor='rgba(0, 102, 204, 0.2)',
+        line=dict(color='rgba(0, 102, 204, 0.8)', width=3),
+        marker=dict(size=8, color='#0066CC'),
+        name='Current Risk Profile'
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                ticksuffix='%',
+                gridcolor='rgba(0, 0, 0, 0.1)'
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=12),
+                gridcolor='rgba(0, 0, 0, 0.1)'
+            )
+        ),
+        showlegend=False,
+        title='<b>Risk Factor Analysis Dashboard</b>',
+        height=height
+    )
+    return fig
+
+
+def backtest_figure(results, template=TEMPLATE, height=600):
+    """Predicted against actual rates, with the prediction error underneath"""
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.1,
+        subplot_titles=('Rate Predictions vs. Actual', 'Prediction Error Analysis'),
+        row_heights=[0.7, 0.3]
+    )
+
+    # Main prediction chart
+    fig.add_trace(
+        go.Scatter(
+            x=results['date'],
+            y=results['Actual Rate'],
+            name='Actual Market Rate',
+            mode='lines+markers',
+            line=dict(color='#0066CC', width=3),
+            marker=dict(size=6)
+        ),
+        row=1, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            x=results['date'],
+            y=results['Predicted Rate'],
+            name='CCI Prediction',
+            mode='lines+markers',
+            line=dict(color='#FF6B35', width=3, dash='dash'),
+            marker=dict(size=6)
+        ),
+        row=1, col=1
+    )
+
+    # Error analysis
+    errors = (results['Actual Rate'] - results['Predicted Rate']).to_numpy()
+    fig.add_trace(
+        go.Bar(
+            x=results['date'],
+            y=errors,
+            name='Prediction Error',
+            marker_color=np.where(errors >= 0, '#00D4AA', '#FF4757'),
+            showlegend=False
+        ),
+        row=2, col=1
+    )
+
+    fig.update_layout(
+        title='<b>Model Performance Analysis: 2024 Validation Results</b>',
+        height=height,
+        template=template,
+        hovermode='x unified'
+    )
+
+    fig.update_yaxes(title_text="Rate (USD)", row=1, col=1)
+    fig.update_yaxes(title_text="Error (USD)", row=2, col=1)
+    fig.update_xaxes(title_text="Month", row=2, col=1)
+    return fig
+
+
+def forecast_figure(history_dates, history_rates, forecast, band_low, band_median, band_high,
+                    template=TEMPLATE, height=400):
+    """Recent rate history, CCI forecast and Monte Carlo scenario band"""
+    fig = go.Figure()
+
+    # Historical context
+    fig.add_trace(go.Scatter(
+        x=history_dates,
+        y=history_rates,
+        mode='lines',
+        name='Recent History',
+        line=dict(color='#CBD5E1', width=2),
+        opacity=0.7
+    ))
+
+    # Forecast line
+    fig.add_trace(go.Scatter(
+        x=forecast.dates,
+        y=forecast.predicted[0],
+        mode='lines+markers',
+        name='CCI Forecast',
+        line=dict(color='#FF6B35', width=3),
+        marker=dict(size=6, color='#FF6B35')
+    ))
+
+    # Monte Carlo confidence band (10th-90th percentile of simulated paths)
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([forecast.dates, forecast.dates[::-1]]),
+        y=np.concatenate([band_high, band_low[::-1]]),
+        fill='toself',
+        fillcolor='rgba(255, 107, 53, 0.2)',
+        line=dict(color='rgba(255,255,255,0)'),
+        name='80% Scenario Band',
+        hoverinfo="skip"
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=forecast.dates,
+        y=band_median,
+        mode='lines',
+        name='Scenario Median',
+        line=dict(color='#FF6B35', width=1, dash='dot')
+    ))
+
+    fig.update_layout(
+        title='<b>Forward-Looking Freight Rate Forecast</b>',
+        xaxis_title='Date',
+        yaxis_title='Freight Rate (USD)',
+        template=template,
+        height=height,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def history_figure(rate_dates, rates, cci_dates, cci, template=TEMPLATE, height=450):
+    """Freight rate and CCI over a history window, rate on the left axis and CCI on the right"""
+    fig = make_subplots(specs=[[{'secondary_y': True}]])
+
+    fig.add_trace(go.Scattergl(
+        x=rate_dates,
+        y=rates,
+        mode='lines',
+        name='Freight Rate',
+        line=dict(color='#0066CC', width=2)
+    ), secondary_y=False)
+
+    fig.add_trace(go.Scattergl(
+        x=cci_dates,
+        y=cci,
+        mode='lines',
+        name='CCI Score',
+        line=dict(color='#FF6B35', width=1.5),
+        opacity=0.8
+    ), secondary_y=True)
+
+    fig.update_layout(
+        title='<b>Freight Rate & Port Congestion History</b>',
+        template=template,
+        height=height,
+        hovermode='x unified'
+    )
+    fig.update_yaxes(title_text="Rate (USD)", secondary_y=False)
+    fig.update_yaxes(title_text="CCI Score", range=[0, 1], secondary_y=True)
+    return fig
+
+
+# — Figure Cache —
+#
+# Building a figure (make_subplots, template resolution, trace validation)
+# costs far more than sending it, so built figures are kept process-wide and
+# shared by every session. Entries are keyed on (kind, data version, params)
+# and weighed by their serialised size; the least recently used go first
+# once the byte budget is exceeded.
+
+DEFAULT_FIGURE_BUDGET = 64 * 2**20
+
+
+class FigureCache:
+    """Thread-safe LRU of built figures, bounded by total JSON size"""
+
+    def __init__(self, max_bytes=DEFAULT_FIGURE_BUDGET):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (figure, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def get(self, key):
+        """Cached figure for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, figure):
+        """Store figure under key, evicting least recently used entries to fit"""
+        nbytes = len(pio.to_json(figure, validate=False))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if nbytes > self.max_bytes:
+                return figure
+            self._entries[key] = (figure, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, size) = self._entries.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+        return figure
+
+    def get_or_build(self, key, build):
+        """Cached figure for key, calling build() to make it on a miss
+
+        Figures are shared between sessions and must be treated as read-only.
+        """
+        figure = self.get(key)
+        if figure is None:
+            figure = self.put(key, build())
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# — Forward Forecast Engine —
+#
+# Point forecasts and confidence bands for every scenario and every day of
+# the horizon come out of one vectorised pass, shaped (scenarios, horizon).
+
+HORIZONS = (7, 14, 30, 90)
+FORECAST_SEED = 2025
+
+RATE_FLOOR = 3.0          # Floor at $3
+LOWER_BAND_FLOOR = 2.5
+UPPER_BAND_PAD = 0.5
+
+TREND_PER_DAY = 0.05 / 14  # Slight upward trend
+DAILY_NOISE = 0.15
+BAND_BASE = 0.3
+BAND_STEP = 0.02           # Increasing uncertainty over time
+
+
+@dataclass(frozen=True)
+class Forecast:
+    dates: np.ndarray       # (horizon,) datetime64[ns]
+    predicted: np.ndarray   # (scenarios, horizon)
+    lower: np.ndarray
+    upper: np.ndarray
+
+    @property
+    def horizon(self):
+        return len(self.dates)
+
+    def head(self, days):
+        """The first `days` of every scenario, sharing memory with this one"""
+        return Forecast(self.dates[:days], self.predicted[:, :days], self.lower[:, :days], self.upper[:, :days])
+
+    def frame(self, scenario=0):
+        """One scenario in the forecast_df layout the verdict page plots"""
+        return pd.DataFrame({
+            'date': self.dates,
+            'predicted_rate': self.predicted[scenario],
+            'confidence_lower': self.lower[scenario],
+            'confidence_upper': self.upper[scenario],
+        })
+
+
+def forecast(base_price, base_date, horizon=14, drift=TREND_PER_DAY, scenarios=1, seed=FORECAST_SEED):
+    """Seeded forecast for `scenarios` paths over `horizon` days after base_date
+
+    base_price and drift may be scalars or (scenarios,) arrays, so a batch of
+    what-if starting points is evaluated together.
+    """
+    rng = np.random.default_rng(seed)
+    steps = np.arange(horizon)
+    base_price = np.asarray(base_price, dtype=float).reshape(-1, 1)
+    drift = np.asarray(drift, dtype=float).reshape(-1, 1)
+    scenarios = max(scenarios, len(base_price), len(drift))
+
+    price = base_price + drift * steps + rng.normal(0, DAILY_NOISE, (scenarios, horizon))
+    band = BAND_BASE + BAND_STEP * steps
+    dates = pd.Timestamp(base_date).to_datetime64().astype('datetime64[ns]') + (steps + 1) * np.timedelta64(1, 'D')
+
+    return Forecast(
+        dates=dates,
+        predicted=np.maximum(price, RATE_FLOOR),
+        lower=np.maximum(price - band, LOWER_BAND_FLOOR),
+        upper=price + band + UPPER_BAND_PAD,
+    )
+
+
+def forecast_horizons(base_price, base_date, horizons=HORIZONS, **kwargs):
+    """{horizon: Forecast} for several horizons from a single pass over the longest
+
+    Shorter horizons are prefixes of the longest, so they agree day-for-day.
+    """
+    full = forecast(base_price, base_date, horizon=max(horizons), **kwargs)
+    return {h: full.head(h) for h in horizons}
@@ -0,0 +1,160 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+
+# — Instrumentation —
+#
+# Opt-in timing of the hot paths: set FREIGHT_PROFILE=1 before the server
+# starts. Named spans (data loads, forecasts, page blocks, charts) add to
+# process-wide totals and to a per-rerun trace; cache wrappers count hits
+# and misses per function. Totals are dumped every DUMP_EVERY seconds as
+# JSON and Prometheus text, one pair of files per server process, under
+# FREIGHT_METRICS_DIR (default: metrics/ in the store directory).
+#
+# Disabled, span() hands back one shared no-op context manager (and
+# views.profiling.cache_data is plain st.cache_data), so the instrumented
+# code pays a global lookup and a call at most. Only the standard library is
+# imported here: app.py loads this before anything heavy.
+
+ENABLED = os.environ.get('FREIGHT_PROFILE', '') not in ('', '0')
+DUMP_EVERY = 10.0       # Seconds between metric dumps
+
+_NOOP = nullcontext()
+_trace = ContextVar('freight_trace', default=None)      # (start, [(span, offset s, seconds)]) of this rerun
+
+
+class Registry:
+    """Process-wide span totals and cache counters"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans = {}         # name -> [count, total seconds, max seconds]
+        self.caches = {}        # function -> [hits, misses]
+        self._dumped = 0.0
+
+    def record(self, name, seconds):
+        with self._lock:
+            stats = self.spans.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def cache_call(self, function, hit):
+        with self._lock:
+            self.caches.setdefault(function, [0, 0])[0 if hit else 1] += 1
+
+    def snapshot(self):
+        """JSON-ready copy of every total"""
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'time': time.time(),
+                'spans': {
+                    name: {'count': count, 'seconds': total, 'max_seconds': peak}
+                    for name, (count, total, peak) in sorted(self.spans.items())
+                },
+                'caches': {
+                    function: {'hits': hits, 'misses': misses}
+                    for function, (hits, misses) in sorted(self.caches.items())
+                },
+            }
+
+    def prometheus(self):
+        """Totals in the Prometheus text exposition format"""
+        data = self.snapshot()
+        lines = [
+            "# HELP freight_span_seconds Time spent in instrumented spans.",
+            "# TYPE freight_span_seconds summary",
+        ]
+        for name, stats in data['spans'].items():
+            lines.append(f'freight_span_seconds_count{{span="{name}"}} {stats["count"]}')
+            lines.append(f'freight_span_seconds_sum{{span="{name}"}} {stats["seconds"]:.6f}')
+        lines += [
+            "# HELP freight_span_seconds_max Longest single pass through each span.",
+            "# TYPE freight_span_seconds_max gauge",
+        ]
+        lines += [f'freight_span_seconds_max{{span="{name}"}} {s["max_seconds"]:.6f}' for name, s in data['spans'].items()]
+        for kind in ('hits', 'misses'):
+            lines += [
+                f"# HELP freight_cache_{kind}_total Cached function calls answered {'from' if kind == 'hits' else 'without'} the cache.",
+                f"# TYPE freight_cache_{kind}_total counter",
+            ]
+            lines += [f'freight_cache_{kind}_total{{function="{f}"}} {c[kind]}' for f, c in data['caches'].items()]
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, root=None, force=False):
+        """Write <pid>.json and <pid>.prom under root, at most every DUMP_EVERY seconds"""
+        now = time.monotonic()
+        if not force and now - self._dumped < DUMP_EVERY:
+            return None
+        self._dumped = now
+        root = Path(root or metrics_dir())
+        root.mkdir(parents=True, exist_ok=True)
+        for suffix, text in (('json', json.dumps(self.snapshot(), indent=2)), ('prom', self.prometheus())):
+            fd, tmp = tempfile.mkstemp(dir=root, prefix=f".{os.getpid()}.")
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(tmp, root / f"{os.getpid()}.{suffix}")
+        return root
+
+
+REGISTRY = Registry()
+
+
+def metrics_dir():
+    """FREIGHT_METRICS_DIR, or metrics/ in the store directory
+
+    Resolves the store directory as freight.store.default_store_root does,
+    without importing numpy and pandas along with it.
+    """
+    if os.environ.get('FREIGHT_METRICS_DIR'):
+        return Path(os.environ['FREIGHT_METRICS_DIR'])
+    store = os.environ.get('FREIGHT_STORE_DIR') or Path(tempfile.gettempdir()) / 'freight-store'
+    return Path(store) / 'metrics'
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        REGISTRY.record(self.name, end - self.start)
+        trace = _trace.get()
+        if trace is not None:
+            trace[1].append((self.name, self.start - trace[0], end - self.start))
+        return False
+
+
+def span(name):
+    """Context manager timing the block under name; a shared no-op when disabled"""
+    return _Span(name) if ENABLED else _NOOP
+
+
+def start_trace():
+    """Begin this rerun's trace (a no-op when disabled)"""
+    if ENABLED:
+        _trace.set((time.perf_counter(), []))
+
+
+def end_trace():
+    """Record the rerun's total time, dump the totals if due; returns the rerun's spans"""
+    trace = _trace.get()
+    if not ENABLED or trace is None:
+        return []
+    start, spans = trace
+    REGISTRY.record('rerun', time.perf_counter() - start)
+    REGISTRY.dump()
+    _trace.set(None)
+    return spans
@@ -0,0 +1,157 @@
+import argparse
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from freight.training import STAGES, data_fingerprint, run_pipeline
+
+# — Background Model Validation —
+#
+# The Streamlit server is multi-threaded, and forking it can leave a child
+# holding a lock some other thread was mid-way through; spawned or
+# forkserver workers would instead re-run app.py, which Streamlit registers
+# as __main__. So the server never starts a process pool itself: each
+# validation job (and the first publish, see views.data) runs in a fresh
+# interpreter started with python -m, which owns the pool.
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _worker_context():
+    # Only used from python -m entry points, whose __main__ is an importable
+    # module, so workers start from a clean interpreter rather than a fork
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def module_command(module, *args):
+    """(argv, env) running python -m module with this checkout importable"""
+    path = os.pathsep.join(filter(None, [str(ROOT), os.environ.get('PYTHONPATH')]))
+    return [sys.executable, '-m', module, *args], dict(os.environ, PYTHONPATH=path)
+
+
+class ValidationJob:
+    """Handle on one background training run, safe to poll from any session"""
+
+    def __init__(self, data_hash):
+        self.data_hash = data_hash
+        self.label = STAGES[0]
+        self.fraction = 0.0
+        self.future = None
+
+    def update(self, label, fraction):
+        self.label = label
+        self.fraction = fraction
+
+    @property
+    def done(self):
+        return self.future is not None and self.future.done()
+
+    @property
+    def failed(self):
+        return self.done and self.future.exception() is not None
+
+    @property
+    def succeeded(self):
+        return self.done and self.future.exception() is None
+
+    @property
+    def error(self):
+        return self.future.exception() if self.done else None
+
+    def result(self):
+        return self.future.result()
+
+
+class JobRunner:
+    """Runs validation jobs off the script thread, one job per distinct dataset
+
+    Each job is coordinated by a light thread that runs the pipeline in a
+    worker interpreter (python -m freight.jobs) and relays its progress.
+    Sessions submitting the same data get the same job, so concurrent
+    viewers never train twice.
+    """
+
+    def __init__(self, max_workers=None, max_jobs=4):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._threads = ThreadPoolExecutor(max_jobs, thread_name_prefix='cci-validation')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, history, origins=None):
+        """Start (or join) the validation job for this history and back-test mode
+
+        origins selects a walk-forward back-test (see training.run_pipeline).
+        """
+        key = (data_fingerprint(history), origins)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.failed:
+                job = ValidationJob(key[0])
+                job.future = self._threads.submit(self._run, job, history, origins)
+                self._jobs[key] = job
+        return job
+
+    def _run(self, job, history, origins):
+        with tempfile.TemporaryDirectory(prefix='cci-validation-') as tmp:
+            tmp = Path(tmp)
+            with open(tmp / 'history.pkl', 'wb') as f:
+                pickle.dump(history, f)
+            argv, env = module_command(
+                'freight.jobs', str(tmp), origins or '', '--workers', str(self.max_workers)
+            )
+            with subprocess.Popen(argv, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as worker:
+                # One "fraction<TAB>label" line per stage
+                for line in worker.stdout:
+                    fraction, _, label = line.rstrip('\n').partition('\t')
+                    job.update(label, float(fraction))
+                error = worker.stderr.read()
+            try:
+                with open(tmp / 'result.pkl', 'rb') as f:
+                    result = pickle.load(f)
+            except FileNotFoundError:
+                lines = error.strip().splitlines()
+                raise RuntimeError(lines[-1] if lines else f"validation worker exited with {worker.returncode}")
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def shutdown(self):
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    """Worker entry point: python -m freight.jobs DIR ORIGINS [--workers N]
+
+    Reads DIR/history.pkl, reports progress on stdout and leaves the trained
+    model (or the exception that stopped it) in DIR/result.pkl.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('dir', type=Path)
+    parser.add_argument('origins')
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args(argv)
+    with open(args.dir / 'history.pkl', 'rb') as f:
+        history = pickle.load(f)
+
+    def report(label, fraction):
+        print(f"{fraction}\t{label}", flush=True)
+
+    with ProcessPoolExecutor(args.workers, mp_context=_worker_context()) as executor:
+        try:
+            result = run_pipeline(history, on_stage=report, executor=executor, origins=args.origins or None)
+        except Exception as error:
+            result = error
+    with open(args.dir / 'result.pkl', 'wb') as f:
+        pickle.dump(result, f)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
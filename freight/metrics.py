@@ -0,0 +1,218 @@
+import json
+from collections import deque
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+from freight.store import _atomic_write_text
+
+# — Incremental Back-Test Metrics —
+#
+# R², MAE and RMSE only need a handful of running sums, so they are kept as
+# an accumulator that absorbs new actuals in batches instead of rescanning
+# the whole back-test. The spread of the actuals (for R²) is merged with
+# Chan's parallel update, which stays accurate where sum(y²) - n·mean² would
+# cancel badly. Per-month buckets and the last ROLLING_WINDOW absolute
+# errors are kept the same way, so every figure the verdict page shows is a
+# constant-time read.
+#
+# A fingerprint of the rows absorbed so far (a sum of per-row hashes, so it
+# extends batch by batch like the rest) tells a persisted accumulator
+# whether the back-test it was built from has been edited since.
+
+ROLLING_WINDOW = 30
+
+
+@dataclass
+class ErrorStats:
+    count: int = 0
+    mean: float = 0.0   # Mean actual rate
+    m2: float = 0.0     # Sum of squared deviations of actuals from their mean
+    sae: float = 0.0    # Sum of absolute errors
+    sse: float = 0.0    # Sum of squared errors
+
+    def update(self, actual, predicted):
+        """Absorb a batch of (actual, predicted) pairs"""
+        actual = np.asarray(actual, dtype=float)
+        if not len(actual):
+            return self
+        error = actual - np.asarray(predicted, dtype=float)
+        mean = actual.mean()
+        return self.merge(ErrorStats(
+            len(actual), float(mean), float(((actual - mean) ** 2).sum()),
+            float(np.abs(error).sum()), float((error ** 2).sum()),
+        ))
+
+    def merge(self, other):
+        """Absorb the rows another accumulator has seen"""
+        if not other.count:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.sae += other.sae
+        self.sse += other.sse
+        return self
+
+    @property
+    def r2(self):
+        return 1 - self.sse / self.m2 if self.m2 else float('nan')
+
+    @property
+    def mae(self):
+        return self.sae / self.count if self.count else float('nan')
+
+    @property
+    def rmse(self):
+        return (self.sse / self.count) ** 0.5 if self.count else float('nan')
+
+
+def rows_fingerprint(dates, actual, predicted):
+    """Hash of a set of (date, actual, predicted) rows; fingerprints of disjoint batches add up mod 2**64"""
+    rows = pd.DataFrame({
+        'date': np.asarray(pd.to_datetime(dates), dtype='datetime64[ns]').view('int64'),
+        'actual': np.asarray(actual, dtype=float),
+        'predicted': np.asarray(predicted, dtype=float),
+    })
+    return int(pd.util.hash_pandas_object(rows, index=False).to_numpy().sum(dtype=np.uint64))
+
+
+def _monthly_stats(dates, actual, predicted):
+    """('YYYY-MM', ErrorStats) of each calendar month in a date-ordered batch
+
+    Rows are in date order, so each month is one run of rows and every sum
+    is a single np.add.reduceat pass, whatever the number of months.
+    """
+    codes = dates.year.to_numpy() * 12 + dates.month.to_numpy() - 1
+    starts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+    counts = np.diff(np.append(starts, len(codes)))
+    means = np.add.reduceat(actual, starts) / counts
+    error = actual - predicted
+    m2 = np.add.reduceat((actual - np.repeat(means, counts)) ** 2, starts)
+    sae = np.add.reduceat(np.abs(error), starts)
+    sse = np.add.reduceat(error ** 2, starts)
+    for i, code in enumerate(codes[starts]):
+        month = f"{code // 12:04d}-{code % 12 + 1:02d}"
+        yield month, ErrorStats(int(counts[i]), float(means[i]), float(m2[i]), float(sae[i]), float(sse[i]))
+
+
+class BacktestMetrics:
+    """Running back-test metrics, extended only with rows newer than last_date"""
+
+    def __init__(self, window=ROLLING_WINDOW):
+        self.window = window
+        self.overall = ErrorStats()
+        self.monthly = {}                   # 'YYYY-MM' -> ErrorStats
+        self.recent = deque(maxlen=window)  # Absolute errors of the latest rows
+        self.last_date = None
+        self.fingerprint = 0                # rows_fingerprint of every absorbed row
+
+    @classmethod
+    def from_results(cls, results, window=ROLLING_WINDOW):
+        metrics = cls(window)
+        metrics.extend(results)
+        return metrics
+
+    def update(self, dates, actual, predicted):
+        """Absorb a batch of rows, all dated after last_date"""
+        dates = pd.DatetimeIndex(pd.to_datetime(dates))
+        if not len(dates):
+            return
+        if not dates.is_monotonic_increasing or (self.last_date is not None and dates[0] <= self.last_date):
+            raise ValueError("back-test rows must be in date order and newer than the accumulated ones")
+        actual = np.asarray(actual, dtype=float)
+        predicted = np.asarray(predicted, dtype=float)
+
+        self.overall.update(actual, predicted)
+        for month, stats in _monthly_stats(dates, actual, predicted):
+            self.monthly.setdefault(month, ErrorStats()).merge(stats)
+        self.recent.extend(np.abs(actual - predicted)[-self.window:].tolist())
+        self.last_date = dates[-1]
+        self.fingerprint = (self.fingerprint + rows_fingerprint(dates, actual, predicted)) % 2**64
+
+    def extend(self, results):
+        """Absorb the rows of a results table not yet seen; returns how many"""
+        if self.last_date is not None:
+            results = results[results['date'] > self.last_date]
+        self.update(results['date'], results['Actual Rate'], results['Predicted Rate'])
+        return len(results)
+
+    @property
+    def r2(self):
+        return self.overall.r2
+
+    @property
+    def mae(self):
+        return self.overall.mae
+
+    @property
+    def rolling_mae(self):
+        """MAE over the last `window` back-test rows"""
+        return float(np.mean(self.recent)) if self.recent else float('nan')
+
+    def monthly_frame(self):
+        """Per-month count, MAE, RMSE and R²"""
+        return pd.DataFrame(
+            [(month, s.count, s.mae, s.rmse, s.r2) for month, s in self.monthly.items()],
+            columns=['month', 'count', 'mae', 'rmse', 'r2'],
+        )
+
+    # — Persistence —
+
+    def to_dict(self):
+        return {
+            'window': self.window,
+            'overall': asdict(self.overall),
+            'monthly': {month: asdict(s) for month, s in self.monthly.items()},
+            'recent': list(self.recent),
+            'last_date': None if self.last_date is None else self.last_date.isoformat(),
+            'fingerprint': self.fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        metrics = cls(data['window'])
+        metrics.overall = ErrorStats(**data['overall'])
+        metrics.monthly = {month: ErrorStats(**s) for month, s in data['monthly'].items()}
+        metrics.recent.extend(data['recent'])
+        metrics.last_date = None if data['last_date'] is None else pd.Timestamp(data['last_date'])
+        # None for accumulators saved before fingerprints, which are then rebuilt
+        metrics.fingerprint = data.get('fingerprint')
+        return metrics
+
+    def save(self, path):
+        _atomic_write_text(path, json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path):
+        """Metrics saved at path, or None if there are none"""
+        try:
+            return cls.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+
+
+def sync_metrics(path, results):
+    """Persisted metrics for results, extended with any rows newer than the saved ones
+
+    The saved accumulator is only reused if results still holds exactly the
+    rows it has seen (same count and fingerprint); an edited or truncated
+    back-test is re-accumulated.
+    """
+    metrics = BacktestMetrics.load(path)
+    if metrics is not None and metrics.last_date is not None:
+        seen = results[results['date'] <= metrics.last_date]
+        if len(seen) != metrics.overall.count or metrics.fingerprint != rows_fingerprint(
+            seen['date'], seen['Actual Rate'], seen['Predicted Rate']
+        ):
+            metrics = None
+    if metrics is None:
+        metrics = BacktestMetrics.from_results(results)
+    elif not metrics.extend(results):
+        return metrics
+    path.parent.mkdir(parents=True, exist_ok=True)
+    metrics.save(path)
+    return metrics
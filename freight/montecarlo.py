@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from freight.features import VOLATILITY_LEVELS
+from freight.forecast import FORECAST_SEED, RATE_FLOOR, TREND_PER_DAY
+
+# — Monte Carlo Freight-Rate Scenarios —
+#
+# Rates follow a mean-reverting log process around the forecast trend. Daily
+# volatility scales with market volatility, weather and geopolitical risk,
+# congestion (CCI) tilts the drift, and geopolitical risk drives the rate
+# of upward jump shocks. All paths are simulated together as one
+# (paths, horizon) float32 array; the only Python loop is over days.
+#
+# The buffer is laid out day-major, (horizon, paths), and handed back
+# transposed: each day's update is a contiguous write and the per-day
+# quantiles reduce over contiguous memory.
+
+DEFAULT_PATHS = 100_000
+DEFAULT_QUANTILES = (0.05, 0.10, 0.50, 0.90, 0.95)
+
+BASE_SIGMA = 0.010       # Daily log-rate volatility in calm conditions
+REVERSION = 0.05         # Daily pull of shocks back toward the trend
+CCI_DRIFT = 0.002        # Daily log drift per unit of CCI above neutral
+JUMP_RATE = 0.002        # Daily jump probability per point of geopolitical risk
+JUMP_MEAN, JUMP_STD = 0.04, 0.03
+
+
+@dataclass(frozen=True)
+class ScenarioInputs:
+    base_rate: float
+    cci: float = 0.5
+    geopolitical_risk: float = 5.0   # 0-10
+    weather_disruption: float = 0.3  # 0-1
+    market_volatility: float = 0.5   # 0-1
+
+    @property
+    def sigma(self):
+        return BASE_SIGMA * (1 + self.market_volatility + 0.6 * self.weather_disruption + 0.04 * self.geopolitical_risk)
+
+    @property
+    def drift(self):
+        return TREND_PER_DAY / self.base_rate + CCI_DRIFT * (self.cci - 0.5)
+
+    @property
+    def jump_probability(self):
+        return JUMP_RATE * self.geopolitical_risk
+
+
+def inputs_from_components(latest, base_rate):
+    """ScenarioInputs from a component snapshot (a row of components_df)"""
+    volatility = latest.get('market_volatility', 0.5)
+    if isinstance(volatility, str):
+        volatility = VOLATILITY_LEVELS.get(volatility.lower(), 0.5)
+    return ScenarioInputs(
+        base_rate=float(base_rate),
+        cci=float(latest.get('CCI_Score', 0.5)),
+        geopolitical_risk=float(latest.get('geopolitical_risk', 5.0)),
+        weather_disruption=float(latest.get('weather_disruption', 0.3)),
+        market_volatility=float(volatility),
+    )
+
+
+def _simulate_into(out, inputs, seed):
+    """Fill the day-major buffer out (horizon, paths) with simulated rates"""
+    horizon, paths = out.shape
+    rng = np.random.default_rng(seed)
+    sigma = np.float32(inputs.sigma)
+    decay = np.float32(1 - REVERSION)
+
+    shock = np.zeros(paths, dtype=np.float32)
+    noise = np.empty(paths, dtype=np.float32)
+    for day in range(horizon):
+        rng.standard_normal(out=noise, dtype=np.float32)
+        noise *= sigma
+        shock *= decay
+        shock += noise
+        # Draw how many paths jump today, then where, rather than a uniform per path
+        jumps = rng.binomial(paths, inputs.jump_probability)
+        if jumps:
+            shock[rng.integers(0, paths, jumps)] += rng.normal(JUMP_MEAN, JUMP_STD, jumps).astype(np.float32)
+        out[day] = shock
+
+    trend = np.log(inputs.base_rate) + inputs.drift * np.arange(1, horizon + 1, dtype=np.float32)
+    out += trend[:, None]
+    np.exp(out, out=out)
+    np.maximum(out, RATE_FLOOR, out=out)
+    return out
+
+
+def _simulate_shard(shm_name, shape, start, stop, inputs, seed):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        _simulate_into(block[:, start:stop], inputs, seed)
+    finally:
+        shm.close()
+
+
+def simulate(inputs, horizon=90, paths=DEFAULT_PATHS, seed=FORECAST_SEED, executor=None, shards=None):
+    """Simulated rate paths as a (paths, horizon) float32 array
+
+    With an executor the paths are split into shards, each with an
+    independent child seed, written by worker processes straight into shared
+    memory, so nothing large is pickled back.
+    """
+    if executor is None:
+        return _simulate_into(np.empty((horizon, paths), dtype=np.float32), inputs, seed).T
+
+    shards = shards or getattr(executor, '_max_workers', 1)
+    bounds = np.linspace(0, paths, shards + 1, dtype=int)
+    seeds = np.random.SeedSequence(seed).spawn(shards)
+    shape = (horizon, paths)
+    shm = shared_memory.SharedMemory(create=True, size=paths * horizon * 4)
+    try:
+        futures = [
+            executor.submit(_simulate_shard, shm.name, shape, lo, hi, inputs, child)
+            for lo, hi, child in zip(bounds[:-1], bounds[1:], seeds)
+        ]
+        for future in futures:
+            future.result()
+        return np.ndarray(shape, dtype=np.float32, buffer=shm.buf).copy().T
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def quantile_bands(paths, quantiles=DEFAULT_QUANTILES):
+    """(len(quantiles), horizon) empirical quantiles across paths"""
+    # Reduce along the transposed view: contiguous for arrays from simulate()
+    return np.quantile(paths.T, quantiles, axis=1)
@@ -0,0 +1,108 @@
+from bisect import bisect_left, bisect_right
+
+import pandas as pd
+
+from freight.features import RISK_AXES, build_features, fuel_cost_score
+
+# — Risk Percentiles —
+#
+# Each radar axis shows where the latest reading sits within the trailing
+# RISK_WINDOW_DAYS of that axis's history, as a percentile. The window is
+# sorted once when the profile is built or loaded, so a lookup is two binary
+# searches.
+
+RISK_WINDOW_DAYS = 365
+WARMUP_DAYS = 365   # Extra history so the yearly rolling features are settled
+
+
+class RankIndex:
+    """Sorted trailing window of one series, for O(log n) percentile ranks"""
+
+    def __init__(self, values):
+        self._sorted = sorted(float(v) for v in values)
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def percentile(self, value):
+        """Percentage of the window below value, counting ties as half"""
+        if not self._sorted:
+            return 50.0
+        below = bisect_left(self._sorted, value)
+        at_or_below = bisect_right(self._sorted, value)
+        return 100.0 * (below + at_or_below) / (2 * len(self._sorted))
+
+
+# Axis -> (raw column it can be derived from, derivation), for rows that only carry raw readings
+DERIVED_AXES = {
+    'congestion_risk': ('CCI_Score', float),
+    'geopolitical_tension': ('geopolitical_risk', lambda risk: risk / 10),
+    'weather_risk': ('weather_disruption', float),
+    'fuel_cost_risk': ('fuel_price', fuel_cost_score),
+}
+
+
+def axis_readings(row):
+    """Values for the DERIVED_AXES carried by a components row or port snapshot
+
+    The other axes (seasonal demand, volatility) are scored from the freight
+    rate in the history, which a components row lacks; its stand-in values
+    would not be comparable with the ranked window, so they are left out.
+    """
+    readings = {}
+    for column, (raw, derive) in DERIVED_AXES.items():
+        value = row.get(column)
+        if value is None:
+            value = row.get(raw)
+            value = None if value is None else derive(value)
+        if value is not None:
+            readings[column] = float(value)
+    return readings
+
+
+class RiskProfile:
+    """Per-axis rank indexes over the trailing window, plus the last historical reading"""
+
+    def __init__(self, indexes, latest):
+        self.indexes = indexes   # risk column -> RankIndex
+        self.latest = latest     # risk column -> last value in the history
+
+    @classmethod
+    def from_history(cls, history, window_days=RISK_WINDOW_DAYS):
+        """Profile from a daily (or finer) history that ends at the latest reading"""
+        features = build_features(history)
+        if features.empty:
+            return cls({column: RankIndex([]) for column in RISK_AXES.values()}, {})
+        end = features['date'].iloc[-1]
+        recent = features[features['date'] > end - pd.Timedelta(days=window_days)]
+        return cls(
+            {column: RankIndex(recent[column].to_numpy()) for column in RISK_AXES.values()},
+            {column: float(recent[column].iloc[-1]) for column in RISK_AXES.values()},
+        )
+
+    def to_dict(self):
+        return {
+            'windows': {column: list(index._sorted) for column, index in self.indexes.items()},
+            'latest': self.latest,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            {column: RankIndex(values) for column, values in data['windows'].items()},
+            data['latest'],
+        )
+
+    def scores(self, *readings):
+        """Percentile per axis, in RISK_AXES order
+
+        Each readings mapping overrides the historical latest value for the
+        axes it carries; later mappings win.
+        """
+        values = dict(self.latest)
+        for reading in readings:
+            values.update(reading)
+        return tuple(
+            round(self.indexes[column].percentile(values[column]), 1) if column in values else 50.0
+            for column in RISK_AXES.values()
+        )
@@ -0,0 +1,73 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+
+# — Shared Market Snapshots —
+#
+# Every session reads the same view of the data: back-test results, the
+# latest component reading, forecasts and metrics. The broadcaster builds
+# that view once per change of the data's key (e.g. the published artifact
+# run: one small file read) and hands the same immutable snapshot to every
+# caller, so server work follows the update rate rather than the number of
+# viewers.
+#
+# Builds are single-flight: sessions arriving mid-build wait for it rather
+# than starting their own. Sessions pull current() on each rerun; nothing
+# is pushed to them.
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """One version of everything the pages read; treat every field as read-only"""
+    version: int
+    key: object                 # Source signature the snapshot was built from
+    created: float              # time.time() when published
+    results: pd.DataFrame       # Back-test table
+    history: pd.DataFrame       # Recent daily freight rates, oldest first
+    latest: pd.Series           # Latest component reading
+    deltas: dict                # Day-on-day change of the port metrics (None if unknown)
+    base_rate: float
+    forecasts: dict             # {horizon: Forecast}
+    bands: object               # Monte Carlo quantile paths for the latest conditions
+    metrics: object             # BacktestMetrics
+    risk: object                # RiskProfile for the radar axes
+    pyramids: dict              # {series: Pyramid} of the full rate and CCI history
+
+
+class SnapshotBroadcaster:
+    """Shared single-flight cache of versioned MarketSnapshots, rebuilt only when key() changes
+
+    build(key) returns a dict of the MarketSnapshot fields other than
+    version, key and created.
+    """
+
+    def __init__(self, build, key):
+        self._build = build
+        self._key = key
+        self._snapshot = None
+        self._build_lock = threading.Lock()
+        self.builds = 0
+
+    def current(self):
+        """The snapshot for the data as it is now, building it if the data changed"""
+        key = self._key()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.key == key:
+            return snapshot
+        with self._build_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.key == key:
+                return snapshot
+            version = snapshot.version + 1 if snapshot is not None else 1
+            snapshot = MarketSnapshot(version=version, key=key, created=time.time(), **self._build(key))
+            self.builds += 1
+            self._snapshot = snapshot
+        return snapshot
+
+    @property
+    def version(self):
+        """Version of the last published snapshot, 0 before the first"""
+        snapshot = self._snapshot
+        return 0 if snapshot is None else snapshot.version
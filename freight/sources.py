@@ -0,0 +1,256 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from freight.synthetic import synthetic_history
+
+# — Data Sources —
+#
+# Everything the app reads goes through a DataSource. signature() is cheap
+# (a few stat calls) and changes whenever the underlying data does, so it is
+# what the Streamlit caches key on.
+
+RESULTS_COLUMNS = {'actual': 'Actual Rate', 'predicted': 'Predicted Rate'}
+
+TEXT_SUFFIXES = {'.csv', '.jsonl', '.json'}
+TABLE_SUFFIXES = ['.parquet', '.feather', '.arrow', '.csv']
+
+REFERENCE_RESULTS_CSV = """date,actual,predicted,confidence_lower,confidence_upper
+2024-01-30,11.56,11.25,10.85,11.65
+2024-02-29,11.81,10.64,10.24,11.04
+2024-03-31,16.23,15.23,14.83,15.63
+2024-04-30,13.89,12.67,12.27,13.07
+2024-05-31,12.82,13.15,12.75,13.55
+2024-06-30,12.26,12.51,12.11,12.91
+2024-07-31,12.12,11.03,10.63,11.43
+2024-08-31,11.72,10.66,10.26,11.06
+2024-09-30,10.77,10.39,9.99,10.79
+2024-10-31,10.45,10.46,10.06,10.86
+2024-11-30,8.06,7.96,7.56,8.36
+2024-12-31,6.25,6.13,5.73,6.53"""
+
+REFERENCE_COMPONENTS_CSV = """date,CCI_Score,GSI_Score,vessel_count,avg_wait_time,berth_availability,geopolitical_risk,weather_disruption,latest_prediction,trend_direction,market_volatility
+2025-08-26,0.783,0.456,45,22.5,7,8.2,0.85,6.13,declining,moderate"""
+
+
+def file_signature(path):
+    """(path, mtime_ns, size) for a file, or None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _parse(path):
+    suffix = Path(path).suffix.lower()
+    if suffix == '.parquet':
+        return pd.read_parquet(path)
+    if suffix in ('.feather', '.arrow'):
+        return pd.read_feather(path)
+    if suffix in ('.jsonl', '.json'):
+        return pd.read_json(path, lines=suffix == '.jsonl', convert_dates=['date'])
+    if suffix == '.csv':
+        return pd.read_csv(path, parse_dates=['date'])
+    raise ValueError(f"Unsupported data file: {path}")
+
+
+class ParsedFileCache:
+    """Keeps parsed copies of text files on disk, keyed by path + mtime + size
+
+    CSV and JSON parsing dominates a cold load, so the first process to read a
+    file pickles the resulting frame and every later process (or restart)
+    loads that instead. Binary columnar formats are read directly.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    def _entry(self, signature):
+        path, mtime_ns, size = signature
+        stem = hashlib.sha1(path.encode()).hexdigest()[:12]
+        version = hashlib.sha1(f"{mtime_ns}:{size}".encode()).hexdigest()[:12]
+        return stem, self.cache_dir / f"{stem}-{version}.pkl"
+
+    def read(self, path):
+        signature = file_signature(path)
+        if signature is None:
+            raise FileNotFoundError(path)
+        if Path(path).suffix.lower() not in TEXT_SUFFIXES:
+            return _parse(path)
+
+        stem, entry = self._entry(signature)
+        if entry.exists():
+            return pd.read_pickle(entry)
+
+        df = _parse(path)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in self.cache_dir.glob(f"{stem}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        df.to_pickle(tmp)
+        os.replace(tmp, entry)
+        return df
+
+
+def _normalise_results(df):
+    df = df.rename(columns=RESULTS_COLUMNS)
+    df['date'] = pd.to_datetime(df['date'])
+    return df.sort_values('date').reset_index(drop=True)
+
+
+def _normalise_history(df):
+    df = df.copy()
+    df['date'] = pd.to_datetime(df['date'])
+    return df.sort_values('date').reset_index(drop=True)
+
+
+def _normalise_components(df):
+    """Sort dated snapshots; scores are derived per port and lane when stored"""
+    if 'date' in df.columns:
+        df = _normalise_history(df)
+    return df
+
+
+class DataSource:
+    """Where back-test results, component snapshots and rate history come from"""
+
+    def signature(self):
+        """Hashable value that changes whenever the underlying data changes"""
+        raise NotImplementedError
+
+    def read_results(self):
+        """Back-test table: date, Actual Rate, Predicted Rate, confidence bands"""
+        raise NotImplementedError
+
+    def read_components(self):
+        """Dated CCI component snapshots, oldest first; the last row is the latest"""
+        raise NotImplementedError
+
+    def read_history(self):
+        """Daily freight rate and component history used for training"""
+        raise NotImplementedError
+
+    # Any of the three tables may carry 'port' and 'lane' columns; rows
+    # without them belong to the default port and lane (freight.entities).
+
+
+class EmbeddedSource(DataSource):
+    """The reference 2024 back-test, latest snapshot and synthetic history"""
+
+    def signature(self):
+        return ('embedded',)
+
+    def read_results(self):
+        return _normalise_results(pd.read_csv(io.StringIO(REFERENCE_RESULTS_CSV)))
+
+    def read_components(self):
+        return _normalise_history(pd.read_csv(io.StringIO(REFERENCE_COMPONENTS_CSV)))
+
+    def read_history(self):
+        return synthetic_history()
+
+
+class FileSource(DataSource):
+    """Local CSV / JSON-lines / Parquet / Feather files
+
+    Any file left as None falls back to the embedded reference data.
+    """
+
+    def __init__(self, results_path=None, components_path=None, history_path=None, cache_dir=None):
+        self.results_path = results_path
+        self.components_path = components_path
+        self.history_path = history_path
+        first = next((p for p in (results_path, components_path, history_path) if p), 'data')
+        self.cache = ParsedFileCache(cache_dir or Path(first).parent / '.cache')
+        self._fallback = EmbeddedSource()
+
+    def signature(self):
+        return tuple(
+            file_signature(path) if path else None
+            for path in (self.results_path, self.components_path, self.history_path)
+        )
+
+    def read_results(self):
+        if not self.results_path:
+            return self._fallback.read_results()
+        return _normalise_results(self.cache.read(self.results_path))
+
+    def read_components(self):
+        if not self.components_path:
+            return self._fallback.read_components()
+        return _normalise_components(self.cache.read(self.components_path))
+
+    def read_history(self):
+        if not self.history_path:
+            return self._fallback.read_history()
+        return _normalise_history(self.cache.read(self.history_path))
+
+
+class PortFeedSource(FileSource):
+    """Local stand-in for the port-authority feed
+
+    The feed drops one file per delivery (CSV or JSON lines, one row per day)
+    into feed_dir. Drops are merged into the component history, later drops
+    winning for any date (per port and lane, when given) they repeat.
+    """
+
+    def __init__(self, feed_dir, results_path=None, cache_dir=None):
+        self.feed_dir = Path(feed_dir)
+        super().__init__(results_path=results_path, cache_dir=cache_dir or self.feed_dir / '.cache')
+
+    def _drops(self):
+        if not self.feed_dir.is_dir():
+            return []
+        return sorted(p for p in self.feed_dir.iterdir() if p.suffix.lower() in TEXT_SUFFIXES)
+
+    def signature(self):
+        return (super().signature(), tuple(file_signature(p) for p in self._drops()))
+
+    def read_history(self):
+        drops = self._drops()
+        if not drops:
+            return self._fallback.read_history()
+        df = pd.concat([self.cache.read(p) for p in drops], ignore_index=True)
+        df = _normalise_history(df)
+        key = ['date'] + [c for c in ('port', 'lane') if c in df.columns]
+        return df.drop_duplicates(key, keep='last').reset_index(drop=True)
+
+    def read_components(self):
+        if not self._drops():
+            return self._fallback.read_components()
+        return _normalise_components(self.read_history())
+
+
+def _find_table(directory, name):
+    for suffix in TABLE_SUFFIXES:
+        path = Path(directory) / f"{name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def default_source():
+    """Data source configured by the environment
+
+    FREIGHT_DATA_DIR points at a directory holding results.*, components.* and
+    history.* (Parquet, Feather/Arrow or CSV), and optionally a port_feed/
+    drop directory. Without it the app runs on the embedded reference data.
+    """
+    data_dir = os.environ.get('FREIGHT_DATA_DIR')
+    if not data_dir:
+        return EmbeddedSource()
+    cache_dir = os.environ.get('FREIGHT_CACHE_DIR') or Path(data_dir) / '.cache'
+    results_path = _find_table(data_dir, 'results')
+    feed_dir = Path(data_dir) / 'port_feed'
+    if feed_dir.is_dir():
+        return PortFeedSource(feed_dir, results_path=results_path, cache_dir=cache_dir)
+    return FileSource(
+        results_path=results_path,
+        components_path=_find_table(data_dir, 'components'),
+        history_path=_find_table(data_dir, 'history'),
+        cache_dir=cache_dir,
+    )
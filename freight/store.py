@@ -0,0 +1,250 @@
+import copy
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer deployments only
+    fcntl = None
+
+# — Columnar Component Store —
+#
+# One raw little-endian file per column, memory-mapped read-only. Rows are
+# kept in time order, so "latest" is the last element and a time window is
+# two binary searches on the date column plus a slice: reads cost O(window)
+# no matter how long the history is. Every Streamlit process maps the same
+# files, so they share one copy in the OS page cache.
+#
+# Layout:
+#   root/CURRENT          name of the live version directory (the one before is kept too)
+#   root/v<N>/meta.json   columns, dtypes, categories, row count
+#   root/v<N>/<col>.bin   column data
+
+DATE_COLUMN = 'date'
+CHUNK_ROWS = 65_536     # Rows per frame when streaming a store out
+
+
+def default_store_root():
+    """FREIGHT_STORE_DIR, or a per-host directory every server process shares"""
+    return Path(os.environ.get('FREIGHT_STORE_DIR') or Path(tempfile.gettempdir()) / 'freight-store')
+
+
+def _atomic_write_text(path, text):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+@contextmanager
+def store_lock(root):
+    """Exclusive lock on root/.lock, shared by every process writing under root"""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / '.lock', 'a') as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class ComponentStore:
+    """Time-ordered columnar history of CCI components, replaced a version at a time"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._state = None      # (version, meta inode, meta mtime) the maps reflect
+        self._meta = {'columns': {}, 'categories': {}, 'rows': 0}
+        self._maps = {}
+
+    # — Reading —
+
+    def _current_version(self):
+        try:
+            return (self.root / 'CURRENT').read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def refresh(self, attempts=3):
+        """Re-map columns if another process has written; True if anything changed"""
+        version = self._current_version()
+        if version is None:
+            changed = self._state is not None
+            self._state, self._maps = None, {}
+            self._meta = {'columns': {}, 'categories': {}, 'rows': 0}
+            return changed
+        meta_path = self.root / version / 'meta.json'
+        try:
+            stat = os.stat(meta_path)
+            state = (version, stat.st_ino, stat.st_mtime_ns)
+            if state == self._state:
+                return False
+            meta = json.loads(meta_path.read_text())
+        except FileNotFoundError:
+            # A writer replaced this version between the two reads; anything
+            # more persistent is a damaged store, not a race
+            if attempts <= 1:
+                raise FileNotFoundError(f"{self.root}/CURRENT names {version}, which has no meta.json") from None
+            return self.refresh(attempts - 1)
+        self._meta = meta
+        self._maps = {}
+        self._state = state
+        return True
+
+    def _column(self, name):
+        if name not in self._maps:
+            rows = self._meta['rows']
+            dtype = np.dtype(self._meta['columns'][name])
+            if rows == 0:
+                self._maps[name] = np.empty(0, dtype)
+            else:
+                path = self.root / self._state[0] / f"{name}.bin"
+                self._maps[name] = np.memmap(path, dtype=dtype, mode='r', shape=(rows,))
+        return self._maps[name]
+
+    def __len__(self):
+        self.refresh()
+        return self._meta['rows']
+
+    @property
+    def columns(self):
+        self.refresh()
+        return list(self._meta['columns'])
+
+    @property
+    def source_signature(self):
+        self.refresh()
+        return self._meta.get('source_signature')
+
+    def _frame(self, start, stop, columns=None):
+        columns = columns or self.columns
+        data = {}
+        for name in columns:
+            values = np.array(self._column(name)[start:stop])
+            if name == DATE_COLUMN:
+                values = values.astype('datetime64[ns]')
+            elif name in self._meta['categories']:
+                values = pd.Categorical.from_codes(values, self._meta['categories'][name])
+            data[name] = values
+        return pd.DataFrame(data, index=pd.RangeIndex(start, stop))
+
+    def tail(self, n, columns=None, end=None):
+        """Most recent n rows, or the n rows up to and including end"""
+        rows = len(self)
+        if end is not None and rows:
+            rows = int(np.searchsorted(self._column(DATE_COLUMN), pd.Timestamp(end).value, 'right'))
+        return self._frame(max(rows - n, 0), rows, columns)
+
+    def latest(self, columns=None):
+        """Most recent row as a Series"""
+        if len(self) == 0:
+            raise LookupError(f"component store at {self.root} is empty")
+        return self.tail(1, columns).iloc[0]
+
+    def window(self, start=None, end=None, columns=None):
+        """Rows with start <= date <= end, located by binary search"""
+        self.refresh()
+        dates = self._column(DATE_COLUMN)
+        lo = 0 if start is None else int(np.searchsorted(dates, pd.Timestamp(start).value, 'left'))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, pd.Timestamp(end).value, 'right'))
+        return self._frame(lo, hi, columns)
+
+    def chunks(self, start=None, end=None, columns=None, size=None):
+        """Rows with start <= date <= end as frames of at most size rows
+
+        The version is pinned when iteration starts, so a concurrent write
+        does not mix two versions into one export. An empty range yields one
+        empty frame, so callers still see the columns.
+        """
+        size = size or CHUNK_ROWS
+        self.refresh()
+        dates = self._column(DATE_COLUMN)
+        lo = 0 if start is None else int(np.searchsorted(dates, pd.Timestamp(start).value, 'left'))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, pd.Timestamp(end).value, 'right'))
+        columns = columns or self.columns
+        meta, maps = self._meta, {name: self._column(name) for name in columns}
+        pinned = copy.copy(self)
+        pinned._meta, pinned._maps = meta, maps
+        for offset in range(lo, max(hi, lo + 1), size):
+            yield pinned._frame(offset, max(min(offset + size, hi), offset), columns)
+
+    # — Writing —
+
+    def lock(self):
+        """Exclusive writer lock shared by every process using this root"""
+        return store_lock(self.root)
+
+    def _encode(self, df, meta):
+        """Column name -> contiguous array in the store's on-disk dtype"""
+        out = {}
+        for name in df.columns:
+            series = df[name]
+            if name == DATE_COLUMN:
+                out[name] = pd.to_datetime(series).to_numpy('datetime64[ns]').view('int64')
+            elif not pd.api.types.is_numeric_dtype(series.dtype):
+                categories = meta['categories'].setdefault(name, [])
+                for value in pd.unique(series.astype(str)):
+                    if value not in categories:
+                        categories.append(value)
+                lookup = {value: code for code, value in enumerate(categories)}
+                out[name] = series.astype(str).map(lookup).to_numpy('int32')
+            else:
+                out[name] = series.to_numpy()
+            meta['columns'].setdefault(name, out[name].dtype.str)
+        return out
+
+    def write(self, df, source_signature=None):
+        """Replace the whole history with df, published atomically"""
+        if DATE_COLUMN not in df.columns:
+            raise ValueError(f"component history needs a '{DATE_COLUMN}' column")
+        with self.lock():
+            self._write(df, source_signature)
+        self.refresh()
+
+    def _write(self, df, source_signature):
+        """Write a new version directory and point CURRENT at it (lock held)"""
+        df = df.sort_values(DATE_COLUMN).reset_index(drop=True)
+        previous = self._current_version()
+        number = int(previous[1:]) + 1 if previous else 1
+        version_dir = self.root / f"v{number}"
+        shutil.rmtree(version_dir, ignore_errors=True)
+        version_dir.mkdir(parents=True)
+
+        meta = {'columns': {}, 'categories': {}, 'rows': len(df), 'source_signature': source_signature}
+        for name, values in self._encode(df, meta).items():
+            values.astype(meta['columns'][name]).tofile(version_dir / f"{name}.bin")
+        _atomic_write_text(version_dir / 'meta.json', json.dumps(meta))
+        _atomic_write_text(self.root / 'CURRENT', version_dir.name)
+
+        # Columns are mapped lazily, so a reader that refreshed onto the previous
+        # version may still open its files: keep it until the next write
+        for old in self.root.glob('v*'):
+            if old.is_dir() and old.name not in (version_dir.name, previous):
+                shutil.rmtree(old, ignore_errors=True)
+
+
+def sync_from_source(store, source, reader='read_components'):
+    """Rebuild the store from source.<reader>() if the source's data has changed
+
+    Only one process does the rebuild; the others wait on the writer lock and
+    then find the store already current.
+    """
+    signature = repr(source.signature())
+    if store.source_signature == signature:
+        return False
+    with store.lock():
+        if store.source_signature == signature:
+            return False
+        store._write(getattr(source, reader)(), signature)
+    store.refresh()
+    return True
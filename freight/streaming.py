@@ -0,0 +1,278 @@
+import json
+import os
+import socketserver
+import threading
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass
+
+import pandas as pd
+
+from freight.entities import DEFAULT_PORT
+from freight.features import cci_score
+from freight.synthetic import TOTAL_BERTHS
+
+# — Streaming CCI Engine —
+#
+# Consumes vessel events one at a time:
+#   {"time": "2025-08-26T06:15:00", "event": "arrival",   "vessel": "MV ..."}
+#   {"time": ...,                   "event": "berth",     "vessel": ...}
+#   {"time": ...,                   "event": "departure", "vessel": ...}
+#
+# The queue is the set of vessels that have arrived but not berthed, berth
+# availability is TOTAL_BERTHS minus the vessels alongside, and the average
+# wait is taken over berthings in the trailing WAIT_WINDOW, kept as a deque
+# plus a running sum. Every event costs O(1) (amortised for the window), and
+# the CCI is recomputed from the three aggregates after each one.
+#
+# A snapshot is retained per SNAPSHOT_EVERY bucket of event time, so deltas
+# ("vs. yesterday") are a binary search over at most RETAIN / SNAPSHOT_EVERY
+# entries, never a rescan of the event history.
+
+EVENT_KINDS = ('arrival', 'berth', 'departure')
+WAIT_WINDOW = pd.Timedelta(hours=24)
+SNAPSHOT_EVERY = pd.Timedelta(minutes=15)
+RETAIN = pd.Timedelta(hours=48)
+
+
+@dataclass(frozen=True)
+class PortSnapshot:
+    time: pd.Timestamp
+    vessel_count: int
+    avg_wait_time: float      # Hours
+    berth_availability: int
+    CCI_Score: float
+
+    def get(self, name, default=None):
+        """Mapping-style access, so a snapshot can stand in for a components row"""
+        return getattr(self, name, default)
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+
+class StreamingCCI:
+    """Incrementally maintained port aggregates and CCI, one event at a time
+
+    Safe to feed from one thread while others read latest/delta.
+    """
+
+    def __init__(self, total_berths=TOTAL_BERTHS, wait_window=WAIT_WINDOW,
+                 snapshot_every=SNAPSHOT_EVERY, retain=RETAIN):
+        self.total_berths = total_berths
+        self.wait_window = wait_window
+        self.snapshot_every = snapshot_every
+        self._arrived = {}            # vessel -> arrival time, for vessels in the queue
+        self._alongside = set()
+        self._waits = deque()         # (berth time, hours waited) inside the window
+        self._wait_sum = 0.0
+        self._avg_wait = 0.0
+        self._now = None
+        self._latest = None
+        self._snapshots = deque(maxlen=max(int(retain / snapshot_every), 2))
+        self._snapshot_times = deque(maxlen=self._snapshots.maxlen)
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self.events = 0
+
+    def subscribe(self, callback):
+        """Call callback(snapshot) after every applied event, outside the engine lock"""
+        self._subscribers.append(callback)
+
+    def apply(self, event):
+        """Fold one event dict into the aggregates; returns the new snapshot"""
+        kind, vessel = event['event'], event['vessel']
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"unknown port event {kind!r}")
+        # Late events are applied at the latest time seen
+        time = pd.Timestamp(event['time'])
+        with self._lock:
+            if self._now is not None and time < self._now:
+                time = self._now
+            self._now = time
+
+            if kind == 'arrival':
+                self._arrived.setdefault(vessel, time)
+            elif kind == 'berth':
+                arrived = self._arrived.pop(vessel, None)
+                self._alongside.add(vessel)
+                if arrived is not None:
+                    hours = (time - arrived) / pd.Timedelta(hours=1)
+                    self._waits.append((time, hours))
+                    self._wait_sum += hours
+            else:
+                self._arrived.pop(vessel, None)
+                self._alongside.discard(vessel)
+
+            cutoff = time - self.wait_window
+            while self._waits and self._waits[0][0] < cutoff:
+                self._wait_sum -= self._waits.popleft()[1]
+            # With no berthings in the window, the last average stands
+            if self._waits:
+                self._avg_wait = self._wait_sum / len(self._waits)
+
+            self.events += 1
+            snapshot = self._latest = self._snapshot(time)
+            self._retain(snapshot)
+        for callback in self._subscribers:
+            callback(snapshot)
+        return snapshot
+
+    def extend(self, events):
+        for event in events:
+            self.apply(event)
+        return self._latest
+
+    def _snapshot(self, time):
+        vessel_count = len(self._arrived)
+        berths = max(self.total_berths - len(self._alongside), 0)
+        avg_wait = round(self._avg_wait, 2)
+        return PortSnapshot(
+            time=time,
+            vessel_count=vessel_count,
+            avg_wait_time=avg_wait,
+            berth_availability=berths,
+            CCI_Score=float(cci_score(vessel_count, avg_wait, berths)),
+        )
+
+    def _retain(self, snapshot):
+        """Keep the last snapshot of every SNAPSHOT_EVERY bucket"""
+        bucket = snapshot.time.floor(self.snapshot_every)
+        if self._snapshot_times and self._snapshot_times[-1] == bucket:
+            self._snapshots[-1] = snapshot
+        else:
+            self._snapshot_times.append(bucket)
+            self._snapshots.append(snapshot)
+
+    @property
+    def latest(self):
+        """Most recent snapshot, or None before the first event"""
+        return self._latest
+
+    def at(self, when):
+        """Latest retained snapshot at or before when, or None"""
+        with self._lock:
+            i = bisect_right(self._snapshot_times, pd.Timestamp(when).floor(self.snapshot_every))
+            return self._snapshots[i - 1] if i else None
+
+    def delta(self, name, ago=pd.Timedelta(days=1)):
+        """Change in a snapshot field over `ago`, or None without history that old"""
+        latest = self._latest
+        if latest is None:
+            return None
+        earlier = self.at(latest.time - ago)
+        if earlier is None:
+            return None
+        return getattr(latest, name) - getattr(earlier, name)
+
+
+# — Event Feeds —
+
+
+def parse_event(line):
+    """One JSON-lines event, or None for a blank or malformed line"""
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(event, dict) or not {'time', 'event', 'vessel'} <= event.keys():
+        return None
+    return event
+
+
+class FileTail:
+    """Feeds an engine from a JSON-lines event file as it grows
+
+    Each poll() reads only the bytes appended since the last one. A file that
+    shrinks (rotated or truncated) is read again from the start.
+    """
+
+    def __init__(self, path, engine):
+        self.path = path
+        self.engine = engine
+        self._offset = 0
+        self._partial = b''
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """Apply newly appended events; returns how many were applied"""
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except FileNotFoundError:
+                return 0
+            if size < self._offset:
+                self._offset, self._partial = 0, b''
+            if size == self._offset:
+                return 0
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                chunk = self._partial + f.read(size - self._offset)
+            self._offset = size
+            *lines, self._partial = chunk.split(b'\n')
+            applied = 0
+            for line in lines:
+                event = parse_event(line)
+                if event is not None:
+                    self.engine.apply(event)
+                    applied += 1
+            return applied
+
+
+class _EventHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            event = parse_event(line)
+            if event is not None:
+                self.server.engine.apply(event)
+
+
+class EventListener(socketserver.ThreadingTCPServer):
+    """Local TCP stand-in for the port-authority push feed: JSON lines per connection"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, engine, host='127.0.0.1', port=0):
+        super().__init__((host, port), _EventHandler)
+        self.engine = engine
+
+    def start(self):
+        """Serve on a daemon thread; returns the bound (host, port)"""
+        threading.Thread(target=self.serve_forever, name='port-events', daemon=True).start()
+        return self.server_address
+
+
+@dataclass
+class PortStream:
+    """An engine, the feeds that fill it and the port they describe"""
+    engine: StreamingCCI
+    port: str = DEFAULT_PORT
+    tail: FileTail = None
+    listener: EventListener = None
+
+    def poll(self):
+        """Latest snapshot after taking in any newly written file events"""
+        if self.tail is not None:
+            self.tail.poll()
+        return self.engine.latest
+
+
+def default_stream():
+    """Port event stream configured by the environment, or None
+
+    FREIGHT_PORT_EVENTS names a JSON-lines event file to tail, and
+    FREIGHT_PORT_EVENTS_PORT a local TCP port to accept pushed events on.
+    Events describe FREIGHT_PORT_EVENTS_FOR (default: the default port).
+    """
+    path = os.environ.get('FREIGHT_PORT_EVENTS')
+    port = os.environ.get('FREIGHT_PORT_EVENTS_PORT')
+    if not path and not port:
+        return None
+    stream = PortStream(StreamingCCI(), port=os.environ.get('FREIGHT_PORT_EVENTS_FOR') or DEFAULT_PORT)
+    if path:
+        stream.tail = FileTail(path, stream.engine)
+    if port:
+        stream.listener = EventListener(stream.engine, port=int(port))
+        stream.listener.start()
+    return stream
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+# — Synthetic Port History —
+#
+# Stand-in for the Chittagong port and freight-rate feeds until the real
+# extracts are wired in. Seeded, so every process builds the same history.
+
+COMPONENT_COLUMNS = [
+    'vessel_count',
+    'avg_wait_time',
+    'berth_availability',
+    'geopolitical_risk',
+    'weather_disruption',
+    'market_volatility',
+    'fuel_price',
+]
+
+TOTAL_BERTHS = 19
+
+
+def _ar1(rng, n, phi, scale):
+    """Mean-zero AR(1) noise of length n"""
+    shocks = rng.normal(0, scale, n)
+    out = np.empty(n)
+    out[0] = shocks[0]
+    for i in range(1, n):
+        out[i] = phi * out[i - 1] + shocks[i]
+    return out
+
+
+def synthetic_history(start='2021-01-01', end='2024-12-31', freq='D', seed=42):
+    """Daily port components and freight rates between start and end"""
+    dates = pd.date_range(start=start, end=end, freq=freq)
+    n = len(dates)
+    rng = np.random.default_rng(seed)
+
+    doy = dates.dayofyear.to_numpy()
+    season = np.sin(2 * np.pi * (doy - 80) / 365.25)          # Peaks around June
+    monsoon = np.exp(-((doy - 200) / 45.0) ** 2)                # Jun-Sep weather window
+
+    vessel_count = 38 + 8 * season + _ar1(rng, n, 0.9, 2.5)
+    vessel_count = np.clip(np.round(vessel_count), 5, None)
+
+    berth_availability = TOTAL_BERTHS - 0.3 * vessel_count + rng.normal(0, 1.0, n)
+    berth_availability = np.clip(np.round(berth_availability), 0, TOTAL_BERTHS)
+
+    avg_wait_time = 2 + 0.45 * vessel_count - 0.4 * berth_availability + _ar1(rng, n, 0.8, 1.5)
+    avg_wait_time = np.clip(avg_wait_time, 0.5, None)
+
+    geopolitical_risk = np.clip(5 + _ar1(rng, n, 0.995, 0.25), 0, 10)
+    weather_disruption = np.clip(0.15 + 0.7 * monsoon + rng.normal(0, 0.08, n), 0, 1)
+    market_volatility = np.clip(0.4 + _ar1(rng, n, 0.97, 0.05), 0, 1)
+    fuel_price = np.clip(80 + np.cumsum(rng.normal(0, 0.6, n)), 40, 140)
+
+    # Rates respond to congestion with a two-week lag, plus global pressure
+    congestion = (vessel_count - 20) / 40 + (avg_wait_time - 5) / 40 - berth_availability / (2 * TOTAL_BERTHS)
+    lagged = pd.Series(congestion).shift(14).bfill().to_numpy()
+    freight_rate = (
+        4.5
+        + 9.0 * lagged
+        + 0.35 * geopolitical_risk
+        + 2.0 * weather_disruption
+        + 0.03 * (fuel_price - 80)
+        + 3.0 * market_volatility
+        + _ar1(rng, n, 0.95, 0.12)
+    )
+    freight_rate = np.clip(freight_rate, 3.0, None)
+
+    return pd.DataFrame({
+        'date': dates,
+        'freight_rate': freight_rate.round(2),
+        'vessel_count': vessel_count.astype(int),
+        'avg_wait_time': avg_wait_time.round(1),
+        'berth_availability': berth_availability.astype(int),
+        'geopolitical_risk': geopolitical_risk.round(2),
+        'weather_disruption': weather_disruption.round(3),
+        'market_volatility': market_volatility.round(3),
+        'fuel_price': fuel_price.round(2),
+    })
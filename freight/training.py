@@ -0,0 +1,211 @@
+import hashlib
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from freight.backtest import WalkForward, walk_forward
+from freight.features import FEATURE_COLUMNS, build_features
+from freight.metrics import BacktestMetrics
+
+# — CCI Model Training Pipeline —
+#
+# scikit-learn (and the scipy it pulls in) takes well over a second to
+# import, and only the validation job needs it, so it is imported where the
+# models are built rather than when the app loads this module.
+
+HORIZON_DAYS = 14
+TRAIN_END = pd.Timestamp('2023-12-31')
+TEST_END = pd.Timestamp('2024-12-31')
+BAND_Z = 1.2816  # 80% two-sided normal band
+
+STAGES = [
+    "Loading historical data (2021-2023)...",
+    "Extracting CCI features...",
+    "Training ensemble models...",
+    "Cross-validating performance...",
+    "Testing on 2024 data...",
+]
+
+
+@dataclass
+class TrainedModel:
+    data_hash: str
+    members: list
+    residual_std: float
+    results: pd.DataFrame
+    r2: float
+    mae: float
+    cv_mae: float
+    metrics: BacktestMetrics = None
+    backtest: WalkForward = None
+    horizon: int = HORIZON_DAYS
+    feature_columns: list = field(default_factory=lambda: list(FEATURE_COLUMNS))
+
+    def predict(self, X):
+        return ensemble_predict(self.members, X)
+
+
+def data_fingerprint(df):
+    """Stable content hash of a DataFrame, used as the model cache key"""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update(','.join(map(str, df.columns)).encode())
+    return digest.hexdigest()
+
+
+def make_ensemble():
+    """Fresh, unfitted ensemble members"""
+    from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+    from sklearn.linear_model import Ridge
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    return [
+        make_pipeline(StandardScaler(), Ridge(alpha=1.0)),
+        GradientBoostingRegressor(n_estimators=150, max_depth=3, learning_rate=0.05, random_state=0),
+        RandomForestRegressor(n_estimators=100, min_samples_leaf=5, random_state=0, n_jobs=1),
+    ]
+
+
+def ensemble_predict(members, X):
+    """Equal-weight ensemble prediction"""
+    X = np.asarray(X, dtype=float)
+    return np.mean([m.predict(X) for m in members], axis=0)
+
+
+def fit_ensemble(X, y):
+    members = make_ensemble()
+    for member in members:
+        member.fit(X, y)
+    return members
+
+
+def supervised_frame(features, horizon=HORIZON_DAYS):
+    """Pair features observed on day t with the rate realised on day t + horizon"""
+    df = features[['date'] + FEATURE_COLUMNS].copy()
+    df['target_date'] = df['date'] + pd.Timedelta(days=horizon)
+    df['target'] = df['freight_rate'].shift(-horizon)
+    return df.dropna(subset=['target']).reset_index(drop=True)
+
+
+def fold_residuals(X_train, y_train, X_test, y_test):
+    members = fit_ensemble(X_train, y_train)
+    return y_test - ensemble_predict(members, X_test)
+
+
+def fit_and_predict(X_train, y_train, X_next):
+    """Fit a fresh ensemble and predict X_next (one walk-forward fold)"""
+    return ensemble_predict(fit_ensemble(X_train, y_train), X_next)
+
+
+def time_series_splits(X, n_splits):
+    """Expanding-window (train, test) index pairs"""
+    from sklearn.model_selection import TimeSeriesSplit
+
+    return TimeSeriesSplit(n_splits=n_splits).split(X)
+
+
+def submit_folds(executor, X, y, n_splits=4):
+    """Queue every expanding-window fold on executor, returning the futures"""
+    return [
+        executor.submit(fold_residuals, X[train_idx], y[train_idx], X[test_idx], y[test_idx])
+        for train_idx, test_idx in time_series_splits(X, n_splits)
+    ]
+
+
+def cross_validate(X, y, n_splits=4):
+    """Out-of-fold residuals from an expanding-window time-series split"""
+    return np.concatenate([
+        fold_residuals(X[train_idx], y[train_idx], X[test_idx], y[test_idx])
+        for train_idx, test_idx in time_series_splits(X, n_splits)
+    ])
+
+
+def run_pipeline(history, on_stage=None, horizon=HORIZON_DAYS, executor=None, origins=None):
+    """Train on 2021-2023, back-test on 2024 and return the fitted artifact
+
+    on_stage(label, fraction_complete) is called as each stage starts and once
+    more with fraction 1.0 when the pipeline finishes. With an executor the
+    ensemble fit and the cross-validation folds run concurrently on it.
+
+    By default the 2024 back-test scores the single 2021-2023 fit. With
+    origins ('daily', 'weekly' or 'monthly') it is a walk-forward back-test
+    instead, re-fitting at every origin (see freight.backtest).
+    """
+    def report(i):
+        if on_stage is not None:
+            label = STAGES[i] if i < len(STAGES) else "Done"
+            on_stage(label, i / len(STAGES))
+
+    report(0)
+    data_hash = data_fingerprint(history)
+    history = history[history['date'] <= TEST_END]
+    if history.empty or history['date'].min() > TRAIN_END:
+        raise ValueError("history must cover the 2021-2023 training window")
+
+    report(1)
+    frame = supervised_frame(build_features(history), horizon)
+    train = frame[frame['target_date'] <= TRAIN_END]
+    test = frame[frame['target_date'] > TRAIN_END]
+    X_train = train[FEATURE_COLUMNS].to_numpy(dtype=float)
+    y_train = train['target'].to_numpy(dtype=float)
+
+    report(2)
+    if executor is None:
+        members = fit_ensemble(X_train, y_train)
+        report(3)
+        residuals = cross_validate(X_train, y_train)
+    else:
+        # Folds don't depend on the full fit, so queue everything up front
+        fit_future = executor.submit(fit_ensemble, X_train, y_train)
+        fold_futures = submit_folds(executor, X_train, y_train)
+        members = fit_future.result()
+        report(3)
+        residuals = np.concatenate([f.result() for f in fold_futures])
+    residual_std = float(np.std(residuals))
+
+    report(4)
+    backtest = None
+    if origins is None:
+        predicted = ensemble_predict(members, test[FEATURE_COLUMNS])
+        band = BAND_Z * residual_std
+        dates, actual = test['target_date'].to_numpy(), test['target'].to_numpy()
+        lower, upper = predicted - band, predicted + band
+    else:
+        def on_fold(done, total):
+            if on_stage is not None:
+                on_stage(STAGES[4], (4 + done / total) / len(STAGES))
+
+        backtest = walk_forward(
+            frame, fit_and_predict, TRAIN_END, TEST_END, origins, horizon, executor=executor, on_fold=on_fold
+        )
+        latest = backtest.latest()
+        dates, actual = latest['date'].to_numpy(), latest['actual'].to_numpy()
+        predicted, lower, upper = (latest[c].to_numpy() for c in ('predicted', 'lower', 'upper'))
+
+    results = pd.DataFrame({
+        'date': dates,
+        'Actual Rate': actual,
+        'Predicted Rate': predicted.round(2),
+        'confidence_lower': lower.round(2),
+        'confidence_upper': upper.round(2),
+    })
+    # Scored on the unrounded predictions
+    metrics = BacktestMetrics()
+    metrics.update(dates, actual, predicted)
+    model = TrainedModel(
+        data_hash=data_hash,
+        members=members,
+        residual_std=residual_std,
+        results=results,
+        r2=metrics.r2,
+        mae=metrics.mae,
+        cv_mae=float(np.mean(np.abs(residuals))),
+        metrics=metrics,
+        backtest=backtest,
+        horizon=horizon,
+    )
+
+    report(len(STAGES))
+    return model
@@ -0,0 +1,128 @@
+"""Cold-start report for app.py, checked against an import-time budget
+
+    python scripts/startup_report.py                 # print the report
+    python scripts/startup_report.py --budget 0.8    # fail over 0.8 s of imports (default IMPORT_BUDGET)
+    python scripts/startup_report.py --json          # machine-readable
+
+Every measurement runs in a fresh interpreter, as a new container would:
+
+- import cost of each top-level import in app.py, in file order (each line
+  is what that statement adds on top of the ones before it);
+- time to first render of the default page, from interpreter start to the
+  end of the first AppTest run (imports, page config, styling, content);
+- which of the deferred heavy modules were loaded by that first render.
+
+Exits non-zero if the imports exceed --budget seconds, or if the default
+page pulls in any module listed in DEFERRED. benchmarks/test_startup.py
+runs the same checks under pytest.
+"""
+import argparse
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'app.py'
+
+# Only the validation job and the later pages should need these
+DEFERRED = ('sklearn', 'scipy', 'pyarrow', 'plotly.express', 'pandas', 'views.data', 'freight.training')
+IMPORT_BUDGET = 1.5     # Seconds for app.py's imports: about 3x a 1-CPU container
+
+_IMPORTS_PROBE = '''
+import json, sys, time
+timings = []
+for statement in json.loads(sys.argv[1]):
+    start = time.perf_counter()
+    exec(statement, {})
+    timings.append(time.perf_counter() - start)
+print(json.dumps(timings))
+'''
+
+_RENDER_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'seconds': elapsed,
+    'exceptions': [str(e.value) for e in at.exception],
+    'loaded': [m for m in json.loads(sys.argv[2]) if m in sys.modules],
+}))
+'''
+
+
+def top_level_imports(path=APP):
+    """Source of every module-level import statement, in file order"""
+    source = Path(path).read_text()
+    return [
+        ast.get_source_segment(source, node)
+        for node in ast.parse(source).body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+
+
+def _probe(code, *args):
+    out = subprocess.run(
+        [sys.executable, '-c', code, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def import_timings(repeat=3):
+    """{import statement: seconds}, best of `repeat` fresh interpreters"""
+    statements = top_level_imports()
+    runs = [_probe(_IMPORTS_PROBE, json.dumps(statements)) for _ in range(repeat)]
+    return dict(zip(statements, map(min, zip(*runs))))
+
+
+def first_render(repeat=3):
+    """Fastest cold first render of the default page, with what it loaded"""
+    runs = [_probe(_RENDER_PROBE, str(APP), json.dumps(DEFERRED)) for _ in range(repeat)]
+    return min(runs, key=lambda run: run['seconds'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET,
+                        help=f"fail if app.py's imports take longer (seconds, default {IMPORT_BUDGET})")
+    parser.add_argument('--repeat', type=int, default=3, help="fresh interpreters per measurement")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    imports = import_timings(args.repeat)
+    render = first_render(args.repeat)
+    total = sum(imports.values())
+    report = {
+        'imports': imports,
+        'import_seconds': total,
+        'first_render_seconds': render['seconds'],
+        'deferred_loaded': render['loaded'],
+        'exceptions': render['exceptions'],
+        'budget_seconds': args.budget,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        width = max(map(len, imports))
+        for statement, seconds in sorted(imports.items(), key=lambda item: -item[1]):
+            print(f"{statement:<{width}}  {seconds * 1000:8.1f} ms")
+        print(f"{'app.py imports':<{width}}  {total * 1000:8.1f} ms")
+        print(f"{'first render (default page)':<{width}}  {render['seconds'] * 1000:8.1f} ms")
+        print(f"deferred modules loaded: {', '.join(render['loaded']) or 'none'}")
+        for error in render['exceptions']:
+            print(f"exception: {error}")
+
+    failed = bool(render['loaded'] or render['exceptions'])
+    if total > args.budget:
+        print(f"over budget: {total:.2f} s of imports > {args.budget:.2f} s", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Pages of the ECG Freight Intelligence app, each imported when first shown"""
+import importlib
+from dataclasses import dataclass
+
+from freight import instrument
+
+# — Page Registry —
+#
+# app.py draws the shell (styling, header, navigation) and hands the body to
+# render(). A page's module, and the data stack behind it, is only imported
+# once that page is shown, and only the dependencies it lists are computed:
+# the landing page needs none, so a fresh session renders it without
+# loading pandas, syncing partitions or building a market snapshot.
+
+
+@dataclass(frozen=True)
+class Page:
+    name: str
+    label: str              # Navigation button text
+    module: str             # Module holding render()
+    needs: tuple = ()       # views.data.PROVIDERS keys, passed to render() as keywords
+
+
+PAGES = (
+    Page('opportunity', "🎯 The Opportunity", 'views.opportunity'),
+    Page('engine', "🧠 Intelligence Engine", 'views.engine', needs=('entity',)),
+    Page('verdict', "📈 Verdict & Roadmap", 'views.verdict', needs=('entity', 'snapshot')),
+)
+DEFAULT_PAGE = PAGES[0].name
+
+
+def get_page(name):
+    """The registered page called name, or the default page"""
+    return next((page for page in PAGES if page.name == name), PAGES[0])
+
+
+def render(name):
+    """Compute the page's dependencies, in order, and draw it"""
+    page = get_page(name)
+    with instrument.span(f"page.{page.name}"):
+        needs = {}
+        if page.needs:
+            from views.data import PROVIDERS
+            for need in page.needs:
+                with instrument.span(f"data.{need}"):
+                    needs[need] = PROVIDERS[need]()
+        importlib.import_module(page.module).render(**needs)
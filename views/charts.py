@@ -0,0 +1,39 @@
+import streamlit as st
+
+from freight import instrument
+from freight.figures import FigureCache
+from views.profiling import cache_data
+
+# — Charts —
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Built figures shared by every session (see freight.figures.FigureCache)"""
+    return FigureCache()
+
+
+# Emitting the chart inside a cached function records the finished element:
+# reruns with the same key replay it without touching the figure or
+# re-serialising it. On a replay miss the figure comes from the shared
+# figure cache, and is only built if no session has built it yet.
+@cache_data(max_entries=64, show_spinner=False)
+def _emit_chart(key, _figure):
+    figure = _figure()
+    with instrument.span(f"plotly_chart.{key[0]}"):
+        st.plotly_chart(figure, use_container_width=True)
+
+
+def show_chart(kind, params, build, version=None):
+    """Render the figure for (kind, data version, params), building it at most once
+
+    version only needs giving when params don't already pin the data down.
+    """
+    key = (kind, version, params)
+
+    def figure():
+        with instrument.span(f"figure.{kind}"):
+            return get_figure_cache().get_or_build(key, build)
+
+    with instrument.span(f"chart.{kind}"):
+        _emit_chart(key, figure)
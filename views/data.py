@@ -0,0 +1,159 @@
+import streamlit as st
+
+from freight import instrument
+from freight.alerts import AlertEngine, default_sink, load_rules
+from freight.artifacts import LIVE_FIELDS, PYRAMID_SERIES
+from freight.batch import default_stores, run_detached
+from freight.entities import DEFAULT_ENTITY
+from freight.jobs import JobRunner
+from freight.snapshots import SnapshotBroadcaster
+from freight.streaming import default_stream
+
+# — Market Data —
+#
+# Shared, cached resources behind the engine and verdict pages. Imported
+# only once one of those pages is shown (see views.render).
+#
+# Forecasts, bands, metrics and risk ranks are precomputed by the batch job
+# (python -m freight.batch) and only read here. A deployment that has never
+# published gets one run from the first session that needs it, by running
+# the batch job once in its own process.
+
+
+@st.cache_resource
+def get_stores():
+    """(partitions, artifacts): per-port, per-lane data and the published forecasts"""
+    return default_stores()
+
+
+def published():
+    """The artifact store, publishing a first run if there has never been one"""
+    artifacts = get_stores()[1]
+    if artifacts.current() is None:
+        with instrument.span('data.publish'):
+            run_detached()
+    return artifacts
+
+
+def current_entity():
+    """The port and lane this session is looking at"""
+    return st.session_state.get('entity', DEFAULT_ENTITY)
+
+
+def get_history_store():
+    """Memory-mapped daily rate and component history of the current port and lane"""
+    return get_stores()[0].store(current_entity(), 'history')
+
+
+@st.cache_resource
+def get_snapshots(entity):
+    """Market snapshots for one port and lane, shared by every session viewing it
+
+    Rebuilt (by reading the artifacts, nothing more) when a new run is published.
+    """
+    artifacts = published()
+
+    def load(run):
+        with instrument.span('data.load'):
+            return artifacts.load(entity, run)
+
+    return SnapshotBroadcaster(load, key=artifacts.current)
+
+
+def history_view(snapshot, name, start=None, end=None):
+    """Chart-sized (dates, values) of one history series between start and end
+
+    Comes from the published pyramid; narrow windows are read from the
+    full-resolution partition the series was published from.
+    """
+    store = get_stores()[0].store(current_entity(), PYRAMID_SERIES[name])
+
+    def fetch(start, end):
+        frame = store.window(start, end, ['date', name])
+        return frame['date'].to_numpy(), frame[name].to_numpy()
+
+    with instrument.span(f"data.history.{name}"):
+        return snapshot.pyramids[name].view(start, end, fetch)
+
+
+def load_history():
+    """Daily port components and freight rates used for training"""
+    return get_history_store().window()
+
+
+@st.cache_resource
+def get_port_stream():
+    """Live port event stream shared by every session (see freight.streaming.default_stream)
+
+    Every event's snapshot is checked against the port-level alert rules.
+    """
+    stream = default_stream()
+    if stream is not None:
+        alerts = AlertEngine(load_rules(), scope=stream.port, sink=default_sink())
+        stream.engine.subscribe(
+            lambda snapshot: alerts.observe(snapshot.time, {name: snapshot[name] for name in LIVE_FIELDS})
+        )
+    return stream
+
+
+def live_port_snapshot():
+    """Latest port snapshot and its change over the past day
+
+    Comes from the event stream when one is configured and has seen events,
+    otherwise from the stored daily snapshots. Deltas are None without a
+    snapshot from a day earlier.
+    """
+    stream = get_port_stream()
+    live = stream is not None and stream.port == current_entity().port
+    snapshot = stream.poll() if live else None
+    if snapshot is not None:
+        return snapshot, {name: stream.engine.delta(name) for name in LIVE_FIELDS}
+    snapshot = get_snapshots(current_entity()).current()
+    return snapshot.latest, snapshot.deltas
+
+
+@st.cache_resource
+def get_job_runner():
+    """Background validation workers and finished models, shared by every session"""
+    return JobRunner()
+
+
+def validated_model():
+    """This session's back-tested model, once its validation job has finished"""
+    job = st.session_state.validation_job
+    if job is not None and job.succeeded:
+        return job.result()
+    return None
+
+
+def select_entity():
+    """Port and lane selector, shown once the data covers more than one; returns the selection"""
+    entities = published().entities() or [DEFAULT_ENTITY]
+    if current_entity() not in entities:
+        st.session_state.entity = entities[0]
+    if len(entities) > 1:
+        pcol, lcol = st.columns(2)
+        ports = sorted({e.port for e in entities})
+        with pcol:
+            port = st.selectbox("Port", ports, index=ports.index(current_entity().port), key="entity_port")
+        lanes = [e.lane for e in entities if e.port == port]
+        with lcol:
+            lane = st.selectbox(
+                "Lane", lanes, index=lanes.index(current_entity().lane) if current_entity().lane in lanes else 0,
+                key="entity_lane"
+            )
+        st.session_state.entity = next(e for e in entities if e.port == port and e.lane == lane)
+    return current_entity()
+
+
+def market_snapshot():
+    """The current port and lane's shared market snapshot"""
+    return get_snapshots(current_entity()).current()
+
+
+# Page dependencies by name: each page lists the ones it needs (views.PAGES)
+# and receives them as keyword arguments, resolved in the order listed
+PROVIDERS = {
+    'entity': select_entity,
+    'snapshot': market_snapshot,
+}
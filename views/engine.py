@@ -0,0 +1,130 @@
+import streamlit as st
+
+from freight.features import RISK_AXES
+from freight.figures import risk_radar_figure
+from freight.risk import axis_readings
+from views.charts import show_chart
+from views.data import current_entity, get_job_runner, get_snapshots, live_port_snapshot, load_history
+
+# — Intelligence Engine —
+
+BACKTEST_ORIGINS = ('monthly', 'weekly', 'daily')
+LIVE_REFRESH_SECONDS = 5  # Dashboard polling interval
+
+
+def validation_status():
+    """Progress of the background validation job; reruns the app once when it lands"""
+    job = st.session_state.validation_job
+    if job is None:
+        return
+    if not job.done:
+        st.progress(job.fraction, text=f"🔄 {job.label}")
+        return
+    if st.session_state.validation_reported is not job:
+        # The full rerun also stops this fragment polling, whether the job failed or not
+        st.session_state.validation_reported = job
+        st.session_state.model_trained = job.succeeded
+        st.rerun()
+    if job.failed:
+        st.error(f"Model validation failed: {job.error}")
+        return
+    st.success("✅ **Model validation complete!** Navigate to 'Verdict & Roadmap' to see results.")
+
+
+def live_dashboard():
+    """Port metric cards and risk radar; refreshes on its own without rerunning the page"""
+    latest, deltas = live_port_snapshot()
+
+    def change(name, fmt, suffix=""):
+        return None if deltas[name] is None else f"{deltas[name]:{fmt}}{suffix}"
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "🚢 Vessel Queue", 
+            f"{int(latest['vessel_count'])}",
+            delta=change('vessel_count', '+.0f', " vs. Yesterday"),
+            help="Total vessels waiting for berth allocation"
+        )
+
+    with col2:
+        st.metric(
+            "⏱️ Avg Wait Time", 
+            f"{latest['avg_wait_time']:.1f} hrs",
+            delta=change('avg_wait_time', '+.1f', " hrs"),
+            delta_color="inverse",
+            help="Average vessel waiting time for berth assignment"
+        )
+
+    with col3:
+        st.metric(
+            "🏗️ Available Berths", 
+            f"{int(latest['berth_availability'])}",
+            delta=change('berth_availability', '+.0f', " vs. Yesterday"),
+            help="Currently available berthing positions"
+        )
+
+    with col4:
+        st.metric(
+            "📈 CCI Score", 
+            f"{latest['CCI_Score']:.3f}",
+            delta=change('CCI_Score', '+.3f'),
+            delta_color="inverse",
+            help="Chittagong Congestion Index (0-1 scale)"
+        )
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # CCI Components breakdown
+    st.markdown('<div class="content-section">', unsafe_allow_html=True)
+    st.subheader("🔧 CCI Component Analysis")
+
+    # Percentile of the live reading within the trailing year, per risk axis
+    categories = tuple(RISK_AXES)
+    # (stream readings, when live, override the stored snapshot's)
+    market = get_snapshots(current_entity()).current()
+    values = market.risk.scores(axis_readings(market.latest), axis_readings(latest))
+    show_chart('risk_radar', (categories, values), lambda: risk_radar_figure(categories, values))
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def render(entity):
+    st.markdown('<div class="content-section">', unsafe_allow_html=True)
+
+    st.header("🧠 Deconstructing the Intelligence Engine")
+    st.markdown("""
+    **The CCI Algorithm:** Our proprietary Chittagong Congestion Index transforms raw port 
+    data into actionable market intelligence. Built on World Bank port efficiency 
+    methodology, adapted for Bangladesh's unique operational context.
+    """)
+
+    # Real-time metrics dashboard
+    st.subheader("📊 Live Port Intelligence Dashboard")
+
+    st.fragment(live_dashboard, run_every=LIVE_REFRESH_SECONDS)()
+
+    # Interactive model training and validation
+    st.markdown('<div class="content-section">', unsafe_allow_html=True)
+    st.subheader("🚀 Model Training & Validation")
+    st.markdown("**Experience the validation process:** Train our model on historical data and test on unseen 2024 market conditions.")
+
+    origins = st.radio(
+        "Back-test re-fit origins", BACKTEST_ORIGINS, index=1, horizontal=True,
+        format_func=str.title, key="backtest_origins",
+        help="How often the walk-forward back-test re-fits the model on everything known to date"
+    )
+    if st.button("▶️ **Run Complete Model Validation**", key="train_model"):
+        # Joins the running job if another session already submitted the same data
+        st.session_state.model_trained = False
+        st.session_state.validation_reported = None
+        st.session_state.validation_job = get_job_runner().submit(load_history(), origins)
+
+    job = st.session_state.validation_job
+    polling = job is not None and not job.done
+    st.fragment(validation_status, run_every=0.5 if polling else None)()
+
+    if st.session_state.model_trained:
+        st.info("📊 Model ready for deployment. Check the results in the next section!")
+
+    st.markdown('</div>', unsafe_allow_html=True)
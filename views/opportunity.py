@@ -0,0 +1,54 @@
+import streamlit as st
+
+from freight.figures import impact_figure
+from views.charts import show_chart
+
+# — The Opportunity —
+
+
+def render():
+    st.markdown('<div class="content-section">', unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.header("🎯 Turning Market Chaos into Competitive Edge")
+        st.markdown("""
+        **Maritime freight isn't just logistics—it's our economic lifeline.** With Chittagong Port 
+        processing over **92% of Bangladesh's trade volume**, freight rate volatility directly 
+        impacts our bottom line by millions of dollars annually.
+
+        **The Problem:** Generic forecasting models failed spectacularly, achieving accuracy 
+        worse than random chance. Global trends alone cannot predict local port dynamics.
+
+        **Our Solution:** A proprietary **Chittagong Congestion Index (CCI)** that quantifies 
+        real-time port conditions, creating an asymmetric information advantage.
+        """)
+
+    with col2:
+        st.metric(
+            label="Generic Model Performance", 
+            value="49.8%",
+            delta="-0.2% vs Random",
+            delta_color="inverse",
+            help="Previous time-series model performed worse than coin flips"
+        )
+
+        st.metric(
+            label="Trade Volume Dependency",
+            value="92%",
+            delta="Chittagong Port Share",
+            help="Percentage of national trade flowing through Chittagong"
+        )
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # Market impact visualization
+    st.markdown('<div class="content-section">', unsafe_allow_html=True)
+    st.subheader("📊 Market Impact Analysis")
+
+    quarters = ('Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024')
+    cost_impact = (2.3, 1.8, 1.2, 0.8)  # Million USD
+    savings_potential = (2.1, 1.6, 1.0, 0.6)
+    show_chart('impact', (quarters, cost_impact, savings_potential),
+               lambda: impact_figure(quarters, cost_impact, savings_potential))
+    st.markdown('</div>', unsafe_allow_html=True)
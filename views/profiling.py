@@ -0,0 +1,72 @@
+import functools
+from contextvars import ContextVar
+
+import streamlit as st
+
+from freight import instrument
+
+# — Profiling —
+#
+# Streamlit side of freight.instrument: st.cache_data with hit/miss counts,
+# and the debug panel, shown only with FREIGHT_PROFILE on and ?debug=1 in
+# the URL.
+
+_missed = ContextVar('freight_cache_missed', default=False)
+
+
+def cache_data(**kwargs):
+    """st.cache_data that also times calls and counts hits and misses when profiling is on"""
+    def decorate(fn):
+        if not instrument.ENABLED:
+            return st.cache_data(**kwargs)(fn)
+        name = fn.__qualname__
+
+        # Only runs on a miss; wraps keeps the name, source and signature the cache keys on
+        @functools.wraps(fn)
+        def miss(*args, **kw):
+            _missed.set(True)
+            return fn(*args, **kw)
+
+        cached = st.cache_data(**kwargs)(miss)
+
+        @functools.wraps(fn)
+        def call(*args, **kw):
+            token = _missed.set(False)
+            try:
+                with instrument.span(f"cache.{name}"):
+                    return cached(*args, **kw)
+            finally:
+                instrument.REGISTRY.cache_call(name, hit=not _missed.get())
+                _missed.reset(token)
+
+        call.clear = cached.clear
+        return call
+
+    return decorate
+
+
+def debug_panel(spans):
+    """This rerun's spans and the process totals, for ?debug=1"""
+    if not instrument.ENABLED or st.query_params.get('debug') != '1':
+        return
+    totals = instrument.REGISTRY.snapshot()
+    with st.expander("🛠️ Debug: timings and caches"):
+        st.markdown("**This rerun**")
+        st.dataframe(
+            [{'span': name, 'start (ms)': round(offset * 1000, 1), 'duration (ms)': round(seconds * 1000, 1)}
+             for name, offset, seconds in sorted(spans, key=lambda s: s[1])],
+            hide_index=True,
+        )
+        st.markdown("**This process**")
+        st.dataframe(
+            [{'span': name, 'count': s['count'], 'total (ms)': round(s['seconds'] * 1000, 1),
+              'mean (ms)': round(s['seconds'] / s['count'] * 1000, 1), 'max (ms)': round(s['max_seconds'] * 1000, 1)}
+             for name, s in totals['spans'].items()],
+            hide_index=True,
+        )
+        if totals['caches']:
+            st.dataframe(
+                [{'function': name, 'hits': c['hits'], 'misses': c['misses']} for name, c in totals['caches'].items()],
+                hide_index=True,
+            )
+        st.caption(f"Totals are written every {instrument.DUMP_EVERY:g} s to {instrument.metrics_dir()}")